@@ -0,0 +1,77 @@
+# Cubo de agregados compartido por todas las secciones del dashboard.
+# Se construye una vez por versión de los datos sobre barrio x tipo de anfitrión x tipo de
+# habitación x estado de licencia, con conteos, sumas y sketches de cuantiles de las medidas.
+# Las secciones consultan el cubo (unas cientos de celdas) en lugar de recorrer el DataFrame.
+import numpy as np
+
+from sketches import tabla_sketches, cuantil_tabla
+from instrumentacion import medido
+
+DIMENSIONES = ['neighbourhood', 'tipo_anfitrion', 'room_type', 'sin_licencia', 'estado_licencia']
+MEDIDAS = ['price', 'rendimiento_economico_mensual']
+
+
+class CuboAgregados:
+    def __init__(self, celdas, sketches, dimensiones=DIMENSIONES):
+        self.dimensiones = dimensiones
+        self.celdas = celdas        # una fila por celda: dimensiones + n + suma_<medida>
+        self.sketches = sketches    # dimensiones + medida + clave + conteo
+
+    def _filtrar(self, tabla, filtros):
+        mascara = np.ones(len(tabla), dtype=bool)
+        for dim, valor in filtros.items():
+            if isinstance(valor, (list, tuple, set)):
+                mascara &= tabla[dim].isin(valor).to_numpy()
+            else:
+                mascara &= (tabla[dim] == valor).to_numpy()
+        return tabla[mascara]
+
+    @medido('cubo.total')
+    def total(self, **filtros):
+        return int(self._filtrar(self.celdas, filtros)['n'].sum())
+
+    @medido('cubo.conteo')
+    def conteo(self, por, **filtros):
+        return self._filtrar(self.celdas, filtros).groupby(por)['n'].sum()
+
+    @medido('cubo.suma')
+    def suma(self, medida, por, **filtros):
+        return self._filtrar(self.celdas, filtros).groupby(por)[f'suma_{medida}'].sum()
+
+    @medido('cubo.media')
+    def media(self, medida, por, **filtros):
+        grupos = self._filtrar(self.celdas, filtros).groupby(por)
+        return grupos[f'suma_{medida}'].sum() / grupos['n'].sum()
+
+    @medido('cubo.cruce')
+    def cruce(self, filas, columnas, **filtros):
+        # Equivalente a pd.crosstab(df[filas], df[columnas]) sobre las filas filtradas
+        return self.conteo([filas, columnas], **filtros).unstack(fill_value=0)
+
+    @medido('cubo.cuantil')
+    def cuantil(self, medida, q, por=None, **filtros):
+        return cuantil_tabla(self._filtrar(self.sketches, filtros), medida, q, por)
+
+
+def construir_cubo(df):
+    # estado_licencia solo existe en los datos generados con la validación contra el registro
+    dimensiones = [d for d in DIMENSIONES if d in df.columns or d == 'sin_licencia']
+    texto = [d for d in dimensiones if d != 'sin_licencia']
+
+    # Medidas en float64 para las sumas, aunque el frame compacto las guarde en float32
+    base = df[texto + MEDIDAS].astype({m: 'float64' for m in MEDIDAS})
+    base['sin_licencia'] = (df['license'] == 'sin datos').to_numpy()
+    # Dimensiones como texto: las tablas resultantes no arrastran categorías vacías
+    for dim in texto:
+        base[dim] = base[dim].astype(str)
+
+    grupos = base.groupby(dimensiones, sort=False)
+    celdas = grupos.size().rename('n').to_frame()
+    for medida in MEDIDAS:
+        celdas[f'suma_{medida}'] = grupos[medida].sum()
+    celdas = celdas.reset_index()
+
+    # Sketches con las medidas nulas en 0
+    sketches = tabla_sketches(base.fillna({m: 0 for m in MEDIDAS}), dimensiones, MEDIDAS)
+
+    return CuboAgregados(celdas, sketches, dimensiones)
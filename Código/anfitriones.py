@@ -0,0 +1,26 @@
+# Clasificación de anfitriones en 'empresa' / 'particular' a partir de host_name.
+# Se trabaja solo sobre los nombres únicos con un único patrón compilado que combina
+# todas las palabras clave, y el resultado se reparte a todas las filas por código.
+import re
+
+import numpy as np
+import pandas as pd
+
+from config import PALABRAS_EMPRESA
+
+
+def compilar_patron(palabras=PALABRAS_EMPRESA):
+    # Una sola alternancia: una pasada por nombre en lugar de una búsqueda por palabra
+    return re.compile('|'.join(re.escape(p.lower()) for p in palabras))
+
+
+def clasificar_anfitriones(host_name, palabras=PALABRAS_EMPRESA):
+    codigos, nombres = pd.factorize(host_name)
+    es_empresa = pd.Series(nombres).str.lower().str.contains(compilar_patron(palabras), regex=True).to_numpy(bool)
+    etiquetas = np.where(es_empresa, 'empresa', 'particular').astype(object)
+
+    # Los nulos (código -1) se clasifican como 'desconocido'
+    tipo = np.full(len(codigos), 'desconocido', dtype=object)
+    conocidos = codigos >= 0
+    tipo[conocidos] = etiquetas[codigos[conocidos]]
+    return pd.Series(tipo, index=host_name.index, name='tipo_anfitrion')
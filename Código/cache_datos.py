@@ -0,0 +1,141 @@
+# Caché columnar (Arrow IPC) de los CSV de datos.
+# Cada CSV se parsea una sola vez con un esquema explícito; la copia en disco se lee
+# con memory-map en los arranques siguientes y solo se regenera si cambia el hash del CSV.
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from config import DIR_CACHE
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # sin pyarrow se lee el CSV directamente, sin caché
+    pa = None
+
+
+# Esquemas explícitos de cada fichero: tipos por columna y columnas de fecha
+# (el registro oficial tiene su propio lector en registro.py)
+ESQUEMA_LIMPIO = {
+    'tipos': {
+        'id': 'int64',
+        'name': 'string',
+        'host_id': 'int64',
+        'host_name': 'string',
+        'neighbourhood_group': 'category',
+        'neighbourhood': 'category',
+        'latitude': 'float64',
+        'longitude': 'float64',
+        'room_type': 'category',
+        'price': 'float64',
+        'minimum_nights': 'int32',
+        'number_of_reviews': 'int32',
+        'reviews_per_month': 'float64',
+        'calculated_host_listings_count': 'int32',
+        'availability_365': 'int16',
+        'number_of_reviews_ltm': 'int32',
+        'license': 'category',
+        'has_reviews': 'int8',
+        'tipo_anfitrion': 'category',
+        'distancia_centro_km': 'float64',
+        'categoria_distancia_centro': 'category',
+        'categoria_precio': 'category',
+        'reviews_norm': 'float64',
+        'rating_norm': 'float64',
+        'indice_popularidad': 'float64',
+        'rendimiento_economico_mensual': 'float64',
+        'estado_licencia': 'category',
+    },
+    'fechas': ['last_review'],
+}
+
+ESQUEMA_PRECIOS = {
+    'tipos': {
+        'Year': 'int16',
+        'Avg_Purchase_Price_EUR_m2': 'float64',
+        'Avg_Rental_Price_EUR_month': 'float64',
+    },
+    'fechas': [],
+}
+
+
+def hash_archivo(ruta, bloque=1 << 20):
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for trozo in iter(lambda: f.read(bloque), b''):
+            h.update(trozo)
+    return h.hexdigest()
+
+
+def huella_archivos(*rutas):
+    # Huella barata (tamaño + fecha de modificación) para identificar la versión de los datos
+    h = hashlib.sha256()
+    for ruta in rutas:
+        estado = os.stat(ruta)
+        h.update(f"{ruta}:{estado.st_size}:{estado.st_mtime_ns};".encode())
+    return h.hexdigest()[:12]
+
+
+def leer_csv_tipado(ruta, esquema):
+    # Leemos solo con los tipos de las columnas presentes en el fichero
+    columnas = pd.read_csv(ruta, nrows=0).columns
+    tipos = {c: t for c, t in esquema['tipos'].items() if c in columnas}
+    fechas = [c for c in esquema['fechas'] if c in columnas]
+    return pd.read_csv(ruta, dtype=tipos, parse_dates=fechas)
+
+
+def _ruta_cache(ruta, huella):
+    return Path(DIR_CACHE) / f"{Path(ruta).stem}-{huella[:16]}.arrow"
+
+
+def escribir_arrow(df, destino):
+    tabla = pa.Table.from_pandas(df, preserve_index=False)
+    # Temporal único en el mismo directorio: varios procesos o sesiones pueden escribir el mismo
+    # fichero a la vez sin pisarse
+    with tempfile.NamedTemporaryFile(dir=destino.parent, prefix=f"{destino.stem}-", suffix='.tmp',
+                                     delete=False) as fichero:
+        temporal = Path(fichero.name)
+    try:
+        with pa.OSFile(str(temporal), 'wb') as sink:
+            with ipc.new_file(sink, tabla.schema) as writer:
+                writer.write_table(tabla)
+        # Renombrado atómico: un lector nunca ve un fichero a medio escribir
+        os.replace(temporal, destino)
+    finally:
+        temporal.unlink(missing_ok=True)
+
+
+def leer_arrow(origen):
+    with pa.memory_map(str(origen), 'r') as fuente:
+        tabla = ipc.open_file(fuente).read_all()
+    return tabla.to_pandas()
+
+
+def _limpiar_versiones(ruta, vigente):
+    for antiguo in Path(DIR_CACHE).glob(f"{Path(ruta).stem}-*.arrow"):
+        if antiguo != vigente:
+            antiguo.unlink(missing_ok=True)
+
+
+def cargar_en_cache(ruta, leer, etiqueta=''):
+    # leer(ruta) -> DataFrame; la etiqueta identifica el lector (esquema) dentro de la clave
+    if pa is None:
+        return leer(ruta)
+
+    huella = hashlib.sha256(f"{hash_archivo(ruta)}:{etiqueta}".encode()).hexdigest()
+    destino = _ruta_cache(ruta, huella)
+    if destino.exists():
+        return leer_arrow(destino)
+
+    df = leer(ruta)
+    Path(DIR_CACHE).mkdir(parents=True, exist_ok=True)
+    escribir_arrow(df, destino)
+    _limpiar_versiones(ruta, destino)
+    return leer_arrow(destino)
+
+
+def cargar_tabla(ruta, esquema):
+    return cargar_en_cache(ruta, lambda r: leer_csv_tipado(r, esquema), repr(esquema))
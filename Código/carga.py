@@ -0,0 +1,101 @@
+# Datos del dashboard bajo demanda.
+# Cada página declara en NECESITA los nombres que usa (tablas, cubo, índices, series) y solo
+# esos se construyen: las páginas de texto no tocan los datos. Las tablas y estructuras
+# derivadas se cargan perezosamente dentro de la versión compartida (DatosCompartidos).
+import streamlit as st
+
+from config import RUTA_LISTINGS, RUTA_LIMPIO, RUTA_REGISTRO, RUTA_PRECIOS, BACKEND_CONSULTAS
+from cache_datos import cargar_tabla, huella_archivos, ESQUEMA_PRECIOS
+from compactacion import cargar_compacto
+from registro import cargar_registro
+from preprocesamiento import actualizar_limpio
+from agregados import construir_cubo
+from mapa import construir_niveles
+from espacial import IndiceEspacial
+from snapshots import AlmacenSnapshots
+from compartido import DatosCompartidos
+from recarga import GestorDatos
+from instrumentacion import tramo
+from figuras import fijar_version
+
+TABLAS = ['df', 'df2', 'df3']
+
+
+def _cubo(datos):
+    if BACKEND_CONSULTAS == 'pandas':
+        return construir_cubo(datos.vista('df'))
+    # SQL backend: parameterised queries over an on-disk copy, without loading the frame
+    from consultas_sql import abrir_cubo_sql
+
+    return abrir_cubo_sql(RUTA_LIMPIO, BACKEND_CONSULTAS)
+
+
+def _indice_espacial(datos):
+    df = datos.vista('df')
+    return IndiceEspacial(df['latitude'], df['longitude'])
+
+
+CARGADORES = {
+    # Columnar cache on disk (Arrow IPC), rebuilt only when the source CSV changes; the
+    # listings frame is kept compact (categoricals, float32, no intermediate columns)
+    'df': lambda datos: cargar_compacto(RUTA_LIMPIO),
+    'df2': lambda datos: cargar_registro(RUTA_REGISTRO),
+    'df3': lambda datos: cargar_tabla(RUTA_PRECIOS, ESQUEMA_PRECIOS),
+    # Aggregate cube shared by every section (pandas or SQL backend, see config.BACKEND_CONSULTAS)
+    'cubo': _cubo,
+    # Precomputed map grids for the level-of-detail view
+    'niveles_mapa': lambda datos: construir_niveles(datos.vista('df')),
+    # Spatial index over listing coordinates for radius / viewport queries
+    'indice_espacial': _indice_espacial,
+}
+
+
+def cargar_version(version):
+    return DatosCompartidos(version, cargadores=CARGADORES)
+
+
+# One read-only copy of the current data version per process, shared by every session.
+# When a source file changes the new version is loaded in the background and swapped in
+# atomically; sessions keep getting shallow views of the previous one until then.
+@st.cache_resource
+def gestor_datos():
+    return GestorDatos(
+        preparar=actualizar_limpio,
+        cargar=cargar_version,
+        fuentes=[RUTA_LISTINGS, RUTA_LIMPIO, RUTA_REGISTRO, RUTA_PRECIOS],
+    )
+
+
+# Precomputed listing-count series from the snapshot store (empty until snapshots are ingested)
+@st.cache_data(max_entries=2)
+def cargar_series_snapshots(version_almacen):
+    almacen = AlmacenSnapshots()
+    return almacen.serie_periodica('anual'), almacen.cuota_recientes(24)
+
+
+def version_almacen():
+    almacen = AlmacenSnapshots()
+    return huella_archivos(almacen.ruta_serie) if almacen.ruta_serie.exists() else None
+
+
+def obtener(nombres):
+    # nombre -> objeto, solo para los nombres pedidos
+    resultado = {}
+    fijar_version(None)  # figures are not cached if loading fails
+    # Version of what this rerun is served, for the figure cache keys
+    version = {'backend': BACKEND_CONSULTAS}
+    if {'snapshot_series', 'recent_share'} & set(nombres):
+        version['snapshots'] = version_almacen()
+        with tramo('datos.snapshots'):
+            resultado['snapshot_series'], resultado['recent_share'] = cargar_series_snapshots(version['snapshots'])
+    pendientes = [n for n in nombres if n in CARGADORES]
+    if pendientes:
+        datos = gestor_datos().actual()
+        version['datos'] = datos.version
+        for nombre in pendientes:
+            with tramo(f"datos.{nombre}", cargado=nombre in datos.cargados()) as t:
+                resultado[nombre] = datos.vista(nombre) if nombre in TABLAS else datos.recurso(nombre)
+                if nombre in TABLAS:
+                    t.anotar(filas=len(resultado[nombre]))
+    fijar_version(version)
+    return {n: resultado[n] for n in nombres}
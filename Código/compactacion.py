@@ -0,0 +1,69 @@
+# Representación compacta en memoria del frame de alojamientos limpio.
+# Las columnas de texto repetido pasan a categóricas (un código entero por fila: filtros como
+# df['license'] == 'sin datos' comparan códigos, no cadenas), coordenadas y métricas a float32
+# (~0,5 m de resolución a la latitud de Barcelona), los enteros al tipo más pequeño que admite
+# su rango y se descartan las columnas intermedias del cálculo de popularidad.
+# Las agregaciones (cubo, rejillas del mapa) acumulan en float64 aunque el frame sea float32.
+#
+#   python Código/compactacion.py    informe de memoria por columna antes/después
+import sys
+
+import pandas as pd
+
+from config import RUTA_LIMPIO
+from cache_datos import cargar_en_cache, leer_csv_tipado, ESQUEMA_LIMPIO
+
+COLUMNAS_INTERMEDIAS = ['reviews_norm', 'rating_norm']
+CATEGORICAS = [
+    'neighbourhood_group', 'neighbourhood', 'room_type', 'license', 'host_name', 'tipo_anfitrion',
+    'categoria_distancia_centro', 'categoria_precio', 'estado_licencia',
+]
+FLOTANTES = [
+    'latitude', 'longitude', 'price', 'reviews_per_month', 'distancia_centro_km',
+    'indice_popularidad', 'rendimiento_economico_mensual',
+]
+
+
+def compactar(df):
+    df = df.drop(columns=[c for c in COLUMNAS_INTERMEDIAS if c in df.columns])
+    for col in df.columns:
+        if col in CATEGORICAS:
+            df[col] = df[col].astype('category')
+        elif col in FLOTANTES:
+            df[col] = df[col].astype('float32')
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def cargar_compacto(ruta=RUTA_LIMPIO, esquema=ESQUEMA_LIMPIO):
+    # La caché Arrow guarda ya la versión compacta (diccionarios y float32 sobreviven la ida y vuelta)
+    return cargar_en_cache(ruta, lambda r: compactar(leer_csv_tipado(r, esquema)), f"compacto:{esquema!r}")
+
+
+def informe_memoria(antes, despues):
+    # Bytes por columna (deep) y tipos antes/después; la última fila es el total
+    bytes_antes = antes.memory_usage(deep=True, index=False)
+    bytes_despues = despues.memory_usage(deep=True, index=False)
+    informe = pd.DataFrame({
+        'tipo_antes': antes.dtypes.astype(str),
+        'tipo_despues': despues.dtypes.astype(str).reindex(antes.columns, fill_value='(eliminada)'),
+        'mb_antes': bytes_antes / 2**20,
+        'mb_despues': bytes_despues.reindex(antes.columns, fill_value=0) / 2**20,
+    })
+    informe.loc['TOTAL'] = ['', '', informe['mb_antes'].sum(), informe['mb_despues'].sum()]
+    informe['reduccion'] = 1 - informe['mb_despues'] / informe['mb_antes']
+    return informe
+
+
+def main():
+    ruta = sys.argv[1] if len(sys.argv) > 1 else RUTA_LIMPIO
+    # Punto de partida: lectura sin esquema (texto como object/str y todo en 64 bits)
+    antes = pd.read_csv(ruta)
+    despues = compactar(leer_csv_tipado(ruta, ESQUEMA_LIMPIO))
+    with pd.option_context('display.float_format', '{:.3f}'.format, 'display.width', 120):
+        print(informe_memoria(antes, despues).sort_values('mb_antes', ascending=False).to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# Conjunto de datos compartido por todas las sesiones de Streamlit de un proceso.
+# Se guarda una sola copia (st.cache_resource, sin serializar ni copiar por llamada) y cada
+# sesión recibe vistas superficiales: con copy-on-write, cualquier modificación de una vista
+# copia solo la columna afectada y nunca alcanza los datos compartidos.
+import threading
+
+import numpy as np
+import pandas as pd
+
+# NumpyExtensionArray desde pandas 2.1 (antes PandasArray)
+_ARRAY_NUMPY = getattr(pd.arrays, 'NumpyExtensionArray', getattr(pd.arrays, 'PandasArray', None))
+
+
+def activar_copy_on_write():
+    # En pandas 3 es el comportamiento por defecto; en pandas 2.x hay que activarlo
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+
+def _buffers(valores):
+    # Arrays NumPy en los que se guardan los valores de una columna
+    if isinstance(valores, np.ndarray):
+        return [valores]
+    if isinstance(valores, _ARRAY_NUMPY):
+        return [valores.to_numpy()]
+    # Categóricas (códigos), fechas y texto con almacenamiento Python guardan un ndarray;
+    # los enteros/booleanos con nulos (Int64, boolean...), datos y máscara. Los arrays
+    # Arrow (texto de pandas 3) ya son inmutables
+    buffers = [getattr(valores, atributo, None) for atributo in ('_ndarray', '_data', '_mask')]
+    return [b for b in buffers if isinstance(b, np.ndarray)]
+
+
+def _congelar(df):
+    # Marca como solo lectura los arrays de cada columna (numéricas, categóricas, texto, objetos):
+    # una escritura directa sobre .to_numpy()/.values/.array de los datos compartidos lanza
+    # ValueError en lugar de corromperlos
+    for col in df.columns:
+        for buffer in _buffers(df[col].array):
+            buffer.flags.writeable = False
+    return df
+
+
+def _congelar_recurso(objeto):
+    # Estructuras derivadas (cubo, niveles del mapa, índice espacial): tablas, series y arrays de
+    # solo lectura, también dentro de diccionarios y en los atributos del objeto
+    if isinstance(objeto, pd.DataFrame):
+        return _congelar(objeto)
+    if isinstance(objeto, pd.Series):
+        for buffer in _buffers(objeto.array):
+            buffer.flags.writeable = False
+    elif isinstance(objeto, np.ndarray):
+        objeto.flags.writeable = False
+    elif isinstance(objeto, dict):
+        for valor in objeto.values():
+            _congelar_recurso(valor)
+    elif hasattr(objeto, '__dict__') and not isinstance(objeto, type):
+        for valor in vars(objeto).values():
+            if isinstance(valor, (pd.DataFrame, pd.Series, np.ndarray, dict)):
+                _congelar_recurso(valor)
+    return objeto
+
+
+class DatosCompartidos:
+    def __init__(self, version=None, cargadores=None, **tablas):
+        activar_copy_on_write()
+        self.version = version
+        # nombre -> función(datos) que construye la tabla o estructura derivada la primera vez
+        # que se pide: cada página solo paga por lo que usa
+        self._cargadores = cargadores or {}
+        self._objetos = {nombre: _congelar(df) for nombre, df in tablas.items()}
+        self._cerrojo = threading.RLock()  # reentrante: un cargador puede pedir otros objetos
+
+    def _obtener(self, nombre):
+        with self._cerrojo:
+            if nombre not in self._objetos:
+                self._objetos[nombre] = _congelar_recurso(self._cargadores[nombre](self))
+            return self._objetos[nombre]
+
+    def vista(self, nombre):
+        # Copia superficial: comparte los buffers, no copia datos
+        return self._obtener(nombre).copy(deep=False)
+
+    def vistas(self, *nombres):
+        return tuple(self.vista(n) for n in nombres)
+
+    def recurso(self, nombre):
+        # Estructuras derivadas (cubo, índices...): se comparten tal cual, con sus tablas y arrays
+        # de solo lectura
+        return self._obtener(nombre)
+
+    def cargados(self):
+        return list(self._objetos)
+
+    def calentar(self, nombres):
+        for nombre in nombres:
+            if nombre in self._cargadores:
+                self._obtener(nombre)
+
+    def memoria(self):
+        return {nombre: int(df.memory_usage(deep=True).sum())
+                for nombre, df in self._objetos.items() if isinstance(df, pd.DataFrame)}
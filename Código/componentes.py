@@ -0,0 +1,133 @@
+# Piezas de interfaz compartidas por las páginas del dashboard
+import streamlit as st
+
+from instrumentacion import ACTIVA, tramo
+
+# Custom CSS
+ESTILOS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #1E3A8A;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.8rem;
+        color: #2563EB;
+        margin-top: 2rem;
+        margin-bottom: 1rem;
+    }
+    .section-header {
+        font-size: 1.5rem;
+        color: #3B82F6;
+        margin-top: 1.5rem;
+        margin-bottom: 0.8rem;
+    }
+    .subsection-header {
+        font-size: 1.2rem;
+        color: #60A5FA;
+        margin-top: 1.2rem;
+        margin-bottom: 0.5rem;
+    }
+    .highlight {
+        background-color: #EFF6FF;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 0.5rem solid #3B82F6;
+        margin-bottom: 1rem;
+    }
+    .warning {
+        background-color: #FEF2F2;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 0.5rem solid #EF4444;
+        margin-bottom: 1rem;
+    }
+    .info {
+        background-color: #ECFDF5;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 0.5rem solid #10B981;
+        margin-bottom: 1rem;
+    }
+    .metric-container {
+        background-color: #F3F4F6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+        text-align: center;
+    }
+    .metric-value {
+        font-size: 2rem;
+        font-weight: bold;
+        color: #1E3A8A;
+    }
+    .metric-label {
+        font-size: 1rem;
+        color: #4B5563;
+    }
+    .footer {
+        text-align: center;
+        margin-top: 3rem;
+        padding-top: 1rem;
+        border-top: 1px solid #E5E7EB;
+        color: #6B7280;
+        font-size: 0.8rem;
+    }
+</style>
+"""
+
+
+def aplicar_estilos():
+    st.markdown(ESTILOS, unsafe_allow_html=True)
+
+
+# Function to create sections
+def create_section(title, content):
+    st.markdown(f'<div class="section-header">{title}</div>', unsafe_allow_html=True)
+    st.markdown(content)
+
+
+# Function to create metrics
+def create_metric_row(metrics_data):
+    cols = st.columns(len(metrics_data))
+    for i, (title, value, description) in enumerate(metrics_data):
+        with cols[i]:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-value">{value}</div>
+                <div class="metric-label">{title}</div>
+                <div>{description}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+# st.plotly_chart inside an instrumentation span (serialization + send); the spec size is only
+# computed when instrumentation is enabled, since it serializes the figure a second time
+def plotly_chart(fig, **kwargs):
+    # Compact payload (typed arrays, deduplicated hover fields); cached figures already are
+    from empaquetado import compactar
+
+    fig = compactar(fig)
+    if not ACTIVA:
+        return st.plotly_chart(fig, **kwargs)
+    trazas = sorted({traza.type for traza in fig.data})
+    with tramo('plotly_chart', bytes=len(fig.to_json()), trazas='+'.join(trazas)):
+        return st.plotly_chart(fig, **kwargs)
+
+
+# Debug panel with the spans of the last rerun (only shown with AIRBNB_INSTRUMENTACION=1)
+def panel_depuracion(tramos):
+    with st.sidebar.expander("🛠️ Depuración"):
+        st.dataframe([
+            {
+                'tramo': '\u00a0\u00a0' * t['nivel'] + t['nombre'],
+                'ms': t['ms'],
+                'filas': t.get('filas'),
+                'bytes': t.get('bytes'),
+                'ahorro %': round(t['ahorro'] * 100, 1) if 'ahorro' in t else None,
+                'Δ RSS (KB)': t['rss_delta'] // 1024 if t['rss_delta'] is not None else None,
+            }
+            for t in tramos
+        ], hide_index=True)
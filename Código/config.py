@@ -0,0 +1,35 @@
+# Rutas del proyecto, relativas a la raíz del repositorio (no al directorio de trabajo)
+import os
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+DIR_DATOS = RAIZ / 'data'
+DIR_CACHE = DIR_DATOS / '.cache'
+
+RUTA_LISTINGS = DIR_DATOS / 'listings.csv'
+RUTA_LIMPIO = DIR_DATOS / 'limpio_airbnb_Barcelona.csv'
+RUTA_REGISTRO = DIR_DATOS / 'datos vivienda turistica bcn oficiales.csv'
+RUTA_PRECIOS = DIR_DATOS / 'housing_prices_barcelona_2015_2025.csv'
+
+# Palabras que identifican a un anfitrión como empresa (se buscan en host_name en minúsculas)
+PALABRAS_EMPRESA = ['company', 'empresa', 'rentals', 'apartments', 'group', 'management', 'hostel', 'hotel']
+
+# Parámetros de la limpieza (preprocesamiento.py); los valores ajustados se guardan con el CSV limpio
+# Pesos del índice de popularidad sobre cada columna normalizada a 0-1
+PESOS_POPULARIDAD = {'number_of_reviews': 0.7, 'reviews_per_month': 0.3}
+# Cuantiles de corte de las categorías de distancia al centro y de precio
+CUANTILES_TERCILES = [1 / 3, 2 / 3]
+
+# Instrumentación del camino caliente (instrumentacion.py): AIRBNB_INSTRUMENTACION=1 al arrancar
+INSTRUMENTACION = os.environ.get('AIRBNB_INSTRUMENTACION', '') not in ('', '0')
+RUTA_LOG_TRAMOS = DIR_DATOS / 'logs' / 'tramos.jsonl'
+
+# Backend de las agregaciones de las secciones: 'pandas' (cubo en memoria) o SQL embebido
+# fuera de memoria, 'duckdb' o 'sqlite' (consultas_sql.py)
+BACKEND_CONSULTAS = os.environ.get('AIRBNB_BACKEND', 'pandas')
+
+# Caché de figuras Plotly compartida entre sesiones (figuras.py): límite de la memoria en MB y
+# nivel opcional en disco que sobrevive a los reinicios (AIRBNB_CACHE_FIGURAS_DISCO=1)
+CACHE_FIGURAS_MB = int(os.environ.get('AIRBNB_CACHE_FIGURAS_MB', '64'))
+CACHE_FIGURAS_DISCO = os.environ.get('AIRBNB_CACHE_FIGURAS_DISCO', '') not in ('', '0')
+CACHE_FIGURAS_DISCO_MB = 256
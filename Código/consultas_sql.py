@@ -0,0 +1,248 @@
+# Backend SQL embebido para las agregaciones del dashboard (AIRBNB_BACKEND=duckdb|sqlite).
+# Expone la misma interfaz que CuboAgregados (total, conteo, suma, media, cruce, cuantil), pero
+# cada consulta es SQL parametrizado sobre una copia en disco de las columnas que usan las
+# secciones, sin cargar el DataFrame en memoria:
+#   duckdb  Parquet escrito por DuckDB directamente desde el CSV; las consultas leen el Parquet
+#           por columnas y, si superan el límite de memoria, vuelcan a disco (temp_directory)
+#   sqlite  base de datos en disco cargada por trozos (solo biblioteca estándar)
+# Las copias se identifican por el hash del CSV, como la caché Arrow, y se regeneran al cambiar.
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+
+from config import DIR_CACHE, RUTA_LIMPIO
+from cache_datos import hash_archivo
+from agregados import DIMENSIONES, MEDIDAS
+from instrumentacion import medido
+
+try:
+    import duckdb
+except ImportError:  # backend opcional
+    duckdb = None
+
+DIR_SQL = Path(DIR_CACHE) / 'sql'
+MOTORES = ['duckdb', 'sqlite']
+LIMITE_MEMORIA_DUCKDB = '1GB'
+TAMANO_TROZO_SQLITE = 200_000
+TABLA = 'listings'
+
+
+def _literal(texto):
+    return "'" + str(texto).replace("'", "''") + "'"
+
+
+def _identificador(nombre):
+    return '"' + nombre.replace('"', '""') + '"'
+
+
+def _valor(valor):
+    # Escalares numpy -> Python para los parámetros del driver
+    return valor.item() if hasattr(valor, 'item') else valor
+
+
+def _columnas_origen(ruta):
+    # estado_licencia solo existe en los datos generados con la validación contra el registro
+    cabecera = pd.read_csv(ruta, nrows=0).columns
+    dimensiones = [d for d in DIMENSIONES if d in cabecera]
+    return dimensiones + ['license'] + MEDIDAS
+
+
+def _ruta_copia(ruta, motor):
+    extension = 'parquet' if motor == 'duckdb' else 'sqlite'
+    return DIR_SQL / f"{Path(ruta).stem}-{hash_archivo(ruta)[:16]}.{extension}"
+
+
+def _limpiar_versiones(ruta, vigente):
+    for antiguo in DIR_SQL.glob(f"{Path(ruta).stem}-*{vigente.suffix}"):
+        if antiguo != vigente:
+            antiguo.unlink(missing_ok=True)
+
+
+class CuboSQL(ABC):
+    # Cada motor implementa la ejecución de las consultas y el SQL de los cuantiles
+    def __init__(self, dimensiones):
+        self.dimensiones = dimensiones
+
+    @abstractmethod
+    def _consultar(self, sql, parametros):
+        # sql con parámetros '?' -> DataFrame con el resultado
+        ...
+
+    @abstractmethod
+    def _sql_cuantil(self, columna, q, donde, grupo):
+        # Consulta con el cuantil q de columna en 'q' (por grupo si grupo no es None)
+        ...
+
+    def _columna(self, nombre, validas):
+        if nombre not in validas:
+            raise ValueError(f"Columna desconocida: {nombre}")
+        return _identificador(nombre)
+
+    def _donde(self, filtros):
+        condiciones, parametros = [], []
+        for dim, valor in filtros.items():
+            columna = self._columna(dim, self.dimensiones)
+            if isinstance(valor, (list, tuple, set)):
+                valores = [_valor(v) for v in valor]
+                condiciones.append(f"{columna} IN ({', '.join('?' * len(valores))})")
+                parametros.extend(valores)
+            else:
+                condiciones.append(f"{columna} = ?")
+                parametros.append(_valor(valor))
+        return (' WHERE ' + ' AND '.join(condiciones) if condiciones else ''), parametros
+
+    def _agrupar(self, expresion, nombre, por, filtros):
+        por = [por] if isinstance(por, str) else list(por)
+        columnas = ', '.join(self._columna(p, self.dimensiones) for p in por)
+        donde, parametros = self._donde(filtros)
+        tabla = self._consultar(
+            f"SELECT {columnas}, {expresion} AS {nombre} FROM {TABLA}{donde} "
+            f"GROUP BY {columnas} ORDER BY {columnas}",
+            parametros,
+        )
+        if 'sin_licencia' in por:  # SQLite devuelve los booleanos como 0/1
+            tabla['sin_licencia'] = tabla['sin_licencia'].astype(bool)
+        return tabla.set_index(por if len(por) > 1 else por[0])[nombre]
+
+    @medido('sql.total')
+    def total(self, **filtros):
+        donde, parametros = self._donde(filtros)
+        return int(self._consultar(f"SELECT COUNT(*) AS n FROM {TABLA}{donde}", parametros)['n'].iloc[0])
+
+    @medido('sql.conteo')
+    def conteo(self, por, **filtros):
+        return self._agrupar('COUNT(*)', 'n', por, filtros)
+
+    @medido('sql.suma')
+    def suma(self, medida, por, **filtros):
+        columna = self._columna(medida, MEDIDAS)
+        return self._agrupar(f"SUM({columna})", f"suma_{medida}", por, filtros)
+
+    @medido('sql.media')
+    def media(self, medida, por, **filtros):
+        # Suma / filas, como el cubo
+        columna = self._columna(medida, MEDIDAS)
+        return self._agrupar(f"SUM({columna}) * 1.0 / COUNT(*)", 'media', por, filtros).rename(None)
+
+    @medido('sql.cruce')
+    def cruce(self, filas, columnas, **filtros):
+        return self.conteo([filas, columnas], **filtros).unstack(fill_value=0)
+
+    @medido('sql.cuantil')
+    def cuantil(self, medida, q, por=None, **filtros):
+        # q va como literal (float validado): DuckDB exige una constante en quantile_cont
+        columna = self._columna(medida, MEDIDAS)
+        grupo = self._columna(por, self.dimensiones) if por is not None else None
+        donde, parametros = self._donde(filtros)
+        tabla = self._consultar(self._sql_cuantil(columna, float(q), donde, grupo), parametros)
+        if por is None:
+            return float(tabla['q'].iloc[0])
+        return tabla.set_index(por)['q']
+
+
+class CuboDuckDB(CuboSQL):
+    def __init__(self, ruta_parquet, dimensiones):
+        super().__init__(dimensiones)
+        self.ruta = ruta_parquet
+        self.conexion = duckdb.connect()
+        self.conexion.execute(f"SET memory_limit = {_literal(LIMITE_MEMORIA_DUCKDB)}")
+        self.conexion.execute(f"SET temp_directory = {_literal(DIR_SQL / 'temporal')}")
+        self.conexion.execute(
+            f"CREATE VIEW {TABLA} AS SELECT *, license = 'sin datos' AS sin_licencia "
+            f"FROM read_parquet({_literal(ruta_parquet)})"
+        )
+
+    def _consultar(self, sql, parametros):
+        # Un cursor por consulta: la conexión se comparte entre los hilos de las sesiones
+        return self.conexion.cursor().execute(sql, parametros).df()
+
+    def _sql_cuantil(self, columna, q, donde, grupo):
+        if grupo is None:
+            return f"SELECT quantile_cont({columna}, {q}) AS q FROM {TABLA}{donde}"
+        return (f"SELECT {grupo}, quantile_cont({columna}, {q}) AS q FROM {TABLA}{donde} "
+                f"GROUP BY {grupo} ORDER BY {grupo}")
+
+
+class CuboSQLite(CuboSQL):
+    def __init__(self, ruta_bd, dimensiones):
+        super().__init__(dimensiones)
+        self.ruta = ruta_bd
+        self.conexion = sqlite3.connect(f"file:{ruta_bd}?mode=ro", uri=True, check_same_thread=False)
+        self._cerrojo = threading.Lock()
+
+    def _consultar(self, sql, parametros):
+        with self._cerrojo:
+            return pd.read_sql_query(sql, self.conexion, params=parametros)
+
+    def _sql_cuantil(self, columna, q, donde, grupo):
+        # Sin función de cuantiles en SQLite: rango más cercano con CUME_DIST
+        seleccion = f"{grupo}, " if grupo else ''
+        particion = f"PARTITION BY {grupo} " if grupo else ''
+        agrupacion = f" GROUP BY {grupo} ORDER BY {grupo}" if grupo else ''
+        no_nulos = f"{' AND' if donde else ' WHERE'} {columna} IS NOT NULL"
+        return (
+            f"SELECT {seleccion}MIN(valor) AS q FROM ("
+            f"SELECT {seleccion}{columna} AS valor, CUME_DIST() OVER ({particion}ORDER BY {columna}) AS p "
+            f"FROM {TABLA}{donde}{no_nulos}) WHERE p >= {q}{agrupacion}"
+        )
+
+
+# PREPARACIÓN DE LAS COPIAS EN DISCO
+
+def preparar_duckdb(ruta, destino):
+    columnas = ', '.join(_identificador(c) for c in _columnas_origen(ruta))
+    temporal = destino.with_suffix('.tmp')
+    conexion = duckdb.connect()
+    conexion.execute(f"SET memory_limit = {_literal(LIMITE_MEMORIA_DUCKDB)}")
+    conexion.execute(f"SET temp_directory = {_literal(DIR_SQL / 'temporal')}")
+    conexion.execute(
+        f"COPY (SELECT {columnas} FROM read_csv({_literal(ruta)}, header = true)) "
+        f"TO {_literal(temporal)} (FORMAT parquet)"
+    )
+    conexion.close()
+    os.replace(temporal, destino)
+
+
+def preparar_sqlite(ruta, destino):
+    temporal = destino.with_suffix('.tmp')
+    temporal.unlink(missing_ok=True)
+    columnas = _columnas_origen(ruta)
+    with sqlite3.connect(temporal) as conexion:
+        for trozo in pd.read_csv(ruta, usecols=columnas, chunksize=TAMANO_TROZO_SQLITE):
+            trozo.to_sql(f"{TABLA}_base", conexion, if_exists='append', index=False)
+        conexion.execute(
+            f"CREATE VIEW {TABLA} AS SELECT *, license = 'sin datos' AS sin_licencia FROM {TABLA}_base"
+        )
+    conexion.close()
+    os.replace(temporal, destino)
+
+
+PREPARAR = {'duckdb': preparar_duckdb, 'sqlite': preparar_sqlite}
+CUBOS = {'duckdb': CuboDuckDB, 'sqlite': CuboSQLite}
+
+
+def motores_disponibles():
+    return [m for m in MOTORES if m != 'duckdb' or duckdb is not None]
+
+
+def dimensiones_origen(ruta):
+    columnas = _columnas_origen(ruta)
+    return [d for d in DIMENSIONES if d in columnas or d == 'sin_licencia']
+
+
+def abrir_cubo_sql(ruta=RUTA_LIMPIO, motor='duckdb'):
+    if motor not in MOTORES:
+        raise ValueError(f"Backend SQL desconocido: {motor} (opciones: {', '.join(MOTORES)})")
+    if motor not in motores_disponibles():
+        raise ImportError("El backend 'duckdb' necesita el paquete duckdb: pip install duckdb")
+
+    destino = _ruta_copia(ruta, motor)
+    if not destino.exists():
+        DIR_SQL.mkdir(parents=True, exist_ok=True)
+        PREPARAR[motor](ruta, destino)
+        _limpiar_versiones(ruta, destino)
+    return CUBOS[motor](destino, dimensiones_origen(ruta))
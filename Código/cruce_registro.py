@@ -0,0 +1,97 @@
+# Cruce geoespacial entre el registro oficial de viviendas turísticas y los anuncios.
+# Cada anuncio (coordenadas con ruido de InsideAirbnb) se empareja con las viviendas
+# registradas más cercanas dentro de un radio, indicando distancia, si coincide el barrio
+# y si coincide el número de licencia.
+#
+#   python Código/cruce_registro.py [--radio 100] [--k 3] [--salida data/cruce_registro.csv]
+import argparse
+import time
+import unicodedata
+
+import pandas as pd
+
+from config import RUTA_LIMPIO, RUTA_REGISTRO, DIR_DATOS
+from cache_datos import cargar_tabla, ESQUEMA_LIMPIO
+from registro import cargar_registro
+from espacial import IndiceEspacial
+from licencias import extraer_numeros
+
+# InsideAirbnb desplaza las coordenadas hasta ~150 m
+RADIO_M = 150
+MAX_CANDIDATOS = 3
+
+
+def normalizar_barrio(nombres):
+    # Minúsculas y sin acentos: "la Sagrada Família" == "LA SAGRADA FAMILIA"
+    nombres = nombres.astype('string').fillna('')
+    unicos = pd.unique(nombres)
+    limpios = [unicodedata.normalize('NFKD', n).encode('ascii', 'ignore').decode().lower().strip() for n in unicos]
+    return nombres.map(dict(zip(unicos, limpios)))
+
+
+def _numero_licencia(licencias):
+    # Primer número HUTB normalizado de cada texto (o nulo)
+    numeros = extraer_numeros(licencias.reset_index(drop=True))
+    primero = numeros.groupby(level=0).first()
+    return primero.reindex(range(len(licencias))).to_numpy()
+
+
+def cruzar_registro(listings, registro, radio_m=RADIO_M, max_candidatos=MAX_CANDIDATOS):
+    registro = registro.dropna(subset=['LATITUD_Y', 'LONGITUD_X']).reset_index(drop=True)
+    indice = IndiceEspacial(registro['LATITUD_Y'], registro['LONGITUD_X'], tamano_celda=max(radio_m, 50))
+    consulta, posicion, distancia = indice.en_radio_lote(listings['latitude'], listings['longitude'], radio_m)
+
+    parejas = pd.DataFrame({'fila': consulta, 'registro': posicion, 'distancia_m': distancia})
+    parejas = parejas.sort_values(['fila', 'distancia_m'], kind='stable')
+    parejas['rango'] = parejas.groupby('fila').cumcount() + 1
+    parejas = parejas[parejas['rango'] <= max_candidatos].reset_index(drop=True)
+
+    barrio_listing = normalizar_barrio(listings['neighbourhood']).to_numpy()
+    barrio_registro = normalizar_barrio(registro['NOM_BARRI']).to_numpy()
+    licencia_listing = _numero_licencia(listings['license'])
+    licencia_registro = _numero_licencia(registro['NUMERO_REGISTRE_GENERALITAT'])
+
+    filas, regs = parejas['fila'].to_numpy(), parejas['registro'].to_numpy()
+    return pd.DataFrame({
+        'id': listings['id'].to_numpy()[filas],
+        'N_EXPEDIENT': registro['N_EXPEDIENT'].to_numpy()[regs],
+        'NUMERO_REGISTRE_GENERALITAT': registro['NUMERO_REGISTRE_GENERALITAT'].to_numpy()[regs],
+        'NUMERO_PLACES': registro['NUMERO_PLACES'].to_numpy()[regs],
+        'rango': parejas['rango'].to_numpy(),
+        'distancia_m': parejas['distancia_m'].round(1).to_numpy(),
+        'barrio_coincide': barrio_listing[filas] == barrio_registro[regs],
+        'licencia_coincide': pd.Series(licencia_listing[filas]).eq(licencia_registro[regs]).fillna(False).to_numpy(bool),
+    })
+
+
+def resumen_cruce(listings, cruce):
+    mejores = cruce[cruce['rango'] == 1]
+    return {
+        'alojamientos': len(listings),
+        'con_candidato': int(mejores['id'].nunique()),
+        'distancia_mediana_m': float(mejores['distancia_m'].median()) if len(mejores) else None,
+        'barrio_coincide_pct': float(mejores['barrio_coincide'].mean() * 100) if len(mejores) else None,
+        'licencia_coincide': int(cruce.loc[cruce['licencia_coincide'], 'id'].nunique()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cruce por proximidad entre anuncios y registro oficial")
+    parser.add_argument('--radio', type=float, default=RADIO_M, help="Radio de búsqueda en metros")
+    parser.add_argument('--k', type=int, default=MAX_CANDIDATOS, help="Candidatos máximos por anuncio")
+    parser.add_argument('--salida', default=DIR_DATOS / 'cruce_registro.csv')
+    args = parser.parse_args()
+
+    listings = cargar_tabla(RUTA_LIMPIO, ESQUEMA_LIMPIO)
+    registro = cargar_registro(RUTA_REGISTRO)
+
+    t = time.perf_counter()
+    cruce = cruzar_registro(listings, registro, args.radio, args.k)
+    print(f"{len(cruce):,} parejas en {time.perf_counter() - t:.2f}s")
+    for clave, valor in resumen_cruce(listings, cruce).items():
+        print(f"  {clave}: {valor}")
+    cruce.to_csv(args.salida, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+# Carga útil compacta de las figuras Plotly que se envían al navegador.
+# compactar(fig) devuelve una FiguraCompacta equivalente cuyo JSON (lo que serializa
+# st.plotly_chart) es mucho más pequeño en las figuras grandes:
+#   - los arrays numéricos de las trazas van como arrays tipados en base64 ({dtype, bdata},
+#     que plotly.js decodifica), con los flotantes en float32 (~0,5 m en las coordenadas) y los
+#     enteros en el tipo más pequeño que admite su rango
+#   - de customdata solo quedan las columnas que usa el hovertemplate (px incluye también las
+#     columnas con hover_data=False, como latitude/longitude)
+#   - los campos de texto del hover con pocos valores distintos (room_type...) no se repiten por
+#     punto: la traza se divide por esos valores y cada uno se escribe una vez en su hovertemplate
+# Las páginas dejan el formato de las etiquetas en texttemplate en lugar de listas de cadenas.
+# Con la instrumentación activa se anotan los bytes del JSON antes y después de cada figura.
+import base64
+import json
+import re
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from instrumentacion import ACTIVA, tramo
+
+MIN_ELEMENTOS = 16          # por debajo, la lista JSON no ocupa más que el array tipado
+MIN_PUNTOS_DIVISION = 500   # trazas más pequeñas no se dividen
+MAX_TRAZAS_DIVISION = 8     # trazas en que puede dividirse cada traza al deduplicar
+ARRAYS_DATOS = {'x', 'y', 'z', 'lat', 'lon', 'customdata', 'size', 'color', 'base', 'width', 'values'}
+TIPOS_BINARIOS = {
+    'int8': 'i1', 'uint8': 'u1', 'int16': 'i2', 'uint16': 'u2', 'int32': 'i4', 'uint32': 'u4',
+    'float32': 'f4', 'float64': 'f8',
+}
+_REFERENCIA = re.compile(r'%\{customdata\[(\d+)\]([^}]*)\}')
+
+
+# ARRAYS TIPADOS
+
+def _numerico(valores):
+    # Array numpy numérico (sin booleanos) o None
+    if isinstance(valores, (list, tuple)):
+        try:
+            valores = np.asarray(valores)
+        except ValueError:  # listas irregulares
+            return None
+    if not isinstance(valores, np.ndarray) or valores.dtype.kind not in 'iuf':
+        return None
+    return valores
+
+
+def _reducir(valores):
+    if valores.dtype.kind == 'f':
+        return valores.astype('float32')
+    minimo, maximo = (int(valores.min()), int(valores.max())) if valores.size else (0, 0)
+    for tipo in ['int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32']:
+        info = np.iinfo(tipo)
+        if info.min <= minimo and maximo <= info.max:
+            return valores.astype(tipo)
+    return valores.astype('float64')  # plotly.js no tiene enteros de 64 bits
+
+
+def _binario(valores):
+    valores = np.ascontiguousarray(_reducir(valores))
+    tipo = valores.dtype.newbyteorder('<')
+    codificado = {'dtype': TIPOS_BINARIOS[tipo.name],
+                  'bdata': base64.b64encode(valores.astype(tipo).tobytes()).decode('ascii')}
+    if valores.ndim > 1:
+        codificado['shape'] = ','.join(str(n) for n in valores.shape)
+    return codificado
+
+
+def _codificar(nodo):
+    for clave, valor in nodo.items():
+        if isinstance(valor, dict):
+            _codificar(valor)
+        elif clave in ARRAYS_DATOS and isinstance(valor, (list, tuple, np.ndarray)) and len(valor) >= MIN_ELEMENTOS:
+            numerico = _numerico(valor)
+            if numerico is not None and numerico.ndim <= 2:
+                nodo[clave] = _binario(numerico)
+    return nodo
+
+
+def _decodificar(nodo):
+    for clave, valor in nodo.items():
+        if isinstance(valor, dict) and 'bdata' in valor:
+            tipo = next(t for t, codigo in TIPOS_BINARIOS.items() if codigo == valor['dtype'])
+            array = np.frombuffer(base64.b64decode(valor['bdata']), dtype=np.dtype(tipo).newbyteorder('<'))
+            if 'shape' in valor:
+                array = array.reshape([int(n) for n in valor['shape'].split(',')])
+            nodo[clave] = array.astype(tipo)
+        elif isinstance(valor, dict):
+            _decodificar(valor)
+    return nodo
+
+
+class FiguraCompacta(go.Figure):
+    # Figura Plotly normal; solo cambia su serialización (to_dict/to_json, st.plotly_chart)
+    def to_dict(self):
+        datos = super().to_dict()
+        for traza in datos.get('data', []):
+            _codificar(traza)
+        return datos
+
+
+def figura_desde_json(texto):
+    # Inversa de FiguraCompacta.to_json (caché de figuras en disco)
+    datos = json.loads(texto)
+    for traza in datos.get('data', []):
+        _decodificar(traza)
+    return FiguraCompacta(datos)
+
+
+# CAMPOS DEL HOVER
+
+def _por_punto(traza, n):
+    # (diccionario, clave) de los arrays con un valor por punto
+    rutas = []
+    for nodo in [traza, traza.get('marker', {})]:
+        for clave, valor in nodo.items():
+            if isinstance(valor, (list, tuple, np.ndarray)) and len(valor) == n and clave != 'colorscale':
+                rutas.append((nodo, clave))
+    return rutas
+
+
+def _columnas_customdata(traza):
+    # Deja en customdata solo las columnas referenciadas, numéricas como float
+    plantilla = traza.get('hovertemplate')
+    customdata = traza.get('customdata')
+    if not isinstance(plantilla, str) or not isinstance(customdata, np.ndarray) or customdata.ndim != 2:
+        return None
+    usadas = sorted({int(m.group(1)) for m in _REFERENCIA.finditer(plantilla)})
+    return pd.DataFrame(customdata[:, usadas], columns=usadas)
+
+
+def _columna_hover(columna):
+    # Números al decimal más corto que los representa en float32: en un customdata mixto (texto
+    # y números) van como JSON y 1664.7 no se escribe como 1664.699951171875
+    if pd.api.types.infer_dtype(columna, skipna=True) not in ('floating', 'integer', 'mixed-integer-float'):
+        return columna.astype(object)  # texto (también el que parece un número, como una licencia)
+    return columna.astype('float32').astype(str).astype('float64')
+
+
+def _sustituir(plantilla, literales, posiciones):
+    # %{customdata[i]} -> literal si i se ha deduplicado, o su nueva posición en customdata
+    def reemplazo(m):
+        i = int(m.group(1))
+        if i in literales:
+            return str(literales[i])
+        return f"%{{customdata[{posiciones[i]}]{m.group(2)}}}"
+    return _REFERENCIA.sub(reemplazo, plantilla)
+
+
+def _deduplicar(traza):
+    columnas = _columnas_customdata(traza)
+    if columnas is None:
+        return [traza]
+    n = len(columnas)
+
+    # Columnas de texto con pocos valores: se escriben en el hovertemplate de cada subtraza
+    divisiones, trazas = [], 1
+    if n >= MIN_PUNTOS_DIVISION:
+        cardinalidades = {c: columnas[c].nunique() for c in columnas
+                          if columnas[c].map(lambda v: isinstance(v, str)).all()}
+        for columna, cardinalidad in sorted(cardinalidades.items(), key=lambda item: item[1]):
+            if trazas * cardinalidad <= MAX_TRAZAS_DIVISION:
+                divisiones.append(columna)
+                trazas *= cardinalidad
+    restantes = [c for c in columnas if c not in divisiones]
+    posiciones = {c: i for i, c in enumerate(restantes)}
+    datos = columnas[restantes].apply(_columna_hover)
+    datos = datos.to_numpy(dtype=object if (datos.dtypes == object).any() else 'float64')
+
+    if not divisiones:
+        traza['customdata'] = datos if restantes else None
+        traza['hovertemplate'] = _sustituir(traza['hovertemplate'], {}, posiciones)
+        return [traza]
+
+    rutas = _por_punto(traza, n)
+    grupo_leyenda = traza.get('legendgroup') or traza.get('name')
+    subtrazas = []
+    for valores, indices in columnas.groupby(divisiones, sort=True).indices.items():
+        valores = valores if isinstance(valores, tuple) else (valores,)
+        subtraza = {**traza, 'marker': dict(traza.get('marker', {}))}
+        for nodo, clave in rutas:
+            destino = subtraza['marker'] if nodo is not traza else subtraza
+            destino[clave] = np.asarray(nodo[clave])[indices]
+        subtraza['customdata'] = datos[indices] if restantes else None
+        subtraza['hovertemplate'] = _sustituir(traza['hovertemplate'], dict(zip(divisiones, valores)), posiciones)
+        subtraza['legendgroup'] = grupo_leyenda
+        subtraza['showlegend'] = traza.get('showlegend', True) and not subtrazas
+        subtrazas.append(subtraza)
+    return subtrazas
+
+
+def compactar(fig):
+    if isinstance(fig, FiguraCompacta):
+        return fig
+    with tramo('figura.compactar') as t:
+        datos = fig.to_dict()
+        trazas = [subtraza for traza in datos['data'] for subtraza in _deduplicar(traza)]
+        compacta = FiguraCompacta({'data': trazas, 'layout': datos['layout']})
+        if ACTIVA:
+            original, final = len(fig.to_json()), len(compacta.to_json())
+            t.anotar(bytes=final, bytes_json=original, ahorro=round(1 - final / original, 3))
+    return compacta
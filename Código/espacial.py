@@ -0,0 +1,147 @@
+# Índice espacial de rejilla (grid hash) sobre coordenadas proyectadas en metros.
+# Los puntos se ordenan por celda una sola vez; cada consulta solo visita las celdas que
+# tocan la caja o el círculo buscado, sin máscaras booleanas sobre el DataFrame completo.
+import numpy as np
+
+from instrumentacion import medido
+
+# Centro de referencia de la proyección local (Plaça de Catalunya)
+LAT_REF, LON_REF = 41.387019, 2.170047
+METROS_GRADO_LAT = 110540
+METROS_GRADO_LON = 111320 * np.cos(np.radians(LAT_REF))
+
+# Puntos de referencia para las consultas por radio del dashboard
+PUNTOS_REFERENCIA = {
+    'Plaça de Catalunya': (41.387019, 2.170047),
+    'Sagrada Família': (41.403629, 2.174356),
+    'Park Güell': (41.414494, 2.152694),
+    'La Barceloneta': (41.380653, 2.189927),
+    'Camp Nou': (41.380896, 2.122820),
+}
+
+
+def proyectar_metros(lat, lon):
+    # Proyección equirectangular local: suficiente a escala de ciudad
+    x = (np.asarray(lon, dtype='float64') - LON_REF) * METROS_GRADO_LON
+    y = (np.asarray(lat, dtype='float64') - LAT_REF) * METROS_GRADO_LAT
+    return x, y
+
+
+def _clave(cx, cy):
+    return np.asarray(cx, dtype='int64') * (1 << 32) + (np.asarray(cy, dtype='int64') + (1 << 31))
+
+
+class IndiceEspacial:
+    def __init__(self, lat, lon, tamano_celda=250):
+        self.tamano = tamano_celda
+        self.x, self.y = proyectar_metros(lat, lon)
+        # Los puntos sin coordenadas no se indexan (las posiciones siguen siendo las de entrada)
+        validos = np.flatnonzero(np.isfinite(self.x) & np.isfinite(self.y))
+        cx, cy = np.floor(self.x[validos] / self.tamano), np.floor(self.y[validos] / self.tamano)
+        claves = _clave(cx, cy)
+        orden = np.argsort(claves, kind='stable')
+        self.orden = validos[orden]
+        self.claves = claves[orden]
+        # Extensión de la rejilla en celdas: (cx_min, cx_max, cy_min, cy_max)
+        self.extension = (int(cx.min()), int(cx.max()), int(cy.min()), int(cy.max())) if len(validos) else None
+
+    def __len__(self):
+        return len(self.orden)
+
+    def _celda(self, x, y):
+        return int(np.floor(x / self.tamano)), int(np.floor(y / self.tamano))
+
+    def _candidatos(self, cx0, cx1, cy0, cy1):
+        # Posiciones de todos los puntos en las celdas [cx0, cx1] x [cy0, cy1]
+        cx, cy = np.meshgrid(np.arange(cx0, cx1 + 1), np.arange(cy0, cy1 + 1), indexing='ij')
+        buscadas = _clave(cx.ravel(), cy.ravel())
+        inicio = np.searchsorted(self.claves, buscadas, side='left')
+        fin = np.searchsorted(self.claves, buscadas, side='right')
+        largos = fin - inicio
+        if largos.sum() == 0:
+            return np.empty(0, dtype='int64')
+        # Concatenación vectorizada de los rangos [inicio, fin)
+        desplazamiento = np.repeat(inicio - np.concatenate(([0], np.cumsum(largos)[:-1])), largos)
+        return self.orden[np.arange(largos.sum()) + desplazamiento]
+
+    def en_caja(self, lat_min, lat_max, lon_min, lon_max):
+        x0, y0 = proyectar_metros(lat_min, lon_min)
+        x1, y1 = proyectar_metros(lat_max, lon_max)
+        cx0, cy0 = self._celda(x0, y0)
+        cx1, cy1 = self._celda(x1, y1)
+        cand = self._candidatos(cx0, cx1, cy0, cy1)
+        dentro = (self.x[cand] >= x0) & (self.x[cand] <= x1) & (self.y[cand] >= y0) & (self.y[cand] <= y1)
+        return cand[dentro]
+
+    @medido('espacial.en_radio')
+    def en_radio(self, lat, lon, metros):
+        # Devuelve (posiciones, distancias en m) ordenadas por distancia
+        x, y = proyectar_metros(lat, lon)
+        cx0, cy0 = self._celda(x - metros, y - metros)
+        cx1, cy1 = self._celda(x + metros, y + metros)
+        cand = self._candidatos(cx0, cx1, cy0, cy1)
+        dist = np.hypot(self.x[cand] - x, self.y[cand] - y)
+        dentro = dist <= metros
+        cand, dist = cand[dentro], dist[dentro]
+        orden = np.argsort(dist, kind='stable')
+        return cand[orden], dist[orden]
+
+    def _mas_cercanos(self, cand, x, y, k):
+        dist = np.hypot(self.x[cand] - x, self.y[cand] - y)
+        orden = np.argsort(dist, kind='stable')[:k]
+        return cand[orden], dist[orden]
+
+    def vecinos(self, lat, lon, k):
+        # k vecinos más cercanos: ampliamos anillos de celdas hasta que el k-ésimo
+        # está más cerca que cualquier punto fuera de las celdas visitadas
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype='int64'), np.empty(0)
+        x, y = proyectar_metros(lat, lon)
+        cx, cy = self._celda(x, y)
+        cx_min, cx_max, cy_min, cy_max = self.extension
+        # Los anillos más cercanos que la rejilla están vacíos; a partir de `cubre` el anillo
+        # contiene toda la rejilla
+        anillo = max(0, cx_min - cx, cx - cx_max, cy_min - cy, cy - cy_max)
+        cubre = max(cx - cx_min, cx_max - cx, cy - cy_min, cy_max - cy)
+        while True:
+            # Si el anillo abarca toda la rejilla o más celdas que puntos, es más barato
+            # medir la distancia a todos los puntos
+            if anillo >= cubre or (2 * anillo + 1) ** 2 > len(self):
+                return self._mas_cercanos(self.orden, x, y, k)
+            cand = self._candidatos(cx - anillo, cx + anillo, cy - anillo, cy + anillo)
+            if len(cand) >= k:
+                posiciones, dist = self._mas_cercanos(cand, x, y, k)
+                if dist[-1] <= anillo * self.tamano:
+                    return posiciones, dist
+            anillo += 1
+
+    def en_radio_lote(self, lat, lon, metros):
+        # Consulta por radio para muchos puntos a la vez, sin bucle por punto.
+        # Devuelve (consulta, posicion, distancia): una entrada por pareja a <= metros
+        qx, qy = proyectar_metros(lat, lon)
+        qcx = np.floor(qx / self.tamano).astype('int64')
+        qcy = np.floor(qy / self.tamano).astype('int64')
+        alcance = int(np.ceil(metros / self.tamano))
+
+        consultas, posiciones = [], []
+        for dx in range(-alcance, alcance + 1):
+            for dy in range(-alcance, alcance + 1):
+                buscadas = _clave(qcx + dx, qcy + dy)
+                inicio = np.searchsorted(self.claves, buscadas, side='left')
+                largos = np.searchsorted(self.claves, buscadas, side='right') - inicio
+                total = largos.sum()
+                if total == 0:
+                    continue
+                consulta = np.repeat(np.arange(len(qx)), largos)
+                desplazamiento = np.repeat(inicio - np.concatenate(([0], np.cumsum(largos)[:-1])), largos)
+                consultas.append(consulta)
+                posiciones.append(self.orden[np.arange(total) + desplazamiento])
+
+        if not consultas:
+            return np.empty(0, dtype='int64'), np.empty(0, dtype='int64'), np.empty(0)
+        consulta = np.concatenate(consultas)
+        posicion = np.concatenate(posiciones)
+        distancia = np.hypot(self.x[posicion] - qx[consulta], self.y[posicion] - qy[consulta])
+        dentro = distancia <= metros
+        return consulta[dentro], posicion[dentro], distancia[dentro]
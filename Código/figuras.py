@@ -0,0 +1,171 @@
+# Caché de figuras Plotly compartida por todas las sesiones del proceso.
+# La clave es (sección, estado de los widgets, versión de los datos que usa la página, huella
+# del módulo que construye la figura): con los mismos datos y filtros, la figura de cualquier
+# sesión anterior se reutiliza sin repetir las consultas al cubo ni px.bar/scatter_mapbox.
+#   memoria  LRU acotada por el tamaño del JSON serializado de cada figura; guarda el objeto
+#            Figure ya validado y compactado (empaquetado.py), que st.plotly_chart serializa
+#   disco    opcional (AIRBNB_CACHE_FIGURAS_DISCO=1): el JSON en DIR_CACHE/figuras, también LRU
+#            (por fecha de uso) y acotado; sobrevive a los reinicios del servidor
+# La versión de los datos la fija carga.obtener() en el hilo de cada sesión; sin versión (p. ej.
+# fuera de la app) las figuras se construyen sin caché.
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import streamlit as st
+
+from config import DIR_CACHE, CACHE_FIGURAS_MB, CACHE_FIGURAS_DISCO, CACHE_FIGURAS_DISCO_MB
+from cache_datos import huella_archivos
+from instrumentacion import tramo
+from empaquetado import compactar, figura_desde_json
+
+DIR_FIGURAS = Path(DIR_CACHE) / 'figuras'
+
+_local = threading.local()
+
+
+def fijar_version(version):
+    # Versión de los datos servidos en este rerun (cualquier valor serializable a JSON)
+    _local.version = version
+
+
+def version_actual():
+    return getattr(_local, 'version', None)
+
+
+def _clave(seccion, estado, version, construir):
+    # El código que construye la figura también forma parte de la clave (caché en disco)
+    codigo = construir.__code__
+    partes = [seccion, sorted(estado.items()), version,
+              huella_archivos(codigo.co_filename), codigo.co_firstlineno]
+    return hashlib.sha256(json.dumps(partes, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+class CacheFiguras:
+    def __init__(self, limite_bytes, directorio=None, limite_disco=None):
+        self.limite = limite_bytes
+        self.directorio = Path(directorio) if directorio is not None else None
+        self.limite_disco = limite_disco
+        self._figuras = OrderedDict()  # clave -> (figura, bytes del JSON)
+        self._bytes = 0
+        self._cerrojo = threading.Lock()
+        self.aciertos = self.aciertos_disco = self.fallos = 0
+
+    def obtener(self, clave):
+        with self._cerrojo:
+            if clave in self._figuras:
+                self._figuras.move_to_end(clave)
+                self.aciertos += 1
+                return self._figuras[clave][0]
+        texto = self._leer_disco(clave)
+        if texto is None:
+            with self._cerrojo:
+                self.fallos += 1
+            return None
+        try:
+            figura = figura_desde_json(texto)
+        except ValueError:  # fichero truncado o de otra versión de plotly: se reconstruye
+            with self._cerrojo:
+                self.fallos += 1
+            return None
+        self._guardar_memoria(clave, figura, len(texto))
+        with self._cerrojo:
+            self.aciertos_disco += 1
+        return figura
+
+    def guardar(self, clave, figura):
+        texto = figura.to_json()
+        self._guardar_memoria(clave, figura, len(texto))
+        self._escribir_disco(clave, texto)
+
+    def _guardar_memoria(self, clave, figura, n_bytes):
+        if n_bytes > self.limite:
+            return
+        with self._cerrojo:
+            if clave in self._figuras:
+                self._bytes -= self._figuras.pop(clave)[1]
+            self._figuras[clave] = (figura, n_bytes)
+            self._bytes += n_bytes
+            while self._bytes > self.limite:
+                _, (_, liberados) = self._figuras.popitem(last=False)
+                self._bytes -= liberados
+
+    def _ruta(self, clave):
+        return self.directorio / f"{clave}.json"
+
+    def _leer_disco(self, clave):
+        if self.directorio is None:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            texto = ruta.read_text(encoding='utf-8')
+        except OSError:
+            return None
+        os.utime(ruta)  # la fecha de modificación marca el último uso
+        return texto
+
+    def _escribir_disco(self, clave, texto):
+        if self.directorio is None:
+            return
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        ruta = self._ruta(clave)
+        temporal = ruta.with_suffix(f".{threading.get_ident()}.tmp")
+        temporal.write_text(texto, encoding='utf-8')
+        os.replace(temporal, ruta)
+        if self.limite_disco is not None:
+            self._podar_disco()
+
+    def _podar_disco(self):
+        # Borra los ficheros usados hace más tiempo hasta quedar por debajo del límite
+        ficheros = []
+        for ruta in self.directorio.glob('*.json'):
+            try:
+                estado = ruta.stat()
+            except OSError:
+                continue
+            ficheros.append((estado.st_mtime_ns, estado.st_size, ruta))
+        total = sum(tamano for _, tamano, _ in ficheros)
+        for _, tamano, ruta in sorted(ficheros):
+            if total <= self.limite_disco:
+                break
+            ruta.unlink(missing_ok=True)
+            total -= tamano
+
+    def estado(self):
+        with self._cerrojo:
+            return {
+                'figuras': len(self._figuras),
+                'mb': self._bytes / 2**20,
+                'aciertos': self.aciertos,
+                'aciertos_disco': self.aciertos_disco,
+                'fallos': self.fallos,
+            }
+
+
+@st.cache_resource
+def cache_figuras():
+    return CacheFiguras(
+        CACHE_FIGURAS_MB * 2**20,
+        directorio=DIR_FIGURAS if CACHE_FIGURAS_DISCO else None,
+        limite_disco=CACHE_FIGURAS_DISCO_MB * 2**20,
+    )
+
+
+def figura_cacheada(seccion, construir, **estado):
+    # construir() -> Figure; estado: los valores de los widgets de los que depende la figura.
+    # La figura devuelta se comparte entre sesiones: no se modifica después de construirla.
+    version = version_actual()
+    if version is None:
+        return construir()
+    cache = cache_figuras()
+    clave = _clave(seccion, estado, version, construir)
+    with tramo('figura.cache', seccion=seccion) as t:
+        figura = cache.obtener(clave)
+        t.anotar(acierto=figura is not None)
+        if figura is None:
+            figura = compactar(construir())
+            cache.guardar(clave, figura)
+    return figura
@@ -0,0 +1,186 @@
+# Tramos de medición en el camino caliente del dashboard (carga de datos, agregaciones del
+# cubo, construcción de figuras y envío con st.plotly_chart).
+# Se activa al arrancar con AIRBNB_INSTRUMENTACION=1. Desactivada, tramo() devuelve un contexto
+# nulo compartido y medido() deja la función sin envolver: el coste es una comprobación.
+# Activada, cada rerun acumula sus tramos (duración, filas, bytes, variación de RSS) por hilo
+# —Streamlit ejecuta cada sesión en su propio hilo— y al terminar se escriben como una línea
+# JSON en RUTA_LOG_TRAMOS y se muestran en el panel de depuración de la barra lateral.
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from config import INSTRUMENTACION, RUTA_LOG_TRAMOS
+
+ACTIVA = INSTRUMENTACION
+
+_local = threading.local()
+_cerrojo_log = threading.Lock()
+_PAGINA = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _rss():
+    # RSS del proceso en bytes (Linux); None donde no hay /proc
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGINA
+    except OSError:
+        return None
+
+
+def _filas(resultado):
+    # Filas de DataFrames/Series (o de la última tabla de una tupla)
+    if isinstance(resultado, tuple) and resultado:
+        resultado = resultado[-1]
+    return len(resultado) if hasattr(resultado, 'shape') else None
+
+
+class _TramoNulo:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def anotar(self, **atributos):
+        pass
+
+
+_NULO = _TramoNulo()
+
+
+class Tramo:
+    def __init__(self, nombre, atributos):
+        self.nombre = nombre
+        self.atributos = atributos
+
+    def anotar(self, **atributos):
+        self.atributos.update(atributos)
+
+    def __enter__(self):
+        pila = _pila()
+        self.nivel = len(pila)
+        pila.append(self)
+        self.rss = _rss()
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, *_):
+        duracion = time.perf_counter() - self.inicio
+        rss = _rss()
+        _pila().pop()
+        registro = {
+            'nombre': self.nombre,
+            'nivel': self.nivel,
+            'ms': round(duracion * 1000, 3),
+            'rss_delta': rss - self.rss if rss is not None and self.rss is not None else None,
+            **self.atributos,
+        }
+        if tipo is not None:
+            registro['error'] = tipo.__name__
+        getattr(_local, 'tramos', []).append(registro)
+        return False
+
+
+def _pila():
+    if not hasattr(_local, 'pila'):
+        _local.pila = []
+    return _local.pila
+
+
+def tramo(nombre, **atributos):
+    return Tramo(nombre, atributos) if ACTIVA else _NULO
+
+
+def medido(nombre):
+    # Decorador: con la instrumentación desactivada devuelve la función tal cual
+    def decorador(funcion):
+        if not ACTIVA:
+            return funcion
+
+        @functools.wraps(funcion)
+        def envuelta(*args, **kwargs):
+            with tramo(nombre) as t:
+                resultado = funcion(*args, **kwargs)
+                filas = _filas(resultado)
+                if filas is not None:
+                    t.anotar(filas=filas)
+            return resultado
+        return envuelta
+    return decorador
+
+
+def instrumentar_plotly():
+    # Envuelve las funciones de plotly.express y go.Figure si ya están importadas (las páginas
+    # las importan al seleccionarse); idempotente
+    if not ACTIVA or 'plotly.express' not in sys.modules:
+        return
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    if getattr(px, '_instrumentado', False):
+        return
+    for nombre in ['bar', 'pie', 'line', 'scatter', 'scatter_mapbox', 'histogram']:
+        setattr(px, nombre, medido(f"figura.px.{nombre}")(getattr(px, nombre)))
+
+    class Figure(go.Figure):
+        def __init__(self, *args, **kwargs):
+            with tramo('figura.go.Figure'):
+                super().__init__(*args, **kwargs)
+
+    go.Figure = Figure
+    px._instrumentado = True
+
+
+# RERUNS
+
+def iniciar_rerun(pagina, sesion=None):
+    _local.tramos = []
+    _local.pila = []
+    _local.rerun = {'pagina': pagina, 'sesion': sesion, 'inicio': time.perf_counter(),
+                    'fecha': datetime.now().isoformat(timespec='milliseconds')}
+
+
+def cerrar_rerun():
+    # Devuelve los tramos del rerun (en orden de apertura) y los añade al log JSONL
+    if not ACTIVA or not hasattr(_local, 'rerun'):
+        return []
+    rerun = _local.rerun
+    tramos = _ordenar(_local.tramos)
+    linea = {
+        'fecha': rerun['fecha'],
+        'sesion': rerun['sesion'],
+        'pagina': rerun['pagina'],
+        'total_ms': round((time.perf_counter() - rerun['inicio']) * 1000, 3),
+        'rss': _rss(),
+        'tramos': tramos,
+    }
+    RUTA_LOG_TRAMOS.parent.mkdir(parents=True, exist_ok=True)
+    with _cerrojo_log, open(RUTA_LOG_TRAMOS, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(linea, ensure_ascii=False, default=str) + '\n')
+    del _local.rerun
+    return tramos
+
+
+def _ordenar(tramos):
+    # Los tramos se registran al cerrarse (hijos antes que padres); para el panel se muestran
+    # en orden de apertura: cada padre antes de sus hijos
+    ordenados, pendientes = [], []
+    for registro in tramos:
+        hijos = []
+        while pendientes and pendientes[-1]['nivel'] > registro['nivel']:
+            hijos.append(pendientes.pop())
+        pendientes.append({**registro, '_hijos': hijos[::-1]})
+
+    def aplanar(registro):
+        hijos = registro.pop('_hijos')
+        ordenados.append(registro)
+        for hijo in hijos:
+            aplanar(hijo)
+
+    for registro in pendientes:
+        aplanar(registro)
+    return ordenados
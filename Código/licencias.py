@@ -0,0 +1,49 @@
+# Validación de licencias de los anuncios contra el registro oficial de viviendas turísticas.
+# Ambos lados se normalizan igual (mayúsculas, espacios, variantes del prefijo HUTB, ceros a
+# la izquierda, varias licencias en un mismo campo); los números del registro se guardan en un
+# índice hash y cada anuncio se clasifica en una sola pasada vectorizada.
+import numpy as np
+import pandas as pd
+
+ESTADOS = ['valida', 'numero_desconocido', 'exenta', 'sin_licencia']
+
+# HUTB-002062, HUTB002062, hutb 2062, HUTB_2062... -> HUTB-002062
+PATRON_HUTB = r'HUTB[\s\-_./]*(\d{1,7})'
+PATRON_EXENTA = r'EXEMPT|EXENT'
+VALORES_SIN_LICENCIA = ['', 'SIN DATOS', 'NAN', 'NONE']
+
+
+def normalizar_texto(licencias):
+    return licencias.astype('string').str.upper().str.strip().str.replace(r'\s+', ' ', regex=True)
+
+
+def extraer_numeros(licencias):
+    # Una fila por número HUTB encontrado; índice = (posición del texto, nº de coincidencia)
+    numeros = normalizar_texto(licencias).str.extractall(PATRON_HUTB)[0]
+    # Sin ceros a la izquierda y a 6 cifras, con operaciones de texto (válido también sin coincidencias)
+    return 'HUTB-' + numeros.str.lstrip('0').str.zfill(6)
+
+
+def indice_registro(numeros_registro):
+    # Índice hash con los números del registro ya normalizados
+    numeros = extraer_numeros(pd.Series(numeros_registro).dropna().reset_index(drop=True))
+    return pd.Index(numeros.unique())
+
+
+def clasificar_licencias(licencias, indice):
+    # Trabajamos sobre los textos únicos y repartimos el resultado por código
+    codigos, textos = pd.factorize(licencias)
+    textos = pd.Series(textos)
+    normalizados = normalizar_texto(textos)
+
+    numeros = extraer_numeros(textos)
+    en_registro = numeros.isin(indice).groupby(level=0).any()
+    valida = en_registro.reindex(range(len(textos)), fill_value=False).to_numpy(bool)
+    exenta = normalizados.str.contains(PATRON_EXENTA, regex=True).fillna(False).to_numpy(bool)
+    falta = normalizados.isin(VALORES_SIN_LICENCIA).fillna(False).to_numpy(bool)
+
+    estado_unicos = np.select([valida, exenta, falta], ESTADOS[:1] + ESTADOS[2:], default='numero_desconocido')
+    estado = np.full(len(codigos), 'sin_licencia', dtype=object)
+    conocidos = codigos >= 0
+    estado[conocidos] = estado_unicos[codigos[conocidos]]
+    return pd.Series(pd.Categorical(estado, categories=ESTADOS), index=licencias.index, name='estado_licencia')
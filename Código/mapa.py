@@ -0,0 +1,97 @@
+# Nivel de detalle (LOD) para el mapa de Inicio.
+# A escala de ciudad se envían celdas de una rejilla precalculada (una por celda y tipo de
+# anfitrión, con tamaño = rendimiento mensual sumado); los puntos individuales solo se
+# envían a zoom de calle o dentro de un barrio seleccionado con pocos alojamientos.
+import numpy as np
+import pandas as pd
+
+from espacial import proyectar_metros
+from instrumentacion import medido
+
+# Tamaño de celda (m) por nivel de zoom de Mapbox; por debajo del primero se usa el más grueso
+TAMANO_CELDA_M = {11: 1000, 12: 500, 13: 250, 14: 120}
+ZOOM_CIUDAD = 12
+ZOOM_CALLE = 15
+ZOOM_BARRIO = 14
+
+# Máximo de puntos individuales que se envían al navegador dentro de un barrio
+UMBRAL_PUNTOS = 1500
+
+
+def agregar_rejilla(df, tamano_m):
+    x, y = proyectar_metros(df['latitude'], df['longitude'])
+    base = pd.DataFrame({
+        'celda_x': np.floor(x / tamano_m).astype('int32'),
+        'celda_y': np.floor(y / tamano_m).astype('int32'),
+        'neighbourhood': df['neighbourhood'].astype(str).to_numpy(),
+        'tipo_anfitrion': df['tipo_anfitrion'].astype(str).to_numpy(),
+        'sin_licencia': (df['license'] == 'sin datos').to_numpy(),
+        'latitude': df['latitude'].to_numpy(dtype='float64'),
+        'longitude': df['longitude'].to_numpy(dtype='float64'),
+        'rendimiento_economico_mensual': df['rendimiento_economico_mensual'].to_numpy(dtype='float64'),
+    })
+    # Guardamos sumas de coordenadas para poder recombinar celdas filtradas con su centroide
+    return base.groupby(['celda_x', 'celda_y', 'neighbourhood', 'tipo_anfitrion', 'sin_licencia']).agg(
+        n=('latitude', 'size'),
+        suma_lat=('latitude', 'sum'),
+        suma_lon=('longitude', 'sum'),
+        rendimiento_economico_mensual=('rendimiento_economico_mensual', 'sum'),
+    ).reset_index()
+
+
+def construir_niveles(df):
+    # Rejillas por zoom y conteos por barrio/licencia para decidir sin recorrer df
+    conteos = pd.DataFrame({
+        'neighbourhood': df['neighbourhood'].astype(str).to_numpy(),
+        'sin_licencia': (df['license'] == 'sin datos').to_numpy(),
+    }).value_counts()
+    return {
+        'celdas': {zoom: agregar_rejilla(df, tamano) for zoom, tamano in TAMANO_CELDA_M.items()},
+        'conteos': conteos,
+    }
+
+
+def _filtrar(tabla, sin_licencia, barrio):
+    mascara = np.ones(len(tabla), dtype=bool)
+    if sin_licencia is not None:
+        mascara &= (tabla['sin_licencia'] == sin_licencia).to_numpy()
+    if barrio is not None:
+        mascara &= (tabla['neighbourhood'] == barrio).to_numpy()
+    return tabla[mascara]
+
+
+def usar_puntos(niveles, zoom, sin_licencia=None, barrio=None):
+    if zoom >= ZOOM_CALLE:
+        return True
+    if barrio is None:
+        return False
+    conteos = niveles['conteos']
+    conteos = conteos[conteos.index.get_level_values('neighbourhood') == barrio]
+    if sin_licencia is not None:
+        conteos = conteos[conteos.index.get_level_values('sin_licencia') == sin_licencia]
+    return conteos.sum() <= UMBRAL_PUNTOS
+
+
+@medido('mapa.datos_mapa')
+def datos_mapa(df, niveles, zoom, sin_licencia=None, barrio=None):
+    # Devuelve ('puntos', filas de df) o ('celdas', celdas agregadas) según el nivel de detalle
+    if usar_puntos(niveles, zoom, sin_licencia, barrio):
+        mascara = np.ones(len(df), dtype=bool)
+        if sin_licencia is not None:
+            mascara &= ((df['license'] == 'sin datos') == sin_licencia).to_numpy()
+        if barrio is not None:
+            mascara &= (df['neighbourhood'] == barrio).to_numpy()
+        return 'puntos', df[mascara]
+
+    rejillas = niveles['celdas']
+    nivel = max([z for z in rejillas if z <= zoom], default=min(rejillas))
+    celdas = _filtrar(rejillas[nivel], sin_licencia, barrio)
+    celdas = celdas.groupby(['celda_x', 'celda_y', 'tipo_anfitrion']).agg(
+        n=('n', 'sum'),
+        suma_lat=('suma_lat', 'sum'),
+        suma_lon=('suma_lon', 'sum'),
+        rendimiento_economico_mensual=('rendimiento_economico_mensual', 'sum'),
+    ).reset_index()
+    celdas['latitude'] = celdas['suma_lat'] / celdas['n']
+    celdas['longitude'] = celdas['suma_lon'] / celdas['n']
+    return 'celdas', celdas
@@ -0,0 +1,269 @@
+# Métricas del dashboard como funciones puras sobre el cubo de agregados y las tablas, sin
+# Streamlit: las páginas las usan para sus KPIs y figuras, y calcular() las obtiene todas de
+# una pasada para exportarlas sin levantar el dashboard (informe nocturno).
+# Funcionan con cualquier backend del cubo (pandas o SQL, ver consultas_sql.py).
+#
+# El CLI exporta uno o varios conjuntos (ciudades o snapshots de InsideAirbnb: CSV limpios o
+# listings.csv originales, que se limpian con el pipeline) en paralelo con un proceso por
+# conjunto. Cada conjunto escribe metricas.json (indicadores y tablas) y un Parquet por tabla
+# en <salida>/<conjunto>/, y todos juntos indicadores.json/.parquet con una fila por conjunto:
+#
+#   python Código/metricas.py [--datos data/limpio_airbnb_Barcelona.csv [nombre=]ruta.csv ...]
+#                             [--precios data/housing_...csv] [--snapshots] [--salida data/metricas]
+#                             [--procesos 4]
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import DIR_DATOS, RUTA_LIMPIO, RUTA_PRECIOS
+from cache_datos import huella_archivos, leer_csv_tipado, ESQUEMA_LIMPIO, ESQUEMA_PRECIOS, pa
+from compactacion import compactar
+from agregados import construir_cubo
+
+DIR_METRICAS = DIR_DATOS / 'metricas'
+ANIO_BASE, ANIO_FINAL = 2022, 2025
+ESTADOS_LICENCIA = ['valida', 'numero_desconocido', 'exenta', 'sin_licencia']
+# Alojamientos de Airbnb estimados por año, sustituidos por los conteos del almacén de snapshots
+ESTIMACION_AIRBNB = {
+    2015: 8000, 2016: 9500, 2017: 11450, 2018: 12800, 2019: 15600, 2020: 18200,
+    2021: 19422, 2022: 19422, 2023: 19800, 2024: 20100, 2025: 20500,
+}
+
+
+# MERCADO Y LICENCIAS
+
+def resumen_mercado(cubo):
+    total = cubo.total()
+    sin_licencia = cubo.total(sin_licencia=True)
+    return {'total': total, 'sin_licencia': sin_licencia, 'sin_licencia_pct': sin_licencia / total * 100}
+
+
+def reparto_anfitriones(cubo):
+    # Alojamientos y alojamientos sin licencia de particulares y empresas
+    total = cubo.total()
+    reparto = {}
+    for tipo in ['particular', 'empresa']:
+        n = cubo.total(tipo_anfitrion=tipo)
+        sin_licencia = cubo.total(tipo_anfitrion=tipo, sin_licencia=True)
+        reparto[tipo] = {
+            'total': n,
+            'pct': n / total * 100,
+            'sin_licencia': sin_licencia,
+            'sin_licencia_pct': sin_licencia / n * 100 if n else float('nan'),
+        }
+    return reparto
+
+
+def distribucion_anfitriones(cubo):
+    return cubo.conteo('tipo_anfitrion').sort_values(ascending=False)
+
+
+def alojamientos_por_anfitrion(cubo, porcentajes=False):
+    # Tipo de habitación x tipo de anfitrión; en porcentajes, sobre el total de cada tipo de anfitrión
+    cruce = cubo.cruce('room_type', 'tipo_anfitrion')
+    return cruce.div(cruce.sum()) * 100 if porcentajes else cruce
+
+
+def estado_licencias(cubo):
+    # Licencias validadas contra el registro oficial (None si los datos no traen la validación)
+    if 'estado_licencia' not in cubo.dimensiones:
+        return None
+    return cubo.conteo('estado_licencia').reindex(ESTADOS_LICENCIA, fill_value=0)
+
+
+# BARRIOS
+
+def cuota_por_barrio(cubo):
+    # % de los alojamientos de la ciudad en cada barrio, de mayor a menor
+    return (cubo.conteo('neighbourhood') / cubo.total() * 100).sort_values(ascending=False)
+
+
+def sin_licencia_por_barrio(cubo):
+    return cubo.conteo('neighbourhood', sin_licencia=True) / cubo.conteo('neighbourhood') * 100
+
+
+def rendimiento_por_barrio(cubo, factor_iqr=1.5):
+    # Rendimiento mensual medio por barrio sin los barrios atípicos (regla del rango intercuartílico)
+    medias = cubo.media('rendimiento_economico_mensual', por='neighbourhood')
+    q1, q3 = medias.quantile(0.25), medias.quantile(0.75)
+    iqr = q3 - q1
+    dentro = (medias >= q1 - factor_iqr * iqr) & (medias <= q3 + factor_iqr * iqr)
+    return medias[dentro].sort_values(ascending=False)
+
+
+# PRECIOS DE LA VIVIENDA
+
+def incremento_pct(df3, columna, desde=ANIO_BASE, hasta=ANIO_FINAL):
+    precios = df3.set_index('Year')[columna]
+    return float((precios[hasta] - precios[desde]) / precios[desde] * 100)
+
+
+def evolucion_anual(df3, snapshot_series=None):
+    # Precios de venta y alquiler frente a alojamientos de Airbnb, con índices base 100 (máximo)
+    anios = range(2015, 2026)
+    conteos = {}
+    if snapshot_series is not None and len(snapshot_series):
+        conteos = dict(zip(snapshot_series['periodo'].dt.year, snapshot_series['activos']))
+    anual = pd.DataFrame({
+        'Year': anios,
+        'Precio_Venta': df3['Avg_Purchase_Price_EUR_m2'],
+        'Precio_Alquiler': df3['Avg_Rental_Price_EUR_month'],
+        'Alojamientos_Airbnb': [conteos.get(anio, ESTIMACION_AIRBNB[anio]) for anio in anios],
+    })
+    for columna, indice in [('Alojamientos_Airbnb', 'Indice_Airbnb'), ('Precio_Venta', 'Indice_Venta'),
+                            ('Precio_Alquiler', 'Indice_Alquiler')]:
+        anual[indice] = anual[columna] / anual[columna].max() * 100
+    return anual
+
+
+def correlaciones(anual):
+    return {
+        'venta': float(np.corrcoef(anual['Alojamientos_Airbnb'], anual['Precio_Venta'])[0, 1]),
+        'alquiler': float(np.corrcoef(anual['Alojamientos_Airbnb'], anual['Precio_Alquiler'])[0, 1]),
+    }
+
+
+# TODAS LAS MÉTRICAS
+
+def calcular(cubo, df3=None, snapshot_series=None, recent_share=None):
+    # -> (indicadores: dict de escalares, tablas: nombre -> DataFrame)
+    indicadores = {f"mercado_{k}": v for k, v in resumen_mercado(cubo).items()}
+    for tipo, valores in reparto_anfitriones(cubo).items():
+        indicadores.update({f"{tipo}_{k}": v for k, v in valores.items()})
+    if recent_share is not None:
+        indicadores['cuota_recientes_pct'] = recent_share
+
+    tablas = {
+        'anfitriones': distribucion_anfitriones(cubo).rename('n').rename_axis('tipo_anfitrion').reset_index(),
+        'alojamientos_por_anfitrion': alojamientos_por_anfitrion(cubo).rename_axis(columns=None).reset_index(),
+        'barrios': pd.DataFrame({
+            'cuota_pct': cuota_por_barrio(cubo),
+            'sin_licencia_pct': sin_licencia_por_barrio(cubo),
+            'rendimiento_medio': cubo.media('rendimiento_economico_mensual', por='neighbourhood'),
+        }).rename_axis('neighbourhood').reset_index().sort_values('cuota_pct', ascending=False),
+        'rendimiento_barrios': rendimiento_por_barrio(cubo).rename('rendimiento_medio')
+                                                           .rename_axis('neighbourhood').reset_index(),
+    }
+    licencias = estado_licencias(cubo)
+    if licencias is not None:
+        tablas['estado_licencias'] = licencias.rename('n').rename_axis('estado_licencia').reset_index()
+
+    if df3 is not None:
+        indicadores['incremento_alquiler_pct'] = incremento_pct(df3, 'Avg_Rental_Price_EUR_month')
+        indicadores['incremento_venta_pct'] = incremento_pct(df3, 'Avg_Purchase_Price_EUR_m2')
+        anual = evolucion_anual(df3, snapshot_series)
+        indicadores.update({f"correlacion_{k}": v for k, v in correlaciones(anual).items()})
+        tablas['evolucion_anual'] = anual
+    return indicadores, tablas
+
+
+# EXPORTACIÓN POR LOTES
+
+def cargar_conjunto(ruta):
+    # CSV limpio (con las columnas derivadas) o listings.csv original, que se limpia aquí sin la
+    # caché por etapas (compartida: los procesos en paralelo se pisarían las versiones)
+    if 'tipo_anfitrion' in pd.read_csv(ruta, nrows=0).columns:
+        return compactar(leer_csv_tipado(ruta, ESQUEMA_LIMPIO))
+    from preprocesamiento import ejecutar_pipeline
+
+    return compactar(ejecutar_pipeline(ruta, usar_cache=False))
+
+
+def _json(valor):
+    if isinstance(valor, (np.integer, np.floating)):
+        valor = valor.item()
+    return None if isinstance(valor, float) and np.isnan(valor) else valor
+
+
+def _registros(tabla):
+    return [{k: _json(v) for k, v in fila.items()} for fila in tabla.to_dict(orient='records')]
+
+
+def exportar_conjunto(nombre, ruta, destino, ruta_precios=None, snapshot_series=None, recent_share=None):
+    # Un conjunto completo (se ejecuta en un proceso del pool); devuelve su fila de indicadores
+    inicio = time.perf_counter()
+    df = cargar_conjunto(ruta)
+    df3 = leer_csv_tipado(ruta_precios, ESQUEMA_PRECIOS) if ruta_precios else None
+    indicadores, tablas = calcular(construir_cubo(df), df3, snapshot_series, recent_share)
+
+    destino = Path(destino) / nombre
+    destino.mkdir(parents=True, exist_ok=True)
+    cabecera = {
+        'conjunto': nombre,
+        'origen': str(ruta),
+        'version': huella_archivos(*[r for r in [ruta, ruta_precios] if r]),
+        'filas': len(df),
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+    }
+    documento = {**cabecera, 'indicadores': {k: _json(v) for k, v in indicadores.items()},
+                 'tablas': {t: _registros(tabla) for t, tabla in tablas.items()}}
+    (destino / 'metricas.json').write_text(json.dumps(documento, indent=2, ensure_ascii=False))
+    if pa is not None:
+        for nombre_tabla, tabla in tablas.items():
+            tabla.to_parquet(destino / f"{nombre_tabla}.parquet", index=False)
+    return {**cabecera, **indicadores, 'segundos': time.perf_counter() - inicio}
+
+
+def _conjuntos(entradas):
+    # 'nombre=ruta' o 'ruta'; sin nombre, el del fichero (con su carpeta si se repite)
+    pares = [e.split('=', 1) if '=' in e else (None, e) for e in entradas]
+    nombres = [Path(r).stem for _, r in pares]
+    return [
+        (n or (f"{Path(r).parent.name}-{Path(r).stem}" if nombres.count(Path(r).stem) > 1 else Path(r).stem), r)
+        for n, r in pares
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exportación por lotes de las métricas del dashboard")
+    parser.add_argument('--datos', nargs='+', default=[str(RUTA_LIMPIO)],
+                        help="CSV limpios o listings.csv originales, como ruta o nombre=ruta")
+    parser.add_argument('--precios', default=str(RUTA_PRECIOS) if RUTA_PRECIOS.exists() else None,
+                        help="CSV de precios de la vivienda (métricas de precios y correlaciones)")
+    parser.add_argument('--snapshots', action='store_true',
+                        help="Usa la serie del almacén de snapshots (conteos anuales y cuota de recientes)")
+    parser.add_argument('--salida', default=str(DIR_METRICAS))
+    parser.add_argument('--procesos', type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    snapshot_series = recent_share = None
+    if args.snapshots:
+        from snapshots import AlmacenSnapshots
+
+        almacen = AlmacenSnapshots()
+        if almacen.ruta_serie.exists():
+            snapshot_series, recent_share = almacen.serie_periodica('anual'), almacen.cuota_recientes(24)
+
+    conjuntos = _conjuntos(args.datos)
+    trabajos = [(nombre, ruta, args.salida, args.precios, snapshot_series, recent_share)
+                for nombre, ruta in conjuntos]
+    inicio = time.perf_counter()
+    if args.procesos > 1 and len(trabajos) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.procesos, len(trabajos))) as pool:
+            filas = list(pool.map(exportar_conjunto, *zip(*trabajos)))
+    else:
+        filas = [exportar_conjunto(*trabajo) for trabajo in trabajos]
+
+    resumen = pd.DataFrame(filas)
+    salida = Path(args.salida)
+    (salida / 'indicadores.json').write_text(
+        json.dumps(_registros(resumen), indent=2, ensure_ascii=False))
+    if pa is not None:
+        resumen.to_parquet(salida / 'indicadores.parquet', index=False)
+    else:
+        print("Sin pyarrow: solo se escribe JSON", file=sys.stderr)
+    for fila in filas:
+        print(f"{fila['conjunto']}: {fila['filas']:,} filas, {fila['segundos']:.2f}s -> {salida / fila['conjunto']}")
+    print(f"{len(filas)} conjuntos en {time.perf_counter() - inicio:.2f}s -> {salida}")
+
+
+if __name__ == '__main__':
+    main()
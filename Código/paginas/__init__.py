@@ -0,0 +1,51 @@
+# Páginas del dashboard: un módulo por sección con
+#   NECESITA: nombres de los datos que usa (ver carga.py); vacío en las páginas de texto
+#   mostrar(**datos): dibuja la página (recibe además data_load_success si NECESITA no está vacío)
+# Los módulos se importan al seleccionar la página, no al arrancar la app.
+import importlib
+import logging
+import threading
+
+PAGINAS = {
+    "📊 Inicio": 'inicio',
+    "🏘️ Estructura del Mercado": 'estructura_mercado',
+    "💰 Impacto Económico": 'impacto_economico',
+    "🗺️ Geografía de la Turistificación": 'geografia',
+    "👥 Implicaciones Socioeconómicas": 'implicaciones',
+    "📝 Recomendaciones": 'recomendaciones',
+    "🔍 Conclusiones": 'conclusiones',
+}
+
+log = logging.getLogger(__name__)
+
+# Tiempos de render por página en este proceso (compartidos por todas las sesiones)
+_tiempos = {}
+_cerrojo = threading.Lock()
+
+
+def cargar_pagina(titulo):
+    return importlib.import_module(f"{__name__}.{PAGINAS[titulo]}")
+
+
+def registrar_tiempo(titulo, datos_s, total_s):
+    with _cerrojo:
+        tiempos = _tiempos.setdefault(titulo, {'primera': total_s, 'renders': 0, 'suma': 0.0, 'datos': 0.0})
+        tiempos['renders'] += 1
+        tiempos['suma'] += total_s
+        tiempos['datos'] += datos_s
+    log.info("página %s: %.0f ms hasta el render (datos %.0f ms)", titulo, total_s * 1000, datos_s * 1000)
+
+
+def resumen_tiempos():
+    # Una fila por página, en ms: primer render del proceso, media y parte de la media en datos
+    with _cerrojo:
+        return [
+            {
+                'pagina': titulo,
+                'primera_ms': round(t['primera'] * 1000, 1),
+                'media_ms': round(t['suma'] / t['renders'] * 1000, 1),
+                'datos_ms': round(t['datos'] / t['renders'] * 1000, 1),
+                'renders': t['renders'],
+            }
+            for titulo, t in _tiempos.items()
+        ]
@@ -0,0 +1,187 @@
+# Estructura del mercado: tipos de anfitrión, concentración y licencias
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from componentes import create_metric_row, plotly_chart
+from figuras import figura_cacheada
+from metricas import reparto_anfitriones, distribucion_anfitriones, alojamientos_por_anfitrion
+
+NECESITA = ['cubo']
+
+
+def mostrar(cubo, data_load_success):
+    st.markdown('<div class="sub-header">ESTRUCTURA DEL MERCADO</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="highlight">
+    Este análisis revela la estructura dual del mercado Airbnb en Barcelona, dominado por dos tipos de operadores:
+    particulares (94.4%) y empresas profesionales (5.6%). Esta composición tiene implicaciones significativas en el
+    control y regulación del mercado.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key metrics
+    if data_load_success:
+        # Calculate metrics
+        total_hosts = cubo.total()
+        hosts = reparto_anfitriones(cubo)
+        particular_hosts = hosts['particular']['total']
+        business_hosts = hosts['empresa']['total']
+        particular_pct = hosts['particular']['pct']
+        business_pct = hosts['empresa']['pct']
+        
+        # Calculate unlicensed metrics
+        unlicensed_particular = hosts['particular']['sin_licencia']
+        unlicensed_business = hosts['empresa']['sin_licencia']
+        unlicensed_part_pct = hosts['particular']['sin_licencia_pct']
+        unlicensed_bus_pct = hosts['empresa']['sin_licencia_pct']
+        
+        # Define metrics
+        metrics = [
+            ("ANFITRIONES PARTICULARES", 
+             f"{particular_hosts:,}", 
+             f"Representan el {particular_pct:.1f}% del total de alojamientos"),
+            
+            ("ANFITRIONES PROFESIONALES", 
+             f"{business_hosts:,}", 
+             f"Representan el {business_pct:.1f}% del total de alojamientos"),
+            
+            ("TIPO DE ALOJAMIENTO", 
+             "Apartamento", 
+             "Predominante en ambos tipos de anfitrión")
+        ]
+        create_metric_row(metrics)
+        
+        # Create tabs for visualizations
+        tab1, tab2, tab3 = st.tabs(["Distribución de Anfitriones", "Estado de Licencias", "Tipos de Alojamiento"])
+        
+        with tab1:
+            # Add visualization type selector
+            viz_type = st.radio(
+                "Tipo de visualización:",
+                ["Porcentajes", "Números totales"],
+                horizontal=True,
+                key="host_viz"
+            )
+            
+            # Host distribution visualization using bar chart
+            def figura_distribucion():
+                host_distribution = distribucion_anfitriones(cubo)
+            
+                if viz_type == "Porcentajes":
+                    y_values = [(v/total_hosts)*100 for v in host_distribution.values]
+                    text_template = "%{y:.1f}%"
+                    y_title = "Porcentaje del Total"
+                else:
+                    y_values = host_distribution.values
+                    text_template = "%{y:,}"
+                    y_title = "Número de Alojamientos"
+                
+                # Create color map to ensure consistent colors
+                color_map = {'particular': '#3b82f6', 'empresa': '#ef4444'}
+                colors = [color_map[host] for host in host_distribution.index]
+                
+                fig = px.bar(
+                    x=host_distribution.index,
+                    y=y_values,
+                    title='Distribución de Tipos de Anfitrión',
+                    labels={'y': y_title, 'x': 'Tipo de Anfitrión'}
+                )
+                # Labels formatted by plotly.js from the values instead of shipped as strings
+                fig.update_traces(marker_color=colors, texttemplate=text_template, textposition='outside')
+                return fig
+
+            fig = figura_cacheada('estructura_mercado.distribucion', figura_distribucion, viz_type=viz_type)
+            plotly_chart(fig, use_container_width=True, key="host_distribution_chart")
+            
+        with tab3:
+            # Add visualization type selector
+            room_viz_type = st.radio(
+                "Tipo de visualización:",
+                ["Porcentajes", "Números totales"],
+                horizontal=True,
+                key="room_viz"
+            )
+            
+            # Room type distribution
+            def figura_alojamientos():
+                room_host_data = alojamientos_por_anfitrion(cubo, porcentajes=room_viz_type == "Porcentajes")
+            
+                if room_viz_type == "Porcentajes":
+                    y_title = "Porcentaje del Total"
+                    hover_template = "%{y:.1f}%"
+                else:
+                    y_title = "Número de Alojamientos"
+                    hover_template = "%{y:,.0f}"
+                
+                fig = px.bar(
+                    room_host_data,
+                    title='Tipos de Alojamiento por Tipo de Anfitrión',
+                    barmode='group',
+                    color_discrete_sequence=['#3b82f6', '#ef4444']  # Blue for particulares, red for empresas
+                )
+                fig.update_layout(
+                    xaxis_title="Tipo de Habitación",
+                    yaxis_title=y_title,
+                    legend_title="Tipo de Anfitrión",
+                    hovermode="y unified"
+                )
+                fig.update_traces(hovertemplate=hover_template)
+                return fig
+
+            fig = figura_cacheada('estructura_mercado.alojamientos', figura_alojamientos, room_viz_type=room_viz_type)
+            plotly_chart(fig, use_container_width=True, key="room_type_chart")
+            
+        with tab2:
+            # Add visualization type selector
+            license_viz_type = st.radio(
+                "Tipo de visualización:",
+                ["Porcentajes", "Números totales"],
+                horizontal=True,
+                key="license_viz"
+            )
+            
+            def figura_licencias():
+                if license_viz_type == "Porcentajes":
+                    y_values = [unlicensed_part_pct, unlicensed_bus_pct]
+                    text_template = "%{y:.1f}%"
+                    y_title = "Porcentaje Sin Licencia"
+                else:
+                    y_values = [unlicensed_particular, unlicensed_business]
+                    text_template = "%{y:,}"
+                    y_title = "Número de Alojamientos Sin Licencia"
+            
+                # License status visualization
+                license_data = pd.DataFrame({
+                    'Tipo': ['Particulares', 'Empresas'],
+                    'Valor': y_values
+                })
+            
+                # Create color map for license visualization
+                colors = ['#3b82f6', '#ef4444']  # Blue for particulares, red for empresas
+            
+                fig = px.bar(
+                    license_data,
+                    x='Tipo',
+                    y='Valor',
+                    title='Alojamientos sin Licencia por Tipo de Anfitrión',
+                    labels={'Valor': y_title, 'Tipo': 'Tipo de Anfitrión'}
+                )
+                fig.update_traces(marker_color=colors, texttemplate=text_template, textposition='outside')
+                return fig
+
+            fig = figura_cacheada('estructura_mercado.licencias', figura_licencias, license_viz_type=license_viz_type)
+            plotly_chart(fig, use_container_width=True, key="license_status_chart")
+            
+        
+        st.markdown("""
+        <div class="info">
+        <strong>📊 Insights Clave:</strong>
+        <ul>
+            <li><strong>Composición del mercado:</strong> Los particulares representan el 94.4% del mercado pero muestran mayor informalidad (32% sin licencia)</li>
+            <li><strong>Comportamiento diferenciado:</strong> Las empresas tienen mejor tasa de cumplimiento normativo</li>
+            <li><strong>Tipos de alojamiento:</strong> Más del 90% de la oferta se compone por apartamentos completos y habitaciones privadas</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
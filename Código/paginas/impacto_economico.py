@@ -0,0 +1,208 @@
+# Impacto económico: evolución de precios frente al crecimiento de Airbnb
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from componentes import create_metric_row, plotly_chart
+from figuras import figura_cacheada
+from metricas import incremento_pct, evolucion_anual, correlaciones, rendimiento_por_barrio
+
+NECESITA = ['df3', 'cubo', 'snapshot_series']
+
+
+def mostrar(df3, cubo, snapshot_series, data_load_success):
+    st.markdown('<div class="sub-header">IMPACTO EN EL MERCADO INMOBILIARIO</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="highlight">
+    Este análisis evidencia el impacto disruptivo de Airbnb en el mercado inmobiliario barcelonés, con incrementos 
+    de precio del 43% en tres años y rendimientos hasta 6 veces superiores al alquiler tradicional, generando una 
+    distorsión económica crítica.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if data_load_success:
+        # Calculate metrics
+        price_increase = incremento_pct(df3, 'Avg_Purchase_Price_EUR_m2')
+        rent_increase = incremento_pct(df3, 'Avg_Rental_Price_EUR_month')
+        
+        # Define metrics
+        metrics = [
+            ("INCREMENTO PRECIOS VENTA", 
+             f"+{price_increase:.1f}%", 
+             f"Aumento en el precio por m² entre 2022-2025"),
+            
+            ("INCREMENTO ALQUILERES", 
+             f"+{rent_increase:.1f}%", 
+             f"Aumento en el precio mensual entre 2022-2025"),
+            
+            ("MULTIPLICADOR AIRBNB", 
+             "6x", 
+             "Más rentable que alquiler tradicional")
+        ]
+        create_metric_row(metrics)
+        
+
+        # Create tabs for different analyses
+        tab1, tab2, tab3 = st.tabs(["Evolución de Precios", "Rentabilidad por Barrio", "Consecuencias"])
+        
+        with tab1:
+            def figura_evolucion():
+                # Annual prices against Airbnb listings (estimates replaced by snapshot store
+                # counts where available), normalized to 0-100 for comparison
+                annual_data = evolucion_anual(df3, snapshot_series)
+
+                # Create figure
+                fig = go.Figure()
+
+                normalized_airbnb = annual_data['Indice_Airbnb']
+                normalized_venta = annual_data['Indice_Venta']
+                normalized_alquiler = annual_data['Indice_Alquiler']
+
+                fig.add_trace(
+                go.Scatter(
+                x=annual_data['Year'],
+                y=normalized_airbnb,
+                name='Alojamientos Airbnb (normalizado)',
+                line=dict(color='#27AE60', width=3),
+                hovertemplate='Año: %{x}<br>Índice: %{y:.1f}%<extra></extra>'
+                ))
+
+                fig.add_trace(
+                go.Scatter(
+                x=annual_data['Year'],
+                y=normalized_venta,
+                name='Índice Precio Venta',
+                line=dict(color='#2E86C1', width=2, dash='dot'),
+                hovertemplate='Año: %{x}<br>Índice: %{y:.1f}%<extra></extra>'
+                ))
+
+                fig.add_trace(
+                go.Scatter(
+                x=annual_data['Year'],
+                y=normalized_alquiler,
+                name='Índice Precio Alquiler',
+                line=dict(color='#E74C3C', width=2, dash='dot'),
+                hovertemplate='Año: %{x}<br>Índice: %{y:.1f}%<extra></extra>'
+                ))
+
+                # Update layout
+                fig.update_layout(
+                title={
+                'text': 'Correlación entre Airbnb y Precios (2015-2025)',
+                'y': 0.95,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+                },
+                height=500,
+                showlegend=True,
+                legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+                ),
+                hovermode='x unified',
+                xaxis_title="Año",
+                yaxis_title="Índice (Base 100)"
+                )
+
+                # Calculate correlation coefficients
+                correlations = correlaciones(annual_data)
+                price_corr, rent_corr = correlations['venta'], correlations['alquiler']
+
+                # Add annotations for correlation
+                correlation_text = f"""
+                Correlación 2015-2025:
+                • Airbnb vs Precio Venta: {price_corr:.2f}
+                • Airbnb vs Precio Alquiler: {rent_corr:.2f}
+                """
+            
+                fig.add_annotation(
+                x=0.02,
+                y=0.95,
+                text=correlation_text,
+                showarrow=False,
+                xref='paper',
+                yref='paper',
+                align='left',
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='gray',
+                borderwidth=1
+                )
+                return fig
+
+            fig = figura_cacheada('impacto_economico.evolucion', figura_evolucion)
+            plotly_chart(fig, use_container_width=True)
+
+
+        with tab2:
+            # Calculate and display average performance by neighborhood
+            def figura_rendimiento():
+                # Outlier neighbourhoods removed with the IQR rule
+                avg_performance_filtered = rendimiento_por_barrio(cubo)
+            
+                fig = px.bar(
+                    y=avg_performance_filtered.index,
+                    x=avg_performance_filtered.values,
+                    labels={"y": "Barrio", "x": "Rendimiento Mensual (EUR)"},
+                    title="Rendimiento Económico Mensual Promedio por Barrio (EUR)",
+                    orientation='h',
+                    color=avg_performance_filtered.values,
+                    color_continuous_scale='viridis'
+                )
+            
+                fig.update_traces(texttemplate='€%{x:,.0f}', textposition='outside')
+                fig.update_layout(height=800)
+                return fig
+
+            fig = figura_cacheada('impacto_economico.rendimiento', figura_rendimiento)
+            plotly_chart(fig, use_container_width=True)
+
+            
+        with tab3:
+            st.markdown("""
+            <div class="info">
+            <strong>📊 Impacto de Airbnb en el Mercado Inmobiliario:</strong>
+            <ul>
+            <li><strong>Mecanismo de Distorsión de Precios:</strong>
+            <ul>
+            <li>Los alquileres turísticos generan un efecto de "expulsión" del alquiler tradicional</li>
+            <li>Por cada 100 nuevos Airbnb, desaparecen 76 alquileres residenciales</li>
+            <li>Esto reduce artificialmente la oferta disponible y presiona los precios al alza</li>
+            </ul>
+            </li>
+            <li><strong>Espiral de Incremento de Precios (2022-2025):</strong>
+            <ul>
+            <li>Venta: +43% (de 3,850€/m² a 5,505€/m²)</li>
+            <li>Alquiler tradicional: +38% (de 1,150€ a 1,587€ mensual)</li>
+            <li>Los barrios con más Airbnb muestran incrementos hasta un 52% superiores</li>
+            </ul>
+            </li>
+            <li><strong>Rentabilidad Comparativa (Incentivo Perverso):</strong>
+            <ul>
+            <li>Alquiler tradicional: 4-5% rentabilidad anual (≈950€/mes)</li>
+            <li>Airbnb: 25-30% rentabilidad anual (≈5,700€/mes)</li>
+            <li>Esta diferencia de 6x en rentabilidad provoca el éxodo masivo de viviendas al mercado turístico</li>
+            </ul>
+            </li>
+            <li><strong>Colapso del Mercado Residencial:</strong>
+            <ul>
+            <li>19,422 viviendas convertidas a uso turístico</li>
+            <li>Reducción crítica del 8.2% en oferta residencial</li>
+            <li>32% de la población local ya no puede acceder al mercado de alquiler</li>
+            <li>El 45% del salario medio se destina al alquiler (límite recomendado: 30%)</li>
+            </ul>
+            </li>
+            <li><strong>Consecuencias en Cadena:</strong>
+            <ul>
+            <li>Migración forzada a la periferia: +24% anual</li>
+            <li>Pérdida de población residente en el centro: -15% en 3 años</li>
+            <li>Transformación de barrios residenciales en zonas turísticas</li>
+            </ul>
+            </li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
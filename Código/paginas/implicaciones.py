@@ -0,0 +1,144 @@
+# Implicaciones socioeconómicas (página de texto, sin datos)
+import streamlit as st
+
+from componentes import create_metric_row
+
+NECESITA = []
+
+
+def mostrar():
+    st.markdown('<div class="sub-header">IMPLICACIONES SOCIOECONÓMICAS</div>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight">
+    Este análisis revela las profundas consecuencias sociales y económicas de la turistificación en Barcelona, 
+    evidenciando una crisis de accesibilidad habitacional y transformación del tejido social que amenaza la 
+    sostenibilidad urbana a largo plazo.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Key metrics
+    metrics = [
+        ("SALARIO NECESARIO", 
+         "€45,000", 
+         "Para acceder a alquiler en zonas céntricas"),
+        ("SALARIO PROMEDIO ANUAL", 
+         "€30,000", 
+         "Para la mayoría de la población local"),
+         ("POBLACIÓN DESPLAZADA", 
+         "+24%", 
+         "Migración forzada a la periferia en 3 años")
+    ]
+    create_metric_row(metrics)
+
+    # Create tabs for different sections
+    tab1, tab2, tab3 = st.tabs(["Gentrificación", "Crisis Habitacional", "Riesgo Especulativo"])
+
+    with tab1:
+        st.markdown("""
+            <div class="info">
+            <strong>Gentrificación Inversa:</strong>
+            <ul>
+                <li><strong>Definición:</strong> Proceso de expulsión de residentes locales por aumento de precios</li>
+                <li><strong>Consecuencia:</strong> Transformación de barrios históricos en zonas turísticas</li>
+                <li><strong>Impacto:</strong> Desplazamiento de población local hacia la periferia</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            
+    
+        st.markdown("""
+            <div class="highlight">
+            <strong>Mecanismo de Expulsión:</strong>
+            <ul>
+                <li><strong>Incentivo económico:</strong> Hasta 6x más rentable que alquiler tradicional</li>
+                <li><strong>Resultado:</strong> Retirada sistemática de viviendas del mercado residencial</li>
+                <li><strong>Agentes:</strong> Miles de pequeños propietarios actuando como gentrificadores involuntarios</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+       
+        st.markdown("""
+            <div class="warning">
+            <strong>Impactos Negativos:</strong>
+            <ul>
+                <li>❌ Pérdida de tejido social en barrios históricos</li>
+                <li>❌ Desaparición de comercio de proximidad</li>
+                <li>❌ Fragmentación de redes vecinales</li>
+                <li>❌ Pérdida de identidad cultural</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+    with tab2:
+        # Add detailed analysis sections
+        st.markdown("""
+        <div class="highlight">
+        <strong>Impactos Socioeconómicos:</strong>
+        <ul>
+            <li><strong>Segregación por ingresos:</strong> Concentración de rentas altas en centro y bajas en periferia</li>
+            <li><strong>Movilidad social reducida:</strong> Imposibilidad de acceso a zonas céntricas para nuevos hogares</li>
+            <li><strong>Presión sobre infraestructura:</strong> Saturación de transporte público y servicios en periferia</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Create two columns for detailed impacts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div class="warning">
+            <strong>Impacto en Centro:</strong>
+            <ul>
+                <li>🏘️ Pérdida de diversidad social</li>
+                <li>🏪 Desaparición comercio local</li>
+                <li>👥 Debilitamiento tejido vecinal</li>
+                <li>🎭 Pérdida identidad cultural</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with col2:
+            st.markdown("""
+            <div class="warning">
+            <strong>Impacto en Periferia:</strong>
+            <ul>
+                <li>📈 Presión al alza en precios</li>
+                <li>🚇 Saturación transporte</li>
+                <li>🏥 Sobrecarga servicios públicos</li>
+                <li>⏰ Aumento tiempos desplazamiento</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with tab3:
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div class="warning">
+            <strong>Indicadores de Insostenibilidad:</strong>
+            <ul>
+                <li><strong>Crecimiento:</strong> 69.6% en 24 meses (no orgánico)</li>
+                <li><strong>Desconexión:</strong> Precios vs. fundamentales económicos locales</li>
+                <li><strong>Vulnerabilidad:</strong> Dependencia extrema de flujos turísticos</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with col2:
+            st.markdown("""
+            <div class="warning">
+            <strong>Riesgos Sistémicos:</strong>
+            <ul>
+                <li>💥 Colapso ante crisis turísticas (precedente COVID-19)</li>
+                <li>💰 Sobre-inversión en activos inmobiliarios turísticos</li>
+                <li>📉 Posible corrección brusca ante cambios regulatorios</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
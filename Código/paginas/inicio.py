@@ -0,0 +1,272 @@
+# Inicio: resumen ejecutivo, KPIs, mapa con nivel de detalle y búsqueda por radio
+import streamlit as st
+import plotly.express as px
+
+from componentes import create_metric_row, plotly_chart
+from figuras import figura_cacheada
+from mapa import datos_mapa, ZOOM_CIUDAD, ZOOM_BARRIO, ZOOM_CALLE, TAMANO_CELDA_M
+from espacial import PUNTOS_REFERENCIA
+from metricas import resumen_mercado, incremento_pct
+
+NECESITA = ['df', 'df3', 'cubo', 'niveles_mapa', 'indice_espacial', 'recent_share']
+
+
+def mostrar(df, df3, cubo, niveles_mapa, indice_espacial, recent_share, data_load_success):
+    st.markdown("""
+    <div class="highlight">
+    Este estudio analiza el impacto de Airbnb en el mercado inmobiliario barcelonés, revelando una crisis habitacional 
+    acelerada por el crecimiento exponencial de alojamientos turísticos. Con 19,422 propiedades activas y un 32% 
+    operando sin licencia, Barcelona enfrenta una distorsión del mercado que ha incrementado los precios de alquiler un 43% en tres años.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key metrics
+    # Calculate metrics from data
+    market = resumen_mercado(cubo)
+    total_listings = market['total']
+    unlicensed = market['sin_licencia']
+    unlicensed_percentage = market['sin_licencia_pct']
+    
+    # Calculate rent increase from df3
+    price_increase = incremento_pct(df3, 'Avg_Rental_Price_EUR_month')
+    
+    # Format the numbers with thousand separators
+    formatted_total = f"{total_listings:,}"
+    formatted_unlicensed = f"{unlicensed:,}"
+    
+    # Define metrics with more detailed descriptions and consistent spacing
+    metrics = [
+        ("ALOJAMIENTOS TURÍSTICOS", 
+         formatted_total, 
+         "Propiedades activas en la plataforma Airbnb en la ciudad Barcelona"),
+        
+        ("TASA DE CRECIMIENTO", 
+         f"{recent_share:.1f}%" if recent_share is not None else "69.6%", 
+         "Incremento en el número de alojamientos registrados entre 2023-2024"),
+        
+        ("ALOJAMIENTOS IRREGULARES", 
+         f"{unlicensed_percentage:.1f}%", 
+         f"Un total de {formatted_unlicensed} propiedades operan sin licencia turística"),
+        
+        ("INCREMENTOS DE PRECIO", 
+         f"+{price_increase:.1f}%", 
+         "Aumento en el precio medio del alquiler residencial entre 2022-2025")
+    ]
+    create_metric_row(metrics)
+    
+    if data_load_success:
+        # Add section header for map
+        st.markdown("""
+        <div class="section-header">
+            Distribución Geográfica de Alojamientos
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="info">
+            Explora la distribución de los alojamientos turísticos en Barcelona. El tamaño de los puntos representa 
+            el rendimiento económico mensual y el color distingue entre anfitriones particulares y profesionales.
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Create filter for license status with custom styling
+        st.markdown("""
+            <style>
+            div[data-baseweb="radio"] {
+            background: linear-gradient(to right, #f8fafc, #f1f5f9);
+            padding: 15px;
+            border-radius: 12px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+            }
+            div[data-baseweb="radio"] > label {
+            background-color: #ffffff;
+            padding: 12px 24px;
+            border-radius: 10px;
+            margin-right: 12px;
+            transition: all 0.2s ease;
+            border: 1px solid #e2e8f0;
+            }
+            div[data-baseweb="radio"] > label:hover {
+            background-color: #3b82f6;
+            color: white;
+            transform: translateY(-2px);
+            box-shadow: 0 4px 6px rgba(59, 130, 246, 0.1);
+            }
+            div[data-baseweb="radio"] > label[data-checked="true"] {
+            background-color: #2563eb;
+            color: white;
+            border-color: #2563eb;
+            }
+            div[data-testid="stHorizontalBlock"] {
+            background-color: #ffffff;
+            padding: 20px;
+            border-radius: 12px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.05);
+            }
+            </style>
+        """, unsafe_allow_html=True)
+
+        license_filter = st.radio(
+            "Mostrar alojamientos:",
+            ["Todos", "Sin licencia", "Con licencia"],
+            horizontal=True
+        )
+
+        col_barrio, col_zoom = st.columns([2, 1])
+        with col_barrio:
+            barrio_mapa = st.selectbox(
+                "Barrio:",
+                ["Toda la ciudad"] + sorted(cubo.conteo('neighbourhood').index)
+            )
+        with col_zoom:
+            # Plain labels as options (not formatted zoom numbers) so the value can be set headlessly
+            zoom_labels = {z: "Calle" if z >= ZOOM_CALLE else f"Zoom {z}" for z in sorted(TAMANO_CELDA_M) + [ZOOM_CALLE]}
+            zoom_label = st.select_slider(
+                "Nivel de detalle:",
+                options=list(zoom_labels.values()),
+                value=zoom_labels[ZOOM_CIUDAD if barrio_mapa == "Toda la ciudad" else ZOOM_BARRIO]
+            )
+            zoom_mapa = {label: z for z, label in zoom_labels.items()}[zoom_label]
+
+        # Aggregated grid cells at city zoom, individual listings at street zoom or inside a neighbourhood
+        sin_licencia = {"Sin licencia": True, "Con licencia": False}.get(license_filter)
+        barrio = None if barrio_mapa == "Toda la ciudad" else barrio_mapa
+        color_map = {'particular': '#3B82F6', 'empresa': '#EF4444'}  # More contrasting colors
+
+        # Built once per (filter, neighbourhood, zoom) and data version, shared across sessions
+        def figura_mapa():
+            modo_mapa, map_data = datos_mapa(df, niveles_mapa, zoom_mapa, sin_licencia, barrio)
+
+            # Create the map
+            if modo_mapa == 'puntos':
+                fig = px.scatter_mapbox(
+                    map_data,
+                    lat='latitude',
+                    lon='longitude',
+                    color='tipo_anfitrion',
+                    size='rendimiento_economico_mensual',
+                    hover_name='neighbourhood',
+                    hover_data={
+                    'license': True,
+                    'rendimiento_economico_mensual': ':.2f €',
+                    'room_type': True,
+                    'latitude': False,
+                    'longitude': False
+                    },
+                    color_discrete_map=color_map,
+                    size_max=15,  # Control maximum marker size
+                    zoom=zoom_mapa,
+                    labels={
+                    'tipo_anfitrion': 'Tipo de Anfitrión',
+                    'rendimiento_economico_mensual': 'Rendimiento Mensual (€)',
+                    'room_type': 'Tipo de Alojamiento',
+                    'license': 'Licencia'
+                    }
+                )
+            else:
+                fig = px.scatter_mapbox(
+                    map_data,
+                    lat='latitude',
+                    lon='longitude',
+                    color='tipo_anfitrion',
+                    size='rendimiento_economico_mensual',
+                    hover_data={
+                    'n': True,
+                    'rendimiento_economico_mensual': ':,.0f €',
+                    'latitude': False,
+                    'longitude': False
+                    },
+                    color_discrete_map=color_map,
+                    size_max=30,
+                    zoom=zoom_mapa,
+                    labels={
+                    'tipo_anfitrion': 'Tipo de Anfitrión',
+                    'rendimiento_economico_mensual': 'Rendimiento Mensual Total (€)',
+                    'n': 'Alojamientos'
+                    }
+                )
+
+            if barrio is None:
+                center = dict(lat=41.3851, lon=2.1734)
+            else:
+                center = dict(lat=map_data['latitude'].mean(), lon=map_data['longitude'].mean())
+
+            fig.update_layout(
+                mapbox_style="carto-positron",
+                mapbox=dict(
+                center=center
+                ),
+                height=700,  # Increased height
+                margin=dict(l=0, r=0, t=30, b=0),  # Adjusted margins
+                legend=dict(
+                yanchor="top",
+                y=0.99,
+                xanchor="left",
+                x=0.01,
+                bgcolor='rgba(255, 255, 255, 0.8)'  # Semi-transparent background
+                )
+            )
+            return fig
+
+        fig = figura_cacheada('inicio.mapa', figura_mapa, sin_licencia=sin_licencia, barrio=barrio, zoom=zoom_mapa)
+        plotly_chart(fig, use_container_width=True)
+
+        # Listings within N metres of a reference point, answered by the spatial index
+        with st.expander("Alojamientos cerca de un punto"):
+            col_punto, col_radio = st.columns([2, 1])
+            with col_punto:
+                punto = st.selectbox("Punto de referencia:", list(PUNTOS_REFERENCIA))
+            with col_radio:
+                radio_m = st.slider("Radio (metros):", 100, 2000, 500, step=100)
+
+            lat_punto, lon_punto = PUNTOS_REFERENCIA[punto]
+            posiciones, distancias = indice_espacial.en_radio(lat_punto, lon_punto, radio_m)
+            cercanos = df.iloc[posiciones].assign(distancia_m=distancias)
+
+            n_cercanos = len(cercanos)
+            n_sin_licencia = int((cercanos['license'] == 'sin datos').sum())
+            metrics = [
+                ("ALOJAMIENTOS", f"{n_cercanos:,}", f"A menos de {radio_m:,} m de {punto}"),
+                ("SIN LICENCIA",
+                 f"{(n_sin_licencia / n_cercanos * 100) if n_cercanos else 0:.1f}%",
+                 f"{n_sin_licencia:,} alojamientos"),
+                ("RENDIMIENTO MEDIO",
+                 f"€{cercanos['rendimiento_economico_mensual'].mean() if n_cercanos else 0:,.0f}",
+                 "Mensual por alojamiento")
+            ]
+            create_metric_row(metrics)
+
+            if n_cercanos:
+                def figura_radio():
+                    fig = px.scatter_mapbox(
+                        cercanos,
+                        lat='latitude',
+                        lon='longitude',
+                        color='tipo_anfitrion',
+                        hover_name='neighbourhood',
+                        hover_data={
+                        'distancia_m': ':.0f',
+                        'license': True,
+                        'room_type': True,
+                        'latitude': False,
+                        'longitude': False
+                        },
+                        color_discrete_map=color_map,
+                        zoom=15,
+                        labels={
+                        'tipo_anfitrion': 'Tipo de Anfitrión',
+                        'distancia_m': 'Distancia (m)',
+                        'room_type': 'Tipo de Alojamiento',
+                        'license': 'Licencia'
+                        }
+                    )
+                    fig.update_layout(
+                        mapbox_style="carto-positron",
+                        mapbox=dict(center=dict(lat=lat_punto, lon=lon_punto)),
+                        height=450,
+                        margin=dict(l=0, r=0, t=30, b=0)
+                    )
+                    return fig
+
+                fig = figura_cacheada('inicio.radio', figura_radio, punto=punto, radio_m=radio_m)
+                plotly_chart(fig, use_container_width=True, key="radius_map")
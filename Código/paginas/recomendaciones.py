@@ -0,0 +1,89 @@
+# Recomendaciones (página de texto, sin datos)
+import streamlit as st
+
+from componentes import create_metric_row
+
+NECESITA = []
+
+
+def mostrar():
+    st.markdown('<div class="sub-header">RECOMENDACIONES ESTRATÉGICAS</div>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="highlight">
+    Este análisis propone un conjunto integral de medidas regulatorias, fiscales y sociales para reequilibrar 
+    el impacto de Airbnb en Barcelona, priorizando el derecho a la vivienda mientras se mantiene un turismo 
+    sostenible.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Key metrics
+    metrics = [
+        ("VIVIENDAS A RECUPERAR", 
+         "9,500", 
+         "Para equilibrar el mercado residencial"),
+        ("TIEMPO ESTIMADO", 
+         "36 meses", 
+         "Para implementación completa")
+    ]
+    create_metric_row(metrics)
+    tab1, tab2 = st.tabs(["Medidas Regulatorias", "Resultados Esperados"])
+
+
+    with tab1:
+        # Create three columns for visual organization
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div class="info" style="height: 180px;">
+            <strong>🎯 Control Inmediato:</strong>
+            <ul>
+                <li>🛑 <strong>Moratoria inmediata:</strong> En barrios con más del 5% de viviendas turísticas</li>
+                <li>⬇️ <strong>Reducción de alojamientos:</strong> Máximo 5% por barrio (medida implementada en NY)</li>
+                <li>👮 <strong>Inspección reforzada:</strong> Nueva unidad pública anti-fraude</li>
+                <li>💰 <strong>Sanciones disuasorias:</strong> Hasta €600,000 por infracciones graves</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with col2:
+            st.markdown("""
+            <div class="info" style="height: 180px;">
+            <strong>🔧 Herramientas de Control:</strong>
+            <ul>
+                <li>📊 <strong>Registro público:</strong> Transparente de alojamientos turísticos</li>
+                <li>✅ <strong>Responsabilidad plataforma:</strong> Obligatoriedad de contrastar licencias</li>
+                <li>🤖 <strong>Tecnología de detección:</strong> IA para identificar anuncios ilegales</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+    with tab2:
+    
+        
+            # Create progress bars for visual impact
+            st.markdown("<div style='text-align: center; font-size: 1.2rem; color: #1E3A8A;'><strong>Objetivos a 36 meses</strong></div>", unsafe_allow_html=True)
+            
+            progress_data = [
+                ("Reducción alojamientos ilegales", 50),
+                ("Viviendas recuperadas", 45),
+                ("Estabilización precios", 35),
+                ("Modelo turístico sostenible", 30)
+            ]
+            
+            for label, value in progress_data:
+                st.markdown(f"**{label}**")
+                st.progress(value/100)
+                
+        
+            st.markdown("""
+            <div class="highlight">
+            <strong>Objetivos a 36 meses:</strong>
+            <ul>
+                <li>✅ Reducción 50% alojamientos ilegales</li>
+                <li>✅ Recuperación 9,500 viviendas para mercado residencial</li>
+                <li>✅ Estabilización precios alquiler en niveles 2022</li>
+                <li>✅ Modelo turístico sostenible y regulado</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
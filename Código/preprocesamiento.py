@@ -0,0 +1,432 @@
+# Pipeline de limpieza de listings.csv (versión importable de preprocesamiento.ipynb).
+# Cada etapa guarda su salida en caché con una clave que encadena el hash del CSV de entrada
+# y el código/parámetros de las etapas anteriores (incluidos los módulos del proyecto que usa
+# cada etapa): si cambia una etapa, solo se recalculan ella y las siguientes.
+#
+# Las etapas con parámetros ajustados a los datos (medianas, puntos de corte, rangos) los
+# registran en df.attrs['parametros'] y se guardan junto al CSV limpio (.parametros.json).
+# Con --trozos el pipeline recorre el CSV por trozos en dos pasadas (ajuste y aplicación),
+# para datos que no caben en memoria.
+#
+# A diferencia del notebook, no se generan fecha_inicio_host ni tiempo_como_anfitrion: dependen
+# de la fecha de ejecución (pd.Timestamp.today()), con lo que la salida no sería reproducible ni
+# cacheable, y ninguna sección del dashboard las usa.
+#
+# Uso desde la línea de comandos:
+#   python Código/preprocesamiento.py [--entrada data/listings.csv] [--salida data/limpio_airbnb_Barcelona.csv]
+#                                     [--trozos 500000]
+import argparse
+import ast
+import hashlib
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import (DIR_CACHE, RUTA_LISTINGS, RUTA_LIMPIO, RUTA_REGISTRO, PALABRAS_EMPRESA,
+                    PESOS_POPULARIDAD, CUANTILES_TERCILES)
+from anfitriones import clasificar_anfitriones
+from licencias import indice_registro, clasificar_licencias
+from cache_datos import hash_archivo, escribir_arrow, leer_arrow, pa
+from registro import leer_registro
+from sketches import CLAVE_NULO, claves_sketch, tabla_sketches, combinar_tablas, cuantil_tabla
+from transformaciones import (ajustar_medianas, rellenar_mediana_grupo, ajustar_cortes, categorizar_por_cortes,
+                              ajustar_rango, escalar_minmax, indice_ponderado, combinar_rangos)
+
+DIR_ETAPAS = Path(DIR_CACHE) / 'etapas'
+DIR_CODIGO = Path(__file__).resolve().parent
+
+# Coordenadas aproximadas del centro de Barcelona (Plaça de Catalunya)
+CENTRO_LAT, CENTRO_LON = 41.387019, 2.170047
+
+# Fecha que indica claramente que no hay reseñas
+FECHA_SIN_RESENAS = pd.Timestamp('1900-01-01')
+
+GRUPOS_PRECIO = ['room_type', 'neighbourhood']
+# Columna de origen -> (columna de categorías, etiquetas de menor a mayor)
+CATEGORIAS_TERCILES = {
+    'distancia_centro_km': ('categoria_distancia_centro', ['cerca', 'media', 'lejos']),
+    'price': ('categoria_precio', ['barato', 'medio', 'caro']),
+}
+# Columnas del índice de popularidad -> columna normalizada
+COLUMNAS_NORMALIZADAS = {'number_of_reviews': 'reviews_norm', 'reviews_per_month': 'rating_norm'}
+# Medidas con sketch de cuantiles por GRUPOS_PRECIO (ajuste por trozos y almacén de snapshots)
+MEDIDAS_SKETCH = ['price', 'distancia_centro_km']
+TAMANO_TROZO = 500_000
+
+
+def cargar_listings(ruta=RUTA_LISTINGS):
+    df = pd.read_csv(ruta)
+    # Cambiamos last_review de object a datetime
+    df['last_review'] = pd.to_datetime(df['last_review'], errors='coerce')
+    return df
+
+
+# ETAPAS
+# Cada etapa recibe el DataFrame de la anterior y devuelve uno nuevo (no modifica la entrada)
+
+def _con_parametros(df, etapa, parametros):
+    # Parámetros ajustados de la etapa, en los mismos argumentos que acepta para reaplicarlos
+    df.attrs['parametros'] = {**df.attrs.get('parametros', {}), etapa: parametros}
+    return df
+
+
+def rellenar_host_name(df):
+    df = df.copy()
+    # Reparamos los nulos de host_name con el nombre del mismo host_id y, si no existe, "sin datos"
+    df['host_name'] = df['host_name'].fillna(df.groupby('host_id')['host_name'].transform('first'))
+    df['host_name'] = df['host_name'].fillna('sin datos')
+    return df
+
+
+def rellenar_license(df):
+    df = df.copy()
+    df['license'] = df['license'].fillna('sin datos')
+    return df
+
+
+def imputar_precio(df, medianas=None):
+    df = df.copy()
+    # Mediana por tipo de habitación y barrio; el resto con la mediana general
+    medianas = medianas or ajustar_medianas(df, 'price', GRUPOS_PRECIO)
+    df['price'] = rellenar_mediana_grupo(df, 'price', medianas)
+    return _con_parametros(df, 'price', {'medianas': medianas})
+
+
+def rellenar_reviews(df):
+    df = df.copy()
+    # Sin reseñas: 0 reseñas al mes y una fecha centinela en last_review
+    df['reviews_per_month'] = df['reviews_per_month'].fillna(0)
+    df['has_reviews'] = df['last_review'].notnull().astype(int)  # antes de rellenar la fecha
+    df['last_review'] = df['last_review'].fillna(FECHA_SIN_RESENAS)
+    return df
+
+
+def anadir_tipo_anfitrion(df, palabras=PALABRAS_EMPRESA):
+    df = df.copy()
+    df['tipo_anfitrion'] = clasificar_anfitriones(df['host_name'], palabras)
+    return df
+
+
+def anadir_distancia_centro(df):
+    df = df.copy()
+    # Aproximación: 1 grado latitud ~ 111 km, 1 grado longitud ~ 85 km en Barcelona
+    df['distancia_centro_km'] = np.sqrt(
+        ((df['latitude'] - CENTRO_LAT) * 111) ** 2 + ((df['longitude'] - CENTRO_LON) * 85) ** 2
+    )
+    return df
+
+
+def anadir_categorias_terciles(df, cuantiles=CUANTILES_TERCILES, cortes=None):
+    df = df.copy()
+    # Puntos de corte en los cuantiles de cada columna (o los dados, p. ej. ajustados por trozos)
+    cortes = cortes or {col: ajustar_cortes(df[col], cuantiles) for col in CATEGORIAS_TERCILES}
+    for columna, (destino, etiquetas) in CATEGORIAS_TERCILES.items():
+        df[destino] = categorizar_por_cortes(df[columna], cortes[columna], etiquetas)
+    return _con_parametros(df, 'terciles', {'cuantiles': list(cuantiles), 'cortes': cortes})
+
+
+def anadir_indice_popularidad(df, pesos=PESOS_POPULARIDAD, rangos=None):
+    df = df.copy()
+    # Normalizamos número de reseñas y reseñas al mes a (0-1) y las combinamos con los pesos de config
+    valores = {col: df[col].fillna(0) for col in COLUMNAS_NORMALIZADAS}
+    rangos = rangos or {col: ajustar_rango(v) for col, v in valores.items()}
+    for columna, destino in COLUMNAS_NORMALIZADAS.items():
+        df[destino] = escalar_minmax(valores[columna], rangos[columna])
+    df['indice_popularidad'] = indice_ponderado(
+        {columna: df[destino] for columna, destino in COLUMNAS_NORMALIZADAS.items()}, pesos
+    )
+    return _con_parametros(df, 'indice_popularidad', {'pesos': dict(pesos), 'rangos': rangos})
+
+
+def anadir_rendimiento_economico(df):
+    df = df.copy()
+    df['rendimiento_economico_mensual'] = df['price'] * df['reviews_per_month'] * 30
+    return df
+
+
+def anadir_estado_licencia(df, registro=RUTA_REGISTRO):
+    df = df.copy()
+    # Licencia validada contra el registro oficial: valida / numero_desconocido / exenta / sin_licencia
+    numeros = leer_registro(registro, columnas=['NUMERO_REGISTRE_GENERALITAT'])['NUMERO_REGISTRE_GENERALITAT']
+    df['estado_licencia'] = clasificar_licencias(df['license'], indice_registro(numeros))
+    return df
+
+
+ETAPAS = [
+    ('host_name', rellenar_host_name),
+    ('license', rellenar_license),
+    ('price', imputar_precio),
+    ('reviews', rellenar_reviews),
+    ('tipo_anfitrion', anadir_tipo_anfitrion),
+    ('distancia_centro', anadir_distancia_centro),
+    ('terciles', anadir_categorias_terciles),
+    ('indice_popularidad', anadir_indice_popularidad),
+    ('rendimiento_economico', anadir_rendimiento_economico),
+    ('estado_licencia', anadir_estado_licencia),
+]
+
+# Ficheros adicionales que lee cada etapa: su hash también forma parte de la clave
+ENTRADAS_EXTRA = {
+    'estado_licencia': 'registro',
+}
+
+
+# CACHÉ POR ETAPAS
+
+def _modulo_proyecto(nombre):
+    ruta = DIR_CODIGO / f"{nombre.split('.')[0]}.py"
+    return ruta if ruta.exists() else None
+
+
+def _dependencias(ruta, vistas=None):
+    # Módulos del proyecto que importa un fichero, directa o indirectamente
+    vistas = set() if vistas is None else vistas
+    if ruta in vistas:
+        return vistas
+    vistas.add(ruta)
+    for nodo in ast.walk(ast.parse(ruta.read_text(encoding='utf-8'))):
+        if isinstance(nodo, ast.Import):
+            nombres = [alias.name for alias in nodo.names]
+        elif isinstance(nodo, ast.ImportFrom) and nodo.module and not nodo.level:
+            nombres = [nodo.module]
+        else:
+            continue
+        for nombre in nombres:
+            importado = _modulo_proyecto(nombre)
+            if importado is not None:
+                _dependencias(importado, vistas)
+    return vistas
+
+
+def _nombres_codigo(codigo):
+    # Nombres globales que usa una función, incluidas sus funciones anidadas y lambdas
+    nombres = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if inspect.iscode(constante):
+            nombres |= _nombres_codigo(constante)
+    return nombres
+
+
+def huella_codigo(funcion):
+    # Todo el código del que depende una etapa: su fuente, la de las funciones auxiliares de este
+    # módulo que llama, el valor de las constantes globales que lee y el contenido de los módulos
+    # del proyecto que usa (anfitriones, licencias, transformaciones, config...) y los que estos
+    # importan. Así un cambio en un patrón o una transformación invalida la etapa en caché.
+    fuentes, constantes, ficheros = {}, {}, set()
+    pendientes = [funcion]
+    while pendientes:
+        actual = pendientes.pop()
+        if actual.__qualname__ in fuentes:
+            continue
+        fuentes[actual.__qualname__] = inspect.getsource(actual)
+        for nombre in _nombres_codigo(actual.__code__):
+            if nombre not in actual.__globals__:
+                continue
+            valor = actual.__globals__[nombre]
+            if inspect.isfunction(valor) and valor.__globals__ is actual.__globals__:
+                pendientes.append(valor)
+                continue
+            modulo = inspect.getmodule(valor) if (inspect.ismodule(valor) or inspect.isfunction(valor)
+                                                  or inspect.isclass(valor)) else None
+            ruta = getattr(modulo, '__file__', None)
+            if ruta is not None and Path(ruta).resolve().parent == DIR_CODIGO:
+                _dependencias(Path(ruta).resolve(), ficheros)
+            elif isinstance(valor, (bool, int, float, str, tuple, list, dict, set, frozenset)):
+                constantes[nombre] = repr(valor)
+    h = hashlib.sha256()
+    for nombre in sorted(fuentes):
+        h.update(fuentes[nombre].encode())
+    h.update(repr(sorted(constantes.items())).encode())
+    for ruta in sorted(ficheros):
+        h.update(f"{ruta.name}:{hash_archivo(ruta)}".encode())
+    return h.hexdigest()
+
+
+def claves_etapas(huella_entrada, parametros=None):
+    # La clave de cada etapa depende de la anterior, de su código (huella_codigo) y de sus parámetros
+    parametros = parametros or {}
+    claves = []
+    anterior = huella_entrada
+    for nombre, funcion in ETAPAS:
+        h = hashlib.sha256(anterior.encode())
+        h.update(nombre.encode())
+        h.update(huella_codigo(funcion).encode())
+        # Argumentos efectivos: los valores por defecto (p. ej. pesos de config) y los dados
+        argumentos = {n: p.default for n, p in inspect.signature(funcion).parameters.items()
+                      if p.default is not inspect.Parameter.empty}
+        argumentos.update(parametros.get(nombre, {}))
+        h.update(repr(sorted(argumentos.items())).encode())
+        if nombre in ENTRADAS_EXTRA:
+            argumento = ENTRADAS_EXTRA[nombre]
+            ruta = parametros.get(nombre, {}).get(argumento, inspect.signature(funcion).parameters[argumento].default)
+            h.update(hash_archivo(ruta).encode())
+        anterior = h.hexdigest()
+        claves.append(anterior)
+    return claves
+
+
+def _ruta_etapa(i, nombre, clave):
+    return DIR_ETAPAS / f"{i:02d}_{nombre}-{clave[:16]}.arrow"
+
+
+def _guardar_etapa(i, nombre, clave, df):
+    DIR_ETAPAS.mkdir(parents=True, exist_ok=True)
+    destino = _ruta_etapa(i, nombre, clave)
+    escribir_arrow(df, destino)
+    # Solo guardamos la versión vigente de cada etapa
+    for antiguo in DIR_ETAPAS.glob(f"{i:02d}_{nombre}-*.arrow"):
+        if antiguo != destino:
+            antiguo.unlink(missing_ok=True)
+
+
+def ejecutar_pipeline(entrada=RUTA_LISTINGS, salida=None, parametros=None, usar_cache=True, verbose=False):
+    parametros = parametros or {}
+    usar_cache = usar_cache and pa is not None
+    claves = claves_etapas(hash_archivo(entrada), parametros)
+
+    # Buscamos la última etapa con salida en caché y seguimos desde ahí
+    inicio, df = 0, None
+    if usar_cache:
+        for i in range(len(ETAPAS) - 1, -1, -1):
+            ruta = _ruta_etapa(i, ETAPAS[i][0], claves[i])
+            if ruta.exists():
+                df = leer_arrow(ruta)
+                inicio = i + 1
+                if verbose:
+                    print(f"[caché] etapas 1-{inicio} ({ETAPAS[i][0]})")
+                break
+    if df is None:
+        df = cargar_listings(entrada)
+
+    for i in range(inicio, len(ETAPAS)):
+        nombre, funcion = ETAPAS[i]
+        t = time.perf_counter()
+        df = funcion(df, **parametros.get(nombre, {}))
+        if usar_cache:
+            _guardar_etapa(i, nombre, claves[i], df)
+        if verbose:
+            print(f"[{i + 1}/{len(ETAPAS)}] {nombre}: {time.perf_counter() - t:.3f}s")
+
+    if salida is not None:
+        # Guarda el DataFrame limpio en un nuevo archivo CSV (renombrado atómico: el dashboard
+        # puede estar leyendo la versión anterior mientras se regenera)
+        temporal = Path(salida).with_suffix('.tmp')
+        df.to_csv(temporal, index=False)
+        os.replace(temporal, salida)
+        guardar_parametros(salida, df.attrs.get('parametros', {}))
+    return df
+
+
+def ruta_parametros(salida):
+    return Path(salida).with_suffix('.parametros.json')
+
+
+def guardar_parametros(salida, parametros):
+    temporal = ruta_parametros(salida).with_suffix('.tmp')
+    temporal.write_text(json.dumps(parametros, indent=2, ensure_ascii=False))
+    os.replace(temporal, ruta_parametros(salida))
+
+
+# PIPELINE POR TROZOS
+
+def leer_trozos(ruta=RUTA_LISTINGS, tamano=TAMANO_TROZO):
+    for trozo in pd.read_csv(ruta, chunksize=tamano):
+        trozo['last_review'] = pd.to_datetime(trozo['last_review'], errors='coerce')
+        yield trozo
+
+
+def ajustar_por_trozos(trozos, cuantiles=CUANTILES_TERCILES, pesos=PESOS_POPULARIDAD):
+    # Primera pasada: resúmenes combinables de cada trozo -> parámetros de las etapas ajustadas,
+    # con los mismos argumentos que registran al ejecutarse en memoria
+    sketches = []
+    rangos = {col: [] for col in COLUMNAS_NORMALIZADAS}
+    for trozo in trozos:
+        sketches.append(tabla_sketches(anadir_distancia_centro(trozo), GRUPOS_PRECIO, MEDIDAS_SKETCH))
+        for col in rangos:
+            rangos[col].append(ajustar_rango(trozo[col].fillna(0)))
+    return {
+        **parametros_desde_sketches(combinar_tablas(sketches), cuantiles),
+        'indice_popularidad': {'pesos': dict(pesos), 'rangos': {c: combinar_rangos(r) for c, r in rangos.items()}},
+    }
+
+
+def parametros_desde_sketches(tabla, cuantiles=CUANTILES_TERCILES):
+    # Medianas de imputación y cortes de terciles a partir de sketches por tipo de habitación y
+    # barrio (de los trozos de una pasada o del almacén de snapshots), sin volver a leer los datos
+    precio = tabla[tabla['medida'] == 'price']
+    por_grupo = cuantil_tabla(precio, 'price', 0.5, por=GRUPOS_PRECIO).dropna()
+    medianas = {'grupos': GRUPOS_PRECIO, 'valores': [[*grupo, float(v)] for grupo, v in por_grupo.items()]}
+
+    # Precio tras rellenar por grupo: los nulos pasan a la clave de la mediana de su grupo; los de
+    # grupos sin mediana, a la de la mediana global de ese resultado
+    mediana_fila = por_grupo.reindex(pd.MultiIndex.from_frame(precio[GRUPOS_PRECIO])).to_numpy()
+    rellenar = (precio['clave'] == CLAVE_NULO).to_numpy() & ~np.isnan(mediana_fila)
+    precio = precio.assign(clave=np.where(rellenar, claves_sketch(mediana_fila), precio['clave']))
+    medianas['global'] = cuantil_tabla(precio, 'price', 0.5)
+    precio = precio.assign(clave=precio['clave'].replace(CLAVE_NULO, claves_sketch([medianas['global']])[0]))
+
+    return {
+        'price': {'medianas': medianas},
+        'terciles': {'cuantiles': list(cuantiles), 'cortes': {
+            'distancia_centro_km': [cuantil_tabla(tabla, 'distancia_centro_km', q) for q in cuantiles],
+            'price': [cuantil_tabla(precio, 'price', q) for q in cuantiles],
+        }},
+    }
+
+
+def ejecutar_por_trozos(entrada=RUTA_LISTINGS, salida=RUTA_LIMPIO, tamano_trozo=TAMANO_TROZO, verbose=False):
+    # Segunda pasada: todas las etapas trozo a trozo con los parámetros ajustados. host_name se
+    # repara con los nombres del mismo host_id dentro de cada trozo
+    t = time.perf_counter()
+    parametros = ajustar_por_trozos(leer_trozos(entrada, tamano_trozo))
+    if verbose:
+        print(f"[ajuste] {time.perf_counter() - t:.3f}s")
+    temporal = Path(salida).with_suffix('.tmp')
+    filas = 0
+    for i, trozo in enumerate(leer_trozos(entrada, tamano_trozo)):
+        for nombre, funcion in ETAPAS:
+            trozo = funcion(trozo, **parametros.get(nombre, {}))
+        trozo.to_csv(temporal, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        filas += len(trozo)
+        if verbose:
+            print(f"[trozo {i + 1}] {filas:,} filas")
+    os.replace(temporal, salida)
+    guardar_parametros(salida, parametros)
+    return filas
+
+
+def actualizar_limpio(entrada=RUTA_LISTINGS, salida=RUTA_LIMPIO, registro=RUTA_REGISTRO):
+    # Regenera el CSV limpio si falta o si listings.csv o el registro son más recientes
+    salida = Path(salida)
+    if not Path(entrada).exists():
+        return False
+    fuentes = [Path(entrada)] + ([Path(registro)] if Path(registro).exists() else [])
+    if salida.exists() and all(f.stat().st_mtime_ns <= salida.stat().st_mtime_ns for f in fuentes):
+        return False
+    ejecutar_pipeline(entrada, salida)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Limpieza de listings.csv de InsideAirbnb")
+    parser.add_argument('--entrada', default=RUTA_LISTINGS, help="CSV original de InsideAirbnb")
+    parser.add_argument('--salida', default=RUTA_LIMPIO, help="CSV limpio de salida")
+    parser.add_argument('--sin-cache', action='store_true', help="Recalcula todas las etapas")
+    parser.add_argument('--trozos', type=int, help="Procesa el CSV por trozos de este número de filas")
+    args = parser.parse_args()
+
+    t = time.perf_counter()
+    if args.trozos:
+        filas = ejecutar_por_trozos(args.entrada, args.salida, args.trozos, verbose=True)
+    else:
+        filas = len(ejecutar_pipeline(args.entrada, args.salida, usar_cache=not args.sin_cache, verbose=True))
+    print(f"{filas:,} filas -> {args.salida} ({time.perf_counter() - t:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
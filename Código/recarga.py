@@ -0,0 +1,75 @@
+# Recarga en caliente de los datos del dashboard.
+# La versión de los datos es la huella (tamaño + fecha de modificación) de los ficheros fuente.
+# Cuando cambia alguno (p. ej. se deja un listings.csv nuevo en data/), la versión nueva se
+# prepara en un hilo en segundo plano mientras las sesiones siguen sirviendo la anterior, y se
+# sustituye de forma atómica al terminar. Si la recarga falla se mantiene la versión vigente.
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from cache_datos import huella_archivos
+
+INTERVALO_COMPROBACION = 30  # segundos entre comprobaciones de los ficheros
+
+
+def version_fuentes(*rutas):
+    return huella_archivos(*[r for r in rutas if Path(r).exists()])
+
+
+class GestorDatos:
+    def __init__(self, preparar, cargar, fuentes, intervalo=INTERVALO_COMPROBACION):
+        # preparar() regenera los derivados si hace falta; cargar(version) -> DatosCompartidos
+        self._preparar = preparar
+        self._cargar = cargar
+        self._fuentes = fuentes
+        self._intervalo = intervalo
+        self._cerrojo = threading.Lock()
+        self._datos = None
+        self._cargado = None
+        self._comprobado = 0.0
+        self._hilo = None
+        self.error = None
+
+    def _construir(self):
+        self._preparar()
+        version = version_fuentes(*self._fuentes)
+        return self._cargar(version)
+
+    def _recargar(self, anterior):
+        try:
+            datos = self._construir()
+            # Precargamos lo que ya se usaba en la versión anterior para que el cambio no
+            # penalice a la primera sesión que lo pida
+            datos.calentar(anterior.cargados())
+        except Exception as e:  # seguimos sirviendo la versión anterior
+            self.error = f"{type(e).__name__}: {e}"
+            return
+        with self._cerrojo:
+            self._datos, self._cargado, self.error = datos, datetime.now(), None
+
+    def actual(self):
+        with self._cerrojo:
+            if self._datos is None:
+                # Primer acceso: carga síncrona (no hay versión anterior que servir)
+                self._datos, self._cargado = self._construir(), datetime.now()
+                self._comprobado = time.monotonic()
+            elif time.monotonic() - self._comprobado >= self._intervalo and not self.recargando:
+                self._comprobado = time.monotonic()
+                if version_fuentes(*self._fuentes) != self._datos.version:
+                    self._hilo = threading.Thread(target=self._recargar, args=(self._datos,),
+                                                  name='recarga-datos', daemon=True)
+                    self._hilo.start()
+            return self._datos
+
+    @property
+    def recargando(self):
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def estado(self):
+        return {
+            'version': self._datos.version if self._datos is not None else None,
+            'cargado': self._cargado,
+            'recargando': self.recargando,
+            'error': self.error,
+        }
@@ -0,0 +1,72 @@
+# Lectura del registro oficial de viviendas de uso turístico (Generalitat / Ajuntament).
+# El CSV usa coma decimal en las coordenadas y códigos con ceros a la izquierda: se lee con un
+# mapa de tipos explícito y coma decimal en el propio parser (sin pasar por texto), en trozos
+# para exportaciones grandes, y se devuelve un DataFrame compacto listo para los cruces.
+import numpy as np
+import pandas as pd
+
+from config import RUTA_REGISTRO
+from cache_datos import cargar_en_cache
+
+TIPOS_REGISTRO = {
+    'N_EXPEDIENT': 'string',
+    'CODI_DISTRICTE': 'category',   # '01'..'10': texto para conservar los ceros
+    'NOM_DISTRICTE': 'category',
+    'CODI_BARRI': 'category',       # '01'..'73'
+    'NOM_BARRI': 'category',
+    'TIPUS_CARRER': 'category',
+    'CARRER': 'category',
+    'TIPUS_NUM': 'category',
+    'NUM1': 'Int32',
+    'LLETRA1': 'category',
+    'NUM2': 'Int32',
+    'LLETRA2': 'category',
+    'BLOC': 'category',
+    'PORTAL': 'category',
+    'ESCALA': 'category',
+    'PIS': 'category',
+    'PORTA': 'category',
+    'NUMERO_REGISTRE_GENERALITAT': 'string',
+    'NUMERO_PLACES': 'Int16',
+    'LONGITUD_X': 'float32',        # "2,17017206787341" -> 2.170172 (error < 0.5 m)
+    'LATITUD_Y': 'float32',
+}
+
+# Columnas mínimas para los cruces espaciales y de licencias
+COLUMNAS_CRUCE = ['N_EXPEDIENT', 'CODI_BARRI', 'NOM_BARRI', 'NUMERO_REGISTRE_GENERALITAT',
+                  'NUMERO_PLACES', 'LONGITUD_X', 'LATITUD_Y']
+
+TAMANO_TROZO = 200_000
+
+
+def iterar_registro(ruta=RUTA_REGISTRO, columnas=None, tamano_trozo=TAMANO_TROZO):
+    # Lectura en streaming: un DataFrame tipado por trozo
+    cabecera = pd.read_csv(ruta, nrows=0).columns
+    columnas = [c for c in (columnas or cabecera) if c in cabecera]
+    tipos = {c: t for c, t in TIPOS_REGISTRO.items() if c in columnas}
+    yield from pd.read_csv(ruta, usecols=columnas, dtype=tipos, decimal=',', chunksize=tamano_trozo)
+
+
+def _concatenar(trozos):
+    if len(trozos) == 1:
+        return trozos[0]
+    # Mismas categorías en todos los trozos para que pd.concat conserve las columnas categóricas
+    # (un trozo con una columna vacía trae categorías de tipo float)
+    for col in trozos[0].columns:
+        if isinstance(trozos[0][col].dtype, pd.CategoricalDtype):
+            categorias = pd.unique(np.concatenate(
+                [t[col].cat.categories.astype(str).to_numpy(object) for t in trozos]
+            ))
+            tipo = pd.CategoricalDtype(categorias)
+            for t in trozos:
+                t[col] = pd.Categorical(t[col].astype(object), dtype=tipo)
+    return pd.concat(trozos, ignore_index=True)
+
+
+def leer_registro(ruta=RUTA_REGISTRO, columnas=None, tamano_trozo=TAMANO_TROZO):
+    return _concatenar(list(iterar_registro(ruta, columnas, tamano_trozo)))
+
+
+def cargar_registro(ruta=RUTA_REGISTRO):
+    # Registro completo con caché columnar en disco (se regenera si cambia el CSV)
+    return cargar_en_cache(ruta, leer_registro, repr(TIPOS_REGISTRO))
@@ -0,0 +1,76 @@
+# Sketch de cuantiles con error relativo acotado (estilo DDSketch).
+# Cada valor positivo cae en el cubo logarítmico k = ceil(log_gamma(x)); guardando solo
+# el conteo por cubo, los sketches se combinan sumando conteos y cualquier cuantil se
+# estima con un error relativo <= ALFA sin volver a recorrer los datos.
+import numpy as np
+import pandas as pd
+
+ALFA = 0.01
+GAMMA = (1 + ALFA) / (1 - ALFA)
+_LOG_GAMMA = np.log(GAMMA)
+
+# Cubo reservado para ceros y negativos (p. ej. rendimiento de anuncios sin reseñas)
+CLAVE_CERO = np.iinfo(np.int32).min
+# Cubo reservado para nulos: cuentan en las filas del grupo pero no en los cuantiles
+CLAVE_NULO = np.iinfo(np.int32).max
+
+
+def claves_sketch(valores):
+    valores = np.asarray(valores, dtype='float64')
+    claves = np.full(len(valores), CLAVE_CERO, dtype='int32')
+    positivos = valores > 0
+    claves[positivos] = np.ceil(np.log(valores[positivos]) / _LOG_GAMMA).astype('int32')
+    return claves
+
+
+def valor_clave(claves):
+    # Punto medio (relativo) del cubo: estimación con error <= ALFA
+    claves = np.asarray(claves)
+    valores = 2 * np.power(GAMMA, claves.astype('float64')) / (GAMMA + 1)
+    return np.where(claves == CLAVE_CERO, 0.0, valores)
+
+
+def cuantil_conteos(claves, conteos, q):
+    # claves/conteos: histograma (posiblemente con claves repetidas de varios sketches)
+    conteos = pd.Series(np.asarray(conteos)).groupby(np.asarray(claves)).sum().sort_index()
+    total = conteos.sum()
+    if total == 0:
+        return np.nan
+    acumulado = conteos.cumsum().to_numpy()
+    rango = q * (total - 1)
+    return float(valor_clave(conteos.index[np.searchsorted(acumulado, rango, side='right')]))
+
+
+# TABLAS DE SKETCHES AGRUPADOS
+# Una fila por (dimensiones..., clave, medida) con su conteo. Combinar sketches de trozos o
+# snapshots es concatenar y sumar conteos; un cuantil solo recorre las claves de los grupos
+# pedidos, no las filas de origen.
+
+def tabla_sketches(df, dimensiones, medidas):
+    tablas = []
+    for medida in medidas:
+        valores = df[medida].to_numpy(dtype='float64', na_value=np.nan)
+        claves = claves_sketch(valores)
+        claves[np.isnan(valores)] = CLAVE_NULO
+        tabla = df[dimensiones].copy()
+        tabla['clave'] = claves
+        tabla = tabla.groupby(dimensiones + ['clave'], sort=False, observed=True, dropna=False).size()
+        tabla = tabla.rename('conteo').reset_index()
+        tabla['medida'] = medida
+        tablas.append(tabla)
+    return pd.concat(tablas, ignore_index=True)
+
+
+def combinar_tablas(tablas):
+    tabla = pd.concat(tablas, ignore_index=True)
+    columnas = [c for c in tabla.columns if c != 'conteo']
+    return tabla.groupby(columnas, sort=False, observed=True, dropna=False)['conteo'].sum().reset_index()
+
+
+def cuantil_tabla(tabla, medida, q, por=None):
+    tabla = tabla[(tabla['medida'] == medida) & (tabla['clave'] != CLAVE_NULO)]
+    if por is None:
+        return cuantil_conteos(tabla['clave'], tabla['conteo'], q)
+    return tabla.groupby(por, observed=True).apply(
+        lambda g: cuantil_conteos(g['clave'], g['conteo'], q), include_groups=False
+    )
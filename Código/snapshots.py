@@ -0,0 +1,203 @@
+# Almacén de snapshots sucesivos de listings.csv (InsideAirbnb publica uno por trimestre).
+# Cada snapshot se guarda en su partición fecha=AAAA-MM-DD y, al ingerirlo, se actualizan de
+# forma incremental la primera/última aparición de cada anuncio, la serie de conteos y los
+# sketches de cuantiles de precio y distancia al centro por barrio y tipo de habitación, sin
+# volver a leer los snapshots anteriores: los cuantiles de cualquier conjunto de snapshots se
+# obtienen sumando los conteos de sus sketches.
+#
+#   python Código/snapshots.py ingestar data/listings.csv [--fecha 2025-03-04]
+#   python Código/snapshots.py serie [--frecuencia anual|mensual]
+#   python Código/snapshots.py cuantiles [--medida price] [--por neighbourhood] [--fechas 2025-03-04 ...]
+import argparse
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from config import DIR_DATOS
+from cache_datos import escribir_arrow, leer_arrow, pa
+from sketches import tabla_sketches, combinar_tablas, cuantil_tabla
+from preprocesamiento import GRUPOS_PRECIO, MEDIDAS_SKETCH, anadir_distancia_centro
+
+DIR_SNAPSHOTS = DIR_DATOS / 'snapshots'
+COLUMNAS_SNAPSHOT = ['id', 'host_id', 'neighbourhood', 'room_type', 'price', 'license', 'latitude', 'longitude']
+
+
+class AlmacenSnapshots:
+    def __init__(self, directorio=DIR_SNAPSHOTS):
+        self.dir = Path(directorio)
+        self.ruta_anuncios = self.dir / 'anuncios.arrow'   # id, primera_vez, ultima_vez, n_snapshots
+        self.ruta_serie = self.dir / 'serie.csv'            # una fila por snapshot
+        self.ruta_sketches = self.dir / 'sketches.arrow'    # fecha + GRUPOS_PRECIO + clave + conteo + medida
+
+    def _particion(self, fecha):
+        return self.dir / f"fecha={fecha.date().isoformat()}" / 'listings.arrow'
+
+    def fechas(self):
+        return sorted(pd.Timestamp(p.name.split('=', 1)[1]) for p in self.dir.glob('fecha=*'))
+
+    def anuncios(self):
+        if not self.ruta_anuncios.exists():
+            return pd.DataFrame({'id': pd.Series(dtype='int64'),
+                                 'primera_vez': pd.Series(dtype='datetime64[ns]'),
+                                 'ultima_vez': pd.Series(dtype='datetime64[ns]'),
+                                 'n_snapshots': pd.Series(dtype='int32')})
+        return leer_arrow(self.ruta_anuncios)
+
+    def serie(self):
+        if not self.ruta_serie.exists():
+            return pd.DataFrame(columns=['fecha', 'activos', 'nuevos', 'desaparecidos'])
+        return pd.read_csv(self.ruta_serie, parse_dates=['fecha'])
+
+    def ingestar(self, ruta_listings, fecha=None):
+        if pa is None:
+            raise RuntimeError("El almacén de snapshots necesita pyarrow")
+        df = pd.read_csv(ruta_listings, usecols=lambda c: c in COLUMNAS_SNAPSHOT + ['last_review'])
+        if fecha is None:
+            # Sin fecha explícita usamos la reseña más reciente (≈ fecha de extracción)
+            fecha = pd.to_datetime(df['last_review'], errors='coerce').max()
+        fecha = pd.Timestamp(fecha).normalize()
+
+        fechas = self.fechas()
+        if fecha in fechas:
+            return self.serie()
+
+        particion = self._particion(fecha)
+        particion.parent.mkdir(parents=True, exist_ok=True)
+        escribir_arrow(df[[c for c in COLUMNAS_SNAPSHOT if c in df.columns]], particion)
+
+        if fechas and fecha < fechas[-1]:
+            # Snapshot antiguo que llega tarde: rehacemos índices a partir de las particiones
+            self.reconstruir()
+        else:
+            self._actualizar(df['id'].drop_duplicates(), fecha, fechas[-1] if fechas else None)
+            self._anadir_sketches(df, fecha)
+        return self.serie()
+
+    def _actualizar(self, ids, fecha, anterior):
+        anuncios = self.anuncios()
+        conocidos = ids.isin(anuncios['id'])
+        activos_antes = anuncios.loc[anuncios['ultima_vez'] == anterior, 'id'] if anterior is not None else ids[:0]
+
+        nuevos = ids[~conocidos]
+        desaparecidos = int((~activos_antes.isin(ids)).sum())
+
+        vistos = anuncios['id'].isin(ids)
+        anuncios.loc[vistos, 'ultima_vez'] = fecha
+        anuncios.loc[vistos, 'n_snapshots'] += 1
+        anuncios = pd.concat([anuncios, pd.DataFrame({
+            'id': nuevos.to_numpy(),
+            'primera_vez': fecha,
+            'ultima_vez': fecha,
+            'n_snapshots': 1,
+        })], ignore_index=True).astype({'n_snapshots': 'int32'})
+        escribir_arrow(anuncios, self.ruta_anuncios)
+
+        fila = pd.DataFrame([{'fecha': fecha, 'activos': len(ids), 'nuevos': len(nuevos),
+                              'desaparecidos': desaparecidos}])
+        serie = pd.concat([self.serie(), fila], ignore_index=True) if self.ruta_serie.exists() else fila
+        serie.to_csv(self.ruta_serie, index=False, date_format='%Y-%m-%d')
+
+    def _sketches_snapshot(self, df, fecha):
+        # Particiones antiguas sin coordenadas: solo el sketch de precio
+        if {'latitude', 'longitude'} <= set(df.columns):
+            df = anadir_distancia_centro(df)
+        medidas = [m for m in MEDIDAS_SKETCH if m in df.columns]
+        tabla = tabla_sketches(df, GRUPOS_PRECIO, medidas)
+        tabla.insert(0, 'fecha', fecha)
+        return tabla
+
+    def _anadir_sketches(self, df, fecha):
+        # Solo se reescriben los sketches (cientos de filas por snapshot), no los anuncios
+        nueva = self._sketches_snapshot(df, fecha)
+        if self.ruta_sketches.exists():
+            anteriores = leer_arrow(self.ruta_sketches)
+            nueva = pd.concat([anteriores[anteriores['fecha'] != fecha], nueva], ignore_index=True)
+        escribir_arrow(nueva.astype({c: 'category' for c in GRUPOS_PRECIO + ['medida']}), self.ruta_sketches)
+
+    def reconstruir(self):
+        self.ruta_anuncios.unlink(missing_ok=True)
+        self.ruta_serie.unlink(missing_ok=True)
+        self.ruta_sketches.unlink(missing_ok=True)
+        anterior = None
+        for fecha in self.fechas():
+            df = leer_arrow(self._particion(fecha))
+            self._actualizar(df['id'].drop_duplicates(), fecha, anterior)
+            self._anadir_sketches(df, fecha)
+            anterior = fecha
+
+    def eliminar(self, fecha):
+        shutil.rmtree(self._particion(pd.Timestamp(fecha)).parent, ignore_errors=True)
+        self.reconstruir()
+
+    # CUANTILES
+
+    def sketches(self, fechas=None):
+        # Sketches combinados de los snapshots dados (por defecto, todos)
+        if not self.ruta_sketches.exists():
+            return None
+        tabla = leer_arrow(self.ruta_sketches)
+        if fechas is not None:
+            tabla = tabla[tabla['fecha'].isin(pd.to_datetime(list(fechas)))]
+        return combinar_tablas([tabla.drop(columns='fecha')])
+
+    def cuantil(self, medida, q, por=None, fechas=None, **filtros):
+        # Cuantil de una medida, global o por grupo, sin leer ninguna partición de anuncios
+        tabla = self.sketches(fechas)
+        if tabla is None:
+            return None
+        for dim, valor in filtros.items():
+            tabla = tabla[tabla[dim] == valor]
+        return cuantil_tabla(tabla, medida, q, por)
+
+    # SERIES PARA EL DASHBOARD
+
+    def serie_periodica(self, frecuencia='anual'):
+        # Último snapshot de cada periodo: activos, nuevos y variación respecto al periodo anterior
+        serie = self.serie()
+        periodo = pd.to_datetime(serie['fecha']).dt.to_period('Y' if frecuencia == 'anual' else 'M')
+        agrupada = serie.groupby(periodo).agg(activos=('activos', 'last'), nuevos=('nuevos', 'sum'))
+        agrupada['variacion'] = agrupada['activos'].diff()
+        agrupada['variacion_pct'] = agrupada['activos'].pct_change() * 100
+        return agrupada.rename_axis('periodo').reset_index()
+
+    def cuota_recientes(self, meses=24):
+        # % de los anuncios activos en el último snapshot que aparecieron en los últimos `meses`
+        fechas = self.fechas()
+        if not fechas or fechas[-1] - pd.DateOffset(months=meses) < fechas[0]:
+            return None  # el almacén no cubre la ventana completa
+        anuncios = self.anuncios()
+        activos = anuncios[anuncios['ultima_vez'] == fechas[-1]]
+        recientes = activos['primera_vez'] > fechas[-1] - pd.DateOffset(months=meses)
+        return float(recientes.mean() * 100)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Almacén de snapshots de listings.csv")
+    sub = parser.add_subparsers(dest='orden', required=True)
+    ingesta = sub.add_parser('ingestar', help="Añade un snapshot al almacén")
+    ingesta.add_argument('ruta', help="listings.csv del snapshot")
+    ingesta.add_argument('--fecha', help="Fecha del snapshot (por defecto, la última reseña)")
+    serie = sub.add_parser('serie', help="Muestra la serie de conteos")
+    serie.add_argument('--frecuencia', choices=['anual', 'mensual'], default='anual')
+    cuantiles = sub.add_parser('cuantiles', help="Cuartiles de una medida a partir de los sketches")
+    cuantiles.add_argument('--medida', choices=MEDIDAS_SKETCH, default='price')
+    cuantiles.add_argument('--por', choices=GRUPOS_PRECIO, help="Cuartiles por grupo")
+    cuantiles.add_argument('--fechas', nargs='+', help="Snapshots a combinar (por defecto, todos)")
+    args = parser.parse_args()
+
+    almacen = AlmacenSnapshots()
+    if args.orden == 'ingestar':
+        print(almacen.ingestar(args.ruta, args.fecha).tail(5).to_string(index=False))
+    elif args.orden == 'cuantiles':
+        resultado = {f"q{int(q * 100)}": almacen.cuantil(args.medida, q, args.por, args.fechas) for q in (0.25, 0.5, 0.75)}
+        if args.por is None:
+            print(resultado)
+        else:
+            print(pd.DataFrame(resultado).round(2).to_string())
+    else:
+        print(almacen.serie_periodica(args.frecuencia).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# Transformaciones vectorizadas de la limpieza: relleno con la mediana del grupo, categorías
+# por cuantiles (searchsorted sobre los puntos de corte), normalización min-max e índices
+# ponderados. Cada una se separa en ajustar (parámetros calculados sobre los datos, en
+# estructuras JSON que se guardan con la salida) y aplicar (operación por filas con esos
+# parámetros), de modo que también funcionan por trozos sobre datos que no caben en memoria:
+# cada trozo aporta un resumen combinable (mínimo/máximo exactos aquí; tablas de sketches de
+# cuantiles en sketches.py), se ajusta una vez con los resúmenes combinados y se aplica trozo
+# a trozo.
+import numpy as np
+import pandas as pd
+
+
+def _flotantes(valores):
+    return np.asarray(valores, dtype='float64')
+
+
+# RELLENO CON LA MEDIANA DEL GRUPO
+
+def ajustar_medianas(df, columna, grupos):
+    # Medianas por grupo y, para los grupos sin ningún valor, la mediana global tras rellenar
+    medianas = df.groupby(grupos, observed=True)[columna].median().dropna()
+    parametros = {
+        'grupos': list(grupos),
+        'valores': [[*(clave if isinstance(clave, tuple) else (clave,)), float(valor)]
+                    for clave, valor in medianas.items()],
+    }
+    parametros['global'] = float(np.nanmedian(_medianas_filas(df, parametros, columna)))
+    return parametros
+
+
+def _medianas_filas(df, parametros, columna):
+    # Valor de cada fila, o la mediana de su grupo si es nulo (NaN si el grupo no tiene mediana)
+    grupos = parametros['grupos']
+    tabla = pd.DataFrame(parametros['valores'], columns=grupos + ['mediana'])
+    posiciones = pd.MultiIndex.from_frame(tabla[grupos]).get_indexer(pd.MultiIndex.from_frame(df[grupos]))
+    medianas = np.where(posiciones >= 0, tabla['mediana'].to_numpy()[posiciones], np.nan)
+    valores = _flotantes(df[columna])
+    return np.where(np.isnan(valores), medianas, valores)
+
+
+def rellenar_mediana_grupo(df, columna, parametros):
+    valores = _medianas_filas(df, parametros, columna)
+    return pd.Series(np.where(np.isnan(valores), parametros['global'], valores), index=df.index, name=columna)
+
+
+# CATEGORÍAS POR CUANTILES
+
+def ajustar_cortes(valores, cuantiles):
+    return [float(c) for c in np.nanquantile(_flotantes(valores), cuantiles)]
+
+
+def categorizar_por_cortes(valores, cortes, etiquetas):
+    # v <= cortes[0] -> etiquetas[0], cortes[0] < v <= cortes[1] -> etiquetas[1]... (NaN a la última)
+    codigos = np.searchsorted(np.asarray(cortes), _flotantes(valores), side='left')
+    return pd.Series(pd.Categorical.from_codes(codigos, categories=etiquetas),
+                     index=getattr(valores, 'index', None), name=getattr(valores, 'name', None))
+
+
+# NORMALIZACIÓN MIN-MAX E ÍNDICES PONDERADOS
+
+def ajustar_rango(valores):
+    valores = _flotantes(valores)
+    return [float(np.nanmin(valores)), float(np.nanmax(valores))]
+
+
+def escalar_minmax(valores, rango):
+    # A [0, 1] con el rango ajustado; una columna constante queda en 0 (como MinMaxScaler)
+    minimo, maximo = rango
+    valores = _flotantes(valores)
+    return (valores - minimo) / (maximo - minimo) if maximo > minimo else np.zeros_like(valores)
+
+
+def indice_ponderado(columnas, pesos):
+    # columnas: nombre -> valores normalizados; pesos: nombre -> peso
+    return sum(peso * _flotantes(columnas[nombre]) for nombre, peso in pesos.items())
+
+
+# RESÚMENES COMBINABLES PARA AJUSTAR POR TROZOS (los cuantiles, con sketches.tabla_sketches)
+
+def combinar_rangos(rangos):
+    rangos = list(rangos)
+    return [min(r[0] for r in rangos), max(r[1] for r in rangos)]
@@ -0,0 +1,58 @@
+# Compara la clasificación de anfitriones del notebook (Series.apply por fila)
+# con la versión sobre nombres únicos y patrón compilado de Código/anfitriones.py.
+#
+#   python benchmarks/bench_anfitriones.py [--factor 50] [--repeticiones 5]
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import RUTA_LISTINGS, PALABRAS_EMPRESA
+from anfitriones import clasificar_anfitriones
+
+
+# Versión original de preprocesamiento.ipynb
+def categorizar_anfitrion(nombre):
+    if pd.isnull(nombre):
+        return 'desconocido'
+    nombre = nombre.lower()
+    palabras_empresa = ['company', 'empresa', 'rentals', 'apartments', 'group', 'management', 'hostel', 'hotel']
+    if any(palabra in nombre for palabra in palabras_empresa):
+        return 'empresa'
+    else:
+        return 'particular'
+
+
+def cronometrar(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - t)
+    return min(tiempos), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--factor', type=int, default=50, help="Veces que se replica listings.csv")
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args = parser.parse_args()
+
+    nombres = pd.read_csv(RUTA_LISTINGS, usecols=['host_name'])['host_name']
+    nombres = pd.concat([nombres] * args.factor, ignore_index=True)
+    print(f"{len(nombres):,} filas, {nombres.nunique():,} nombres únicos")
+
+    t_apply, original = cronometrar(lambda: nombres.apply(categorizar_anfitrion), args.repeticiones)
+    t_motor, nuevo = cronometrar(lambda: clasificar_anfitriones(nombres, PALABRAS_EMPRESA), args.repeticiones)
+
+    assert original.equals(nuevo.rename(original.name)), "Las clasificaciones no coinciden"
+    print(f"apply por fila:      {t_apply * 1000:8.1f} ms")
+    print(f"nombres únicos+regex: {t_motor * 1000:8.1f} ms  (x{t_apply / t_motor:.1f})")
+
+
+if __name__ == '__main__':
+    main()
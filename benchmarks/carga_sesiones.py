@@ -0,0 +1,278 @@
+# Prueba de carga con varias sesiones concurrentes contra un servidor Streamlit local.
+# Arranca app.py con `streamlit run`, abre N sesiones simuladas por el websocket de Streamlit
+# (/_stcore/stream, mensajes protobuf BackMsg/ForwardMsg) y cada una repite recorridos
+# realistas de navegación y filtros con pausas entre clics. Para cada número de sesiones
+# informa de interacciones/s, latencia p50/p95/p99 (clic -> script_finished), CPU y RSS del
+# servidor. Todas las sesiones comparten un proceso y un GIL: si la CPU se queda cerca del
+# 100 % (un núcleo) mientras la latencia crece con N, el cuello de botella es el GIL; el
+# RSS por sesión muestra lo que cuesta cada sesión (estado y vistas por sesión).
+#
+#   python benchmarks/carga_sesiones.py [--sesiones 1 2 4 8 16] [--duracion 30] [--pausa 1.0]
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+try:
+    import psutil
+except ImportError:  # sin psutil se lee /proc (solo Linux)
+    psutil = None
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Slider_pb2 import Slider
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import RAIZ
+
+RUTA_APP = RAIZ / 'Código' / 'app.py'
+DIR_RESULTADOS = Path(__file__).resolve().parent / 'resultados'
+INTERVALO_MUESTREO = 0.5
+
+# Recorridos: ('pagina', título) o (key o etiqueta del widget, opción); una etiqueta solo vale si
+# ningún otro widget de la página la comparte (las tres radios de Estructura usan la misma)
+RECORRIDOS = {
+    'lector': [
+        ('pagina', "📊 Inicio"),
+        ('pagina', "📝 Recomendaciones"),
+        ('pagina', "🔍 Conclusiones"),
+        ('pagina', "👥 Implicaciones Socioeconómicas"),
+    ],
+    'mapa': [
+        ('pagina', "📊 Inicio"),
+        ("Mostrar alojamientos:", "Sin licencia"),
+        ("Nivel de detalle:", "Zoom 13"),
+        ("Nivel de detalle:", "Calle"),
+        ("Radio (metros):", 1000),
+        ("Mostrar alojamientos:", "Todos"),
+    ],
+    'analista': [
+        ('pagina', "🏘️ Estructura del Mercado"),
+        ("host_viz", "Números totales"),
+        ('pagina', "💰 Impacto Económico"),
+        ('pagina', "🗺️ Geografía de la Turistificación"),
+        ('pagina', "📊 Inicio"),
+    ],
+}
+
+
+# SERVIDOR
+
+def arrancar_servidor(puerto):
+    proceso = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', str(RUTA_APP),
+         '--server.headless', 'true', '--server.port', str(puerto),
+         '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+        cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://localhost:{puerto}/_stcore/health"
+    for _ in range(120):
+        try:
+            with urllib.request.urlopen(url, timeout=1) as respuesta:
+                if respuesta.status == 200:
+                    return proceso
+        except OSError:
+            time.sleep(0.5)
+    proceso.kill()
+    raise RuntimeError("El servidor de Streamlit no arrancó")
+
+
+def estado_proceso(pid):
+    # (segundos de CPU acumulados, RSS en bytes, hilos)
+    if psutil is not None:
+        p = psutil.Process(pid)
+        cpu = p.cpu_times()
+        return cpu.user + cpu.system, p.memory_info().rss, p.num_threads()
+    campos = Path(f"/proc/{pid}/stat").read_text().rsplit(')', 1)[1].split()
+    ticks = os.sysconf('SC_CLK_TCK')
+    status = dict(linea.split(':', 1) for linea in Path(f"/proc/{pid}/status").read_text().splitlines())
+    return ((int(campos[11]) + int(campos[12])) / ticks,
+            int(status['VmRSS'].split()[0]) * 1024, int(status['Threads']))
+
+
+async def muestrear(pid, muestras, parar):
+    anterior_cpu, anterior_t = estado_proceso(pid)[0], time.perf_counter()
+    while not parar.is_set():
+        await asyncio.sleep(INTERVALO_MUESTREO)
+        cpu, rss, hilos = estado_proceso(pid)
+        ahora = time.perf_counter()
+        muestras.append({'cpu_pct': (cpu - anterior_cpu) / (ahora - anterior_t) * 100,
+                         'rss': rss, 'hilos': hilos})
+        anterior_cpu, anterior_t = cpu, ahora
+
+
+# SESIÓN SIMULADA
+
+class Sesion:
+    def __init__(self, puerto):
+        self.url = f"ws://localhost:{puerto}/_stcore/stream"
+        self.widgets = {}   # key o etiqueta -> (id, tipo, opciones), de la página mostrada
+        self.ambiguas = set()  # etiquetas compartidas por varios widgets de la página
+        self.estados = {}   # id -> WidgetState enviado en cada rerun, como hace el navegador
+        self.errores = 0
+
+    async def __aenter__(self):
+        self.ws = await websockets.connect(self.url, subprotocols=['streamlit'], max_size=None)
+        return self
+
+    async def __aexit__(self, *_):
+        await self.ws.close()
+
+    async def rerun(self):
+        mensaje = BackMsg()
+        mensaje.rerun_script.widget_states.widgets.extend(self.estados.values())
+        self.widgets, self.ambiguas = {}, set()
+        t = time.perf_counter()
+        await self.ws.send(mensaje.SerializeToString())
+        while True:
+            recibido = ForwardMsg()
+            recibido.ParseFromString(await self.ws.recv())
+            tipo = recibido.WhichOneof('type')
+            if tipo == 'delta' and recibido.delta.WhichOneof('type') == 'new_element':
+                self._anotar(recibido.delta.new_element)
+            elif tipo == 'script_finished':
+                return time.perf_counter() - t
+
+    def _anotar(self, elemento):
+        tipo = elemento.WhichOneof('type')
+        if tipo == 'exception':
+            self.errores += 1
+        elif tipo in ('radio', 'selectbox', 'slider'):
+            widget = getattr(elemento, tipo)
+            if tipo == 'slider' and widget.type == Slider.Type.SELECT_SLIDER:
+                tipo = 'select_slider'
+            datos = (widget.id, tipo, list(widget.options))
+            # Id de Streamlit: $$ID-<hash>-<key>, con 'None' si el widget no tiene key
+            clave = widget.id.split('-', 2)[-1]
+            if clave != 'None':
+                self.widgets[clave] = datos
+            if widget.label in self.widgets and self.widgets[widget.label][0] != widget.id:
+                self.ambiguas.add(widget.label)
+            self.widgets.setdefault(widget.label, datos)
+
+    def fijar(self, clave, valor):
+        if clave in self.ambiguas:
+            raise ValueError(f"Etiqueta ambigua en el recorrido: {clave!r}; usa la key del widget")
+        if clave not in self.widgets:
+            return False
+        id_widget, tipo, _ = self.widgets[clave]
+        estado = WidgetState(id=id_widget)
+        if tipo in ('radio', 'selectbox'):
+            estado.string_value = str(valor)
+        elif tipo == 'select_slider':
+            estado.string_array_value.data[:] = [str(valor)]
+        else:
+            estado.double_array_value.data[:] = [float(valor)]
+        self.estados[id_widget] = estado
+        return True
+
+
+async def simular_sesion(puerto, recorrido, fin, pausa, latencias):
+    async with Sesion(puerto) as sesion:
+        await sesion.rerun()  # carga inicial de la página
+        while time.perf_counter() < fin:
+            for clave, valor in RECORRIDOS[recorrido]:
+                if time.perf_counter() >= fin:
+                    break
+                # Pausa de "lectura" entre clics (exponencial, como llegadas independientes)
+                await asyncio.sleep(random.expovariate(1 / pausa) if pausa > 0 else 0)
+                if sesion.fijar(clave, valor):
+                    latencias.append(await sesion.rerun())
+        return sesion.errores
+
+
+async def nivel(puerto, pid, sesiones, duracion, pausa):
+    base_rss = estado_proceso(pid)[1]
+    muestras, latencias, parar = [], [], asyncio.Event()
+    muestreo = asyncio.create_task(muestrear(pid, muestras, parar))
+    fin = time.perf_counter() + duracion
+    recorridos = list(RECORRIDOS)
+    errores = await asyncio.gather(*[
+        simular_sesion(puerto, recorridos[i % len(recorridos)], fin, pausa, latencias)
+        for i in range(sesiones)
+    ])
+    parar.set()
+    await muestreo
+
+    pico_rss = max((m['rss'] for m in muestras), default=base_rss)
+    return {
+        'sesiones': sesiones,
+        'interacciones': len(latencias),
+        'por_segundo': len(latencias) / duracion,
+        'p50_ms': float(np.percentile(latencias, 50) * 1000) if latencias else None,
+        'p95_ms': float(np.percentile(latencias, 95) * 1000) if latencias else None,
+        'p99_ms': float(np.percentile(latencias, 99) * 1000) if latencias else None,
+        'cpu_media_pct': float(np.mean([m['cpu_pct'] for m in muestras])) if muestras else None,
+        'cpu_max_pct': float(np.max([m['cpu_pct'] for m in muestras])) if muestras else None,
+        'rss_base_mb': base_rss / 2**20,
+        'rss_pico_mb': pico_rss / 2**20,
+        'rss_por_sesion_mb': (pico_rss - base_rss) / 2**20 / sesiones,
+        'hilos_max': max((m['hilos'] for m in muestras), default=None),
+        'errores': sum(errores),
+    }
+
+
+async def ejecutar(args, pid):
+    # Calentamiento: una sesión recorre todas las páginas para llenar las cachés del proceso
+    await nivel(args.puerto, pid, len(RECORRIDOS), min(10, args.duracion), 0)
+    resultados = []
+    for sesiones in args.sesiones:
+        r = await nivel(args.puerto, pid, sesiones, args.duracion, args.pausa)
+        referencia = resultados[0]['p50_ms'] if resultados else r['p50_ms']
+        r['inflacion_p50'] = r['p50_ms'] / referencia if r['p50_ms'] and referencia else None
+        resultados.append(r)
+        print(f"{sesiones:>4} sesiones: {r['por_segundo']:6.1f} int/s  p50 {r['p50_ms']:7.0f} ms  "
+              f"p95 {r['p95_ms']:7.0f} ms  p99 {r['p99_ms']:7.0f} ms  CPU {r['cpu_media_pct']:5.0f}% "
+              f"(máx {r['cpu_max_pct']:3.0f}%)  RSS {r['rss_pico_mb']:6.0f} MB "
+              f"(+{r['rss_por_sesion_mb']:.1f} MB/sesión)  x{r['inflacion_p50']:.1f} p50")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga multi-sesión del dashboard")
+    parser.add_argument('--sesiones', nargs='+', type=int, default=[1, 2, 4, 8, 16])
+    parser.add_argument('--duracion', type=float, default=30, help="Segundos por nivel de sesiones")
+    parser.add_argument('--pausa', type=float, default=1.0, help="Pausa media entre clics (s)")
+    parser.add_argument('--puerto', type=int, default=8599)
+    parser.add_argument('--salida', help="JSON de resultados (por defecto benchmarks/resultados/)")
+    args = parser.parse_args()
+    if websockets is None:
+        sys.exit("Hace falta el paquete websockets: pip install websockets")
+
+    servidor = arrancar_servidor(args.puerto)
+    try:
+        resultados = asyncio.run(ejecutar(args, servidor.pid))
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+    destino = Path(args.salida or DIR_RESULTADOS / f"carga-{datetime.now():%Y%m%d-%H%M%S}.json")
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    destino.write_text(json.dumps({
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'duracion_s': args.duracion,
+        'pausa_s': args.pausa,
+        'cpus': os.cpu_count(),
+        'resultados': resultados,
+    }, indent=2, ensure_ascii=False))
+    print(f"\nResultados -> {destino}")
+
+
+if __name__ == '__main__':
+    main()
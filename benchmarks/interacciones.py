@@ -0,0 +1,135 @@
+# Latencia de rerun por interacción del dashboard, sin navegador (streamlit.testing AppTest).
+# Recorre todas las páginas y, en cada una, todas las opciones de sus radios, selectboxes y
+# sliders (license_filter, viz_type, room_viz_type, license_viz_type, barrio y nivel del mapa,
+# radio de búsqueda...). Cada interacción se repite para obtener p50/p95 del tiempo de rerun;
+# aparte, una pasada con tracemalloc mide el pico de memoria. También se anota el tamaño
+# serializado de las figuras Plotly, total y por pestaña (las pestañas se renderizan todas en
+# cada rerun, así que no son interacciones propias).
+#
+#   python benchmarks/interacciones.py [--repeticiones 20] [--max-opciones 4] [--paginas inicio ...]
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import RAIZ
+from paginas import PAGINAS
+
+RUTA_APP = RAIZ / 'Código' / 'app.py'
+DIR_RESULTADOS = Path(__file__).resolve().parent / 'resultados'
+TIPOS_WIDGET = ['radio', 'selectbox', 'select_slider', 'slider']
+CLAVE_NAVEGACION = 'pagina'
+
+
+def _widgets(at, tipo):
+    return [w for w in getattr(at, tipo) if w.key != CLAVE_NAVEGACION]
+
+
+def _opciones(widget, tipo, maximo):
+    if tipo == 'slider':
+        # Extremos, valor por defecto y punto medio, con el tipo del valor del widget
+        minimo, maximo_valor, tipo_valor = widget.min, widget.max, type(widget.value)
+        return sorted({tipo_valor(v) for v in (minimo, widget.value, (minimo + maximo_valor) / 2, maximo_valor)})
+    opciones = list(widget.options)
+    if len(opciones) > maximo and tipo != 'select_slider':
+        # Primeras opciones más la última (p. ej. "Toda la ciudad" + unos barrios)
+        opciones = opciones[:maximo - 1] + opciones[-1:]
+    return opciones
+
+
+def tamano_figuras(at):
+    total = sum(len(f.proto.spec) for f in at.get('plotly_chart'))
+    por_pestana = {t.label: sum(len(f.proto.spec) for f in t.get('plotly_chart')) for t in at.tabs}
+    return total, por_pestana
+
+
+def medir_rerun(at, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        at.run()
+        tiempos.append(time.perf_counter() - t)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    tracemalloc.start()
+    at.run()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tiempos, pico
+
+
+def registrar(resultados, pagina, interaccion, tiempos, pico, at):
+    total, por_pestana = tamano_figuras(at)
+    fila = {
+        'pagina': pagina,
+        'interaccion': interaccion,
+        'p50_ms': float(np.percentile(tiempos, 50) * 1000),
+        'p95_ms': float(np.percentile(tiempos, 95) * 1000),
+        'media_ms': statistics.fmean(tiempos) * 1000,
+        'repeticiones': len(tiempos),
+        'pico_memoria_mb': pico / 2**20,
+        'figuras_bytes': total,
+        'figuras_por_pestana': por_pestana,
+    }
+    resultados.append(fila)
+    print(f"  {interaccion:<60} p50 {fila['p50_ms']:8.1f} ms  p95 {fila['p95_ms']:8.1f} ms  "
+          f"pico {fila['pico_memoria_mb']:7.1f} MB  figuras {total / 1024:8.1f} KB")
+
+
+def recorrer_pagina(titulo, repeticiones, max_opciones, resultados):
+    at = AppTest.from_file(str(RUTA_APP), default_timeout=600)
+    at.session_state[CLAVE_NAVEGACION] = titulo
+    t = time.perf_counter()
+    at.run()
+    print(f"\n{titulo} (primer render {time.perf_counter() - t:.2f}s)")
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    tiempos, pico = medir_rerun(at, repeticiones)
+    registrar(resultados, titulo, 'carga de la página', tiempos, pico, at)
+
+    for tipo in TIPOS_WIDGET:
+        for i in range(len(_widgets(at, tipo))):
+            widget = _widgets(at, tipo)[i]
+            nombre = widget.key or widget.label
+            inicial = widget.value
+            for opcion in _opciones(widget, tipo, max_opciones):
+                _widgets(at, tipo)[i].set_value(opcion).run()
+                tiempos, pico = medir_rerun(at, repeticiones)
+                registrar(resultados, titulo, f"{tipo} '{nombre}' = {opcion}", tiempos, pico, at)
+            _widgets(at, tipo)[i].set_value(inicial).run()
+
+
+def main():
+    modulos = {modulo: titulo for titulo, modulo in PAGINAS.items()}
+    parser = argparse.ArgumentParser(description="Latencia de rerun por interacción (AppTest)")
+    parser.add_argument('--paginas', nargs='+', choices=list(modulos), default=list(modulos))
+    parser.add_argument('--repeticiones', type=int, default=20)
+    parser.add_argument('--max-opciones', type=int, default=4, help="Opciones por selectbox")
+    parser.add_argument('--salida', help="JSON de resultados (por defecto benchmarks/resultados/)")
+    args = parser.parse_args()
+
+    resultados = []
+    for modulo in args.paginas:
+        recorrer_pagina(modulos[modulo], args.repeticiones, args.max_opciones, resultados)
+
+    destino = Path(args.salida or DIR_RESULTADOS / f"interacciones-{datetime.now():%Y%m%d-%H%M%S}.json")
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    destino.write_text(json.dumps({
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'resultados': resultados,
+    }, indent=2, ensure_ascii=False))
+    print(f"\nResultados -> {destino}")
+
+
+if __name__ == '__main__':
+    main()
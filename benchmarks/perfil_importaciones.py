@@ -0,0 +1,86 @@
+# Perfil del arranque en frío del dashboard: en un proceso nuevo (python -X importtime) se
+# ejecuta app.py con AppTest sobre una página y se desglosa el tiempo de importación por
+# paquete. Sale con código 1 si el arranque hasta el primer render supera el presupuesto,
+# para usarlo como comprobación de regresiones.
+#
+#   python benchmarks/perfil_importaciones.py [--pagina recomendaciones] [--top 15]
+#   python benchmarks/perfil_importaciones.py --todas
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import RAIZ
+from paginas import PAGINAS, cargar_pagina
+
+RUTA_APP = RAIZ / 'Código' / 'app.py'
+
+# Segundos hasta el primer render en frío (intérprete + importaciones + página)
+PRESUPUESTO_TEXTO = 1.5
+PRESUPUESTO_DATOS = 5.0  # incluye leer la caché columnar y construir cubo/mapa/índice
+
+CODIGO = """
+import time
+t = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=600)
+at.session_state['pagina'] = {titulo!r}
+at.run()
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print(f"{{time.perf_counter() - t:.6f}}")
+"""
+
+LINEA = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def perfilar(titulo):
+    proceso = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CODIGO.format(app=str(RUTA_APP), titulo=titulo)],
+        capture_output=True, text=True, cwd=RAIZ,
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(proceso.stderr[-2000:] or proceso.stdout)
+    # Tiempo propio de cada módulo agrupado por paquete raíz (sin contar sus submódulos dos veces)
+    por_paquete = defaultdict(float)
+    for propio, _, _, modulo in LINEA.findall(proceso.stderr):
+        por_paquete[modulo.split('.')[0]] += int(propio) / 1e6
+    return float(proceso.stdout.strip().splitlines()[-1]), dict(por_paquete)
+
+
+def main():
+    modulos = {modulo: titulo for titulo, modulo in PAGINAS.items()}
+    parser = argparse.ArgumentParser(description="Perfil de arranque en frío del dashboard")
+    parser.add_argument('--pagina', choices=list(modulos), default='recomendaciones')
+    parser.add_argument('--todas', action='store_true', help="Perfila todas las páginas")
+    parser.add_argument('--top', type=int, default=15, help="Paquetes a mostrar")
+    parser.add_argument('--presupuesto', type=float, help="Segundos (por defecto según la página)")
+    args = parser.parse_args()
+
+    fallos = []
+    for modulo in (list(modulos) if args.todas else [args.pagina]):
+        titulo = modulos[modulo]
+        arranque, por_paquete = perfilar(titulo)
+        importaciones = sum(por_paquete.values())
+        # Las páginas con datos declaran NECESITA; las de texto no
+        con_datos = bool(cargar_pagina(titulo).NECESITA)
+        presupuesto = args.presupuesto or (PRESUPUESTO_DATOS if con_datos else PRESUPUESTO_TEXTO)
+
+        print(f"\n{titulo}: primer render en {arranque:.2f}s (importaciones {importaciones:.2f}s, "
+              f"presupuesto {presupuesto:.1f}s)")
+        for paquete, segundos in sorted(por_paquete.items(), key=lambda x: -x[1])[:args.top]:
+            print(f"  {paquete:<28} {segundos * 1000:8.1f} ms")
+        if arranque > presupuesto:
+            fallos.append(f"{modulo}: {arranque:.2f}s > {presupuesto:.1f}s")
+
+    if fallos:
+        print("\nArranque por encima del presupuesto:\n  " + "\n  ".join(fallos))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
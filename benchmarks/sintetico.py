@@ -0,0 +1,119 @@
+# Generador de listings.csv sintéticos a escala (100k, 1M, 10M filas...) a partir del real.
+# Se remuestrean filas completas del original, de modo que se conservan las distribuciones
+# conjuntas de barrio, tipo de habitación, precio, reviews_per_month, licencias, etc.
+# La concentración de anfitriones se reproduce aparte: se crean anfitriones nuevos con el
+# mismo reparto de tamaños (anuncios por anfitrión) y nombres que en los datos reales, en vez
+# de multiplicar los anfitriones existentes. Las coordenadas reciben un pequeño ruido.
+#
+#   python benchmarks/sintetico.py 100k 1M 10M [--semilla 0] [--comprobar]
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import DIR_DATOS, RUTA_LISTINGS
+
+DIR_SINTETICO = DIR_DATOS / 'sintetico'
+TAMANO_TROZO = 1_000_000
+RUIDO_GRADOS = 0.0005  # ~50 m
+
+
+def leer_tamano(texto):
+    # '100k' -> 100_000, '1M' -> 1_000_000
+    texto = str(texto).strip().lower()
+    factor = {'k': 1_000, 'm': 1_000_000}.get(texto[-1], 1)
+    return int(float(texto.rstrip('km')) * factor)
+
+
+def ruta_sintetico(filas):
+    return DIR_SINTETICO / f"listings_{filas}.csv"
+
+
+def _anfitriones(original, filas, rng, primer_id):
+    # Anfitriones del original (tamaño y nombre), remuestreados hasta cubrir `filas` anuncios
+    hosts = original.groupby('host_id').agg(tamano=('id', 'size'), nombre=('host_name', 'first'))
+    media = hosts['tamano'].mean()
+    elegidos = hosts.iloc[rng.integers(0, len(hosts), int(filas / media * 1.2) + 10)]
+    while elegidos['tamano'].sum() < filas:
+        elegidos = pd.concat([elegidos, hosts.iloc[rng.integers(0, len(hosts), len(hosts))]])
+    tamanos = elegidos['tamano'].to_numpy()
+    fin = np.searchsorted(np.cumsum(tamanos), filas) + 1
+    tamanos, nombres = tamanos[:fin], elegidos['nombre'].to_numpy()[:fin]
+
+    # Un id nuevo por anfitrión, repetido tantas veces como anuncios tiene (el último se recorta)
+    ids = np.repeat(np.arange(primer_id, primer_id + fin), tamanos)[:filas]
+    posicion = np.repeat(np.arange(fin), tamanos)[:filas]
+    orden = rng.permutation(filas)
+    return ids[orden], nombres[posicion][orden], tamanos[posicion][orden]
+
+
+def generar_trozo(original, filas, rng, primer_id):
+    trozo = original.iloc[rng.integers(0, len(original), filas)].reset_index(drop=True)
+    trozo['id'] = np.arange(primer_id, primer_id + filas)
+    host_id, host_name, tamano = _anfitriones(original, filas, rng, primer_id)
+    trozo['host_id'] = host_id
+    trozo['host_name'] = host_name
+    trozo['calculated_host_listings_count'] = tamano
+    for col in ['latitude', 'longitude']:
+        trozo[col] = trozo[col] + rng.normal(0, RUIDO_GRADOS, filas)
+    return trozo
+
+
+def generar(filas, destino=None, semilla=0, origen=RUTA_LISTINGS):
+    # Escribe el CSV por trozos para no tener 10M filas en memoria
+    destino = Path(destino or ruta_sintetico(filas))
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    original = pd.read_csv(origen)
+    rng = np.random.default_rng(semilla)
+    temporal = destino.with_suffix('.tmp')
+    for inicio in range(0, filas, TAMANO_TROZO):
+        n = min(TAMANO_TROZO, filas - inicio)
+        generar_trozo(original, n, rng, inicio + 1).to_csv(
+            temporal, mode='w' if inicio == 0 else 'a', header=inicio == 0, index=False
+        )
+    temporal.replace(destino)
+    return destino
+
+
+def comparar_distribuciones(original, sintetico):
+    # Diferencia máxima (puntos porcentuales) en los repartos y cociente de cuantiles
+    # sintético / original en las distribuciones que deben conservarse
+    def diferencia_reparto(col):
+        real, nuevo = original[col].value_counts(normalize=True), sintetico[col].value_counts(normalize=True)
+        return round(float(real.sub(nuevo, fill_value=0).abs().max() * 100), 3)
+
+    def cociente_cuantiles(col):
+        q = [0.1, 0.25, 0.5, 0.75, 0.9]
+        return (sintetico[col].quantile(q) / original[col].quantile(q)).round(3).tolist()
+
+    return {
+        'neighbourhood_pp': diferencia_reparto('neighbourhood'),
+        'room_type_pp': diferencia_reparto('room_type'),
+        'price_cuantiles': cociente_cuantiles('price'),
+        'reviews_per_month_cuantiles': cociente_cuantiles('reviews_per_month'),
+        'anuncios_por_anfitrion': [round(float(df.groupby('host_id').size().mean()), 2)
+                                   for df in (original, sintetico)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera listings.csv sintéticos a escala")
+    parser.add_argument('tamanos', nargs='+', help="Filas de cada fichero (100k, 1M, 10M...)")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--comprobar', action='store_true', help="Compara las distribuciones con el original")
+    args = parser.parse_args()
+
+    for tamano in args.tamanos:
+        filas = leer_tamano(tamano)
+        destino = generar(filas, semilla=args.semilla)
+        print(f"{filas:,} filas -> {destino}")
+        if args.comprobar and filas <= TAMANO_TROZO:
+            print(comparar_distribuciones(pd.read_csv(RUTA_LISTINGS), pd.read_csv(destino)))
+
+
+if __name__ == '__main__':
+    main()
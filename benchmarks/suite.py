@@ -0,0 +1,222 @@
+# Suite de benchmarks de los caminos de datos del dashboard, a varias escalas:
+#   carga      lectura de listings.csv, CSV limpio tipado, compactación y caché Arrow
+#   etapas     cada etapa del pipeline de limpieza (preprocesamiento.py)
+#   secciones  agregaciones originales de las secciones de app.py en pandas (value_counts,
+#              crosstab, groupbys por barrio, filtro IQR) como referencia de escalado
+#   cubo       construcción y consultas del cubo de agregados, rejillas del mapa e índice espacial
+#   sql        las mismas consultas con el backend SQL embebido (DuckDB si está instalado, SQLite):
+#              preparación de la copia en disco desde el CSV y consultas
+# Los tamaños sintéticos se generan con sintetico.py si no existen. Los resultados se guardan
+# en JSON (benchmarks/resultados/) y pueden compararse con una ejecución anterior.
+#
+#   python benchmarks/suite.py [--tamanos real 100k 1M 10M] [--grupos carga etapas ...]
+#                              [--repeticiones 3] [--comparar benchmarks/resultados/suite-....json]
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from config import RUTA_LISTINGS
+from cache_datos import leer_csv_tipado, escribir_arrow, leer_arrow, ESQUEMA_LIMPIO, pa
+from preprocesamiento import ETAPAS, cargar_listings
+from compactacion import compactar
+from agregados import construir_cubo
+from mapa import construir_niveles
+from espacial import IndiceEspacial
+from consultas_sql import CUBOS, PREPARAR, dimensiones_origen, motores_disponibles
+from sintetico import DIR_SINTETICO, generar, leer_tamano, ruta_sintetico
+
+DIR_RESULTADOS = Path(__file__).resolve().parent / 'resultados'
+GRUPOS = ['carga', 'etapas', 'secciones', 'cubo', 'sql']
+UMBRAL_REGRESION = 1.2  # x veces más lento que la referencia
+
+
+def medir(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - t)
+    return tiempos, resultado
+
+
+# AGREGACIONES DE LAS SECCIONES (versión pandas original de app.py)
+
+def filtro_iqr(df):
+    avg_performance = df.groupby('neighbourhood', observed=True)['rendimiento_economico_mensual'].mean()
+    q1, q3 = avg_performance.quantile(0.25), avg_performance.quantile(0.75)
+    iqr = q3 - q1
+    return avg_performance[avg_performance.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)].sort_values(ascending=False)
+
+
+SECCIONES = {
+    'value_counts_tipo_anfitrion': lambda df: df['tipo_anfitrion'].value_counts(),
+    'crosstab_room_type_anfitrion': lambda df: pd.crosstab(df['room_type'], df['tipo_anfitrion']),
+    'porcentaje_por_barrio': lambda df: (df['neighbourhood'].value_counts() / len(df) * 100).sort_values(ascending=False),
+    'sin_licencia_por_barrio': lambda df: (
+        df[df['license'] == 'sin datos'].groupby('neighbourhood', observed=True).size()
+        / df.groupby('neighbourhood', observed=True).size()
+    ),
+    'rendimiento_por_barrio': lambda df: (
+        df.groupby('neighbourhood', observed=True)['rendimiento_economico_mensual'].mean()
+    ),
+    'filtro_iqr': filtro_iqr,
+}
+
+
+def consultas_cubo(cubo):
+    # Las mismas consultas que hacen hoy las secciones sobre el cubo
+    return (
+        cubo.total(), cubo.total(sin_licencia=True),
+        cubo.conteo('tipo_anfitrion'),
+        cubo.cruce('room_type', 'tipo_anfitrion'),
+        cubo.conteo('neighbourhood'), cubo.conteo('neighbourhood', sin_licencia=True),
+        cubo.media('rendimiento_economico_mensual', por='neighbourhood'),
+        cubo.cuantil('price', 0.5),
+    )
+
+
+class Suite:
+    def __init__(self, repeticiones):
+        self.repeticiones = repeticiones
+        self.resultados = []
+
+    def caso(self, tamano, grupo, nombre, filas, funcion, repeticiones=None):
+        tiempos, resultado = medir(funcion, repeticiones or self.repeticiones)
+        self.resultados.append({
+            'tamano': tamano, 'grupo': grupo, 'caso': nombre, 'filas': filas,
+            'min_s': min(tiempos), 'mediana_s': statistics.median(tiempos), 'repeticiones': len(tiempos),
+        })
+        print(f"  {grupo + '/' + nombre:<42} {min(tiempos) * 1000:10.1f} ms")
+        return resultado
+
+    def ejecutar(self, tamano, entrada, grupos):
+        filas = len(pd.read_csv(entrada, usecols=['id']))
+        print(f"\n[{tamano}] {filas:,} filas ({entrada})")
+
+        # etapas: cada etapa con la salida de la anterior; sin este grupo el CSV limpio se
+        # genera igualmente (sin medir) porque lo necesitan los demás
+        df = cargar_listings(entrada)
+        for nombre, funcion in ETAPAS:
+            if 'etapas' in grupos:
+                df = self.caso(tamano, 'etapas', nombre, filas, lambda: funcion(df))
+            else:
+                df = funcion(df)
+
+        with tempfile.TemporaryDirectory(dir=DIR_SINTETICO) as temporal:
+            limpio = Path(temporal) / 'limpio.csv'
+            df.to_csv(limpio, index=False)
+            if 'carga' in grupos:
+                self.caso(tamano, 'carga', 'listings_csv', filas, lambda: cargar_listings(entrada))
+                df = self.caso(tamano, 'carga', 'limpio_csv_tipado', filas,
+                               lambda: leer_csv_tipado(limpio, ESQUEMA_LIMPIO))
+                self.caso(tamano, 'carga', 'compactar', filas, lambda: compactar(df))
+                if pa is not None:
+                    arrow = Path(temporal) / 'limpio.arrow'
+                    self.caso(tamano, 'carga', 'arrow_escritura', filas, lambda: escribir_arrow(df, arrow))
+                    self.caso(tamano, 'carga', 'arrow_lectura', filas, lambda: leer_arrow(arrow))
+            else:
+                df = leer_csv_tipado(limpio, ESQUEMA_LIMPIO)
+            if 'sql' in grupos:
+                self.casos_sql(tamano, limpio, filas)
+
+        if 'secciones' in grupos:
+            for nombre, funcion in SECCIONES.items():
+                self.caso(tamano, 'secciones', nombre, filas, lambda: funcion(df))
+
+        if 'cubo' in grupos:
+            cubo = self.caso(tamano, 'cubo', 'construir', filas, lambda: construir_cubo(df))
+            self.caso(tamano, 'cubo', 'consultas', filas, lambda: consultas_cubo(cubo))
+            self.caso(tamano, 'cubo', 'niveles_mapa', filas, lambda: construir_niveles(df))
+            self.caso(tamano, 'cubo', 'indice_espacial', filas,
+                      lambda: IndiceEspacial(df['latitude'], df['longitude']))
+
+    def casos_sql(self, tamano, limpio, filas):
+        # Copia en disco junto al CSV limpio temporal; se prepara una sola vez
+        for motor in motores_disponibles():
+            copia = limpio.with_suffix(f'.{motor}')
+            self.caso(tamano, 'sql', f'{motor}_preparar', filas,
+                      lambda: PREPARAR[motor](limpio, copia), repeticiones=1)
+            cubo = CUBOS[motor](copia, dimensiones_origen(limpio))
+            self.caso(tamano, 'sql', f'{motor}_consultas', filas, lambda: consultas_cubo(cubo))
+
+    def guardar(self, destino=None):
+        destino = Path(destino or DIR_RESULTADOS / f"suite-{datetime.now():%Y%m%d-%H%M%S}.json")
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        destino.write_text(json.dumps({
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'entorno': entorno(),
+            'resultados': self.resultados,
+        }, indent=2, ensure_ascii=False))
+        return destino
+
+
+def entorno():
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'pyarrow': pa.__version__ if pa is not None else None,
+        'sistema': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def comparar(actuales, ruta_referencia, umbral=UMBRAL_REGRESION):
+    # Cociente actual / referencia (min_s) de los casos comunes; devuelve las regresiones
+    anteriores = json.loads(Path(ruta_referencia).read_text())['resultados']
+    referencia = {(r['tamano'], r['grupo'], r['caso']): r for r in anteriores}
+    regresiones = []
+    print(f"\nComparación con {ruta_referencia}:")
+    for r in actuales:
+        base = referencia.get((r['tamano'], r['grupo'], r['caso']))
+        if base is None:
+            continue
+        cociente = r['min_s'] / base['min_s']
+        marca = '  <-- regresión' if cociente > umbral else ''
+        print(f"  [{r['tamano']}] {r['grupo'] + '/' + r['caso']:<42} x{cociente:5.2f}{marca}")
+        if cociente > umbral:
+            regresiones.append(r)
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de carga, limpieza y agregación")
+    parser.add_argument('--tamanos', nargs='+', default=['real', '100k', '1M'],
+                        help="'real' (listings.csv) y/o filas sintéticas: 100k, 1M, 10M...")
+    parser.add_argument('--grupos', nargs='+', choices=GRUPOS, default=GRUPOS)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--salida', help="JSON de resultados (por defecto benchmarks/resultados/)")
+    parser.add_argument('--comparar', help="JSON de una ejecución anterior")
+    args = parser.parse_args()
+
+    DIR_SINTETICO.mkdir(parents=True, exist_ok=True)
+    suite = Suite(args.repeticiones)
+    for tamano in args.tamanos:
+        if tamano == 'real':
+            entrada = RUTA_LISTINGS
+        else:
+            entrada = ruta_sintetico(leer_tamano(tamano))
+            if not entrada.exists():
+                print(f"Generando {entrada}...")
+                generar(leer_tamano(tamano), entrada)
+        suite.ejecutar(tamano, entrada, args.grupos)
+
+    print(f"\nResultados -> {suite.guardar(args.salida)}")
+    if args.comparar and comparar(suite.resultados, args.comparar):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'Código'))
+
+from licencias import extraer_numeros, indice_registro, clasificar_licencias
+
+
+def test_sin_numeros_hutb():
+    # Un trozo sin ningún número HUTB (solo exentas, vacías u otros formatos) no debe fallar
+    licencias = pd.Series(['Exempt', 'x', None])
+    assert extraer_numeros(licencias).empty
+    assert len(indice_registro([])) == 0
+    estados = clasificar_licencias(licencias, pd.Index([]))
+    assert estados.tolist() == ['exenta', 'numero_desconocido', 'sin_licencia']
+
+
+def test_normalizacion_numeros():
+    numeros = extraer_numeros(pd.Series(['hutb 2062', 'HUTB-0002062 / HUTB_1234567']))
+    assert numeros.tolist() == ['HUTB-002062', 'HUTB-002062', 'HUTB-1234567']